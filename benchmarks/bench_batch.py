@@ -0,0 +1,58 @@
+"""
+Batch evaluation throughput versus evaluating expressions one at a time.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_batch.py
+
+Each row is a batch of expressions of one shape with different leaf values,
+as a request handler would build them, evaluated one `evaluate` at a time
+and with a single `evaluate_many`.
+"""
+
+import time
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.batch import Batch, evaluate_many
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine, arrow, fanout, second, compose
+
+
+inc = lambda v: v + 1
+pair = lambda a: lambda b: (a, b)
+
+SHAPES = {
+    "pipeline": lambda i: ((Just(i) |fmap| inc) |bind| (lambda v: Just(v * 2))) |fmap| inc,
+    "ap":       lambda i: (Sequence |pure| pair) |ap| Sequence((i,)) |ap| Sequence((1, 2)),
+    "combine":  lambda i: (Sequence((i,)) |combine| Sequence((1,))) |fmap| inc,
+    "circuit":  lambda i: (Morphism |second| (Morphism |arrow| inc)) |compose| ((Morphism |arrow| (lambda v: v + i)) |fanout| (Morphism, Morphism |arrow| inc)),
+}
+
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(size=20000, repeat=5):
+    print(f"{'shape':<10} {'evaluate':>12} {'evaluate_many':>14}   (expr/s)")
+    for name, shape in SHAPES.items():
+        exprs = [shape(i) for i in range(size)]
+        single = size / best(lambda: [evaluate(e) for e in exprs], repeat)
+        batched = size / best(lambda: evaluate_many(exprs), repeat)
+        print(f"{name:<10} {single:>12,.0f} {batched:>14,.0f}")
+
+    report = Batch()
+    evaluate_many([shape(i) for shape in SHAPES.values() for i in range(size)], report)
+    print(f"\nmixed batch: {report.expressions} expressions, {report.shapes} shapes, "
+          f"{report.throughput:,.0f} expr/s")
+
+
+if __name__ == "__main__":
+    main()
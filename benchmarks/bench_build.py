@@ -0,0 +1,73 @@
+"""
+Expression construction cost per node.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_build.py
+
+"closure" reproduces the former builders: every operand wrapped in
+`Thunk(lambda: value)` and every `left |op` allocating a new `Infix` around
+a lambda. "infix" is `|op|` syntax today, with `Strict` operands and a
+slotted `Section`; "direct" calls the builders in `typeclasses.build`.
+"""
+
+import timeit
+
+from typeclass.data.thunk import Thunk
+from typeclass.data.maybe import Just
+from typeclass.typeclasses import build
+from typeclass.typeclasses.functor import Map
+from typeclass.typeclasses.monad import Bind
+from typeclass.typeclasses.symbols import fmap, bind
+
+
+class ClosureInfix:
+    def __init__(self, func):
+        self.func = func
+
+    def __ror__(self, left):
+        return ClosureInfix(lambda right: self.func(left, right))
+
+    def __or__(self, right):
+        return self.func(right)
+
+
+closure_fmap = ClosureInfix(lambda functor, f: Map(Thunk(lambda: f), Thunk(lambda: functor)))
+closure_bind = ClosureInfix(lambda ma, f: Bind(Thunk(lambda: ma), Thunk(lambda: f)))
+
+inc = lambda v: v + 1
+check = lambda v: Just(v)
+NODES = 100
+
+
+def closure():
+    expr = Just(0)
+    for _ in range(NODES // 2):
+        expr = (expr |closure_fmap| inc) |closure_bind| check
+    return expr
+
+
+def infix():
+    expr = Just(0)
+    for _ in range(NODES // 2):
+        expr = (expr |fmap| inc) |bind| check
+    return expr
+
+
+def direct():
+    expr = Just(0)
+    for _ in range(NODES // 2):
+        expr = build.bind(build.fmap(expr, inc), check)
+    return expr
+
+
+def main():
+    number = 2000
+    print(f"{'builder':<10} {'ns/node':>9}")
+    for name, fn in (("closure", closure), ("infix", infix), ("direct", direct)):
+        seconds = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:<10} {seconds / number / NODES * 1e9:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Result cache: repeated closed expressions with and without a `Cache`.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_cache.py
+
+Each request is one of a few distinct pipelines over registered functions,
+as a service answering repeated queries would build them. The cached column
+includes keying every expression by structure.
+"""
+
+import time
+
+from typeclass.data.maybe import Just
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.cache import Cache
+from typeclass.interpret.serialize import named
+from typeclass.typeclasses.symbols import fmap, bind
+
+
+@named("bench.cache.work")
+def work(v):
+    return sum(range(v % 7 * 1000))
+
+
+@named("bench.cache.check")
+def check(v):
+    return Just(v)
+
+
+def request(i, depth):
+    expr = Just(i % 16)
+    for _ in range(depth):
+        expr = (expr |fmap| work) |bind| check
+    return expr
+
+
+def best(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'depth':>6} {'evaluate ms':>12} {'cached ms':>10} {'hit rate':>9}")
+    for depth in (1, 4, 16):
+        requests = [request(i, depth) for i in range(1000)]
+        cache = Cache()
+        plain = best(lambda: [evaluate(e) for e in requests])
+        cached = best(lambda: [cache.evaluate(e) for e in requests])
+        print(f"{depth:>6} {plain * 1e3:>12.2f} {cached * 1e3:>10.2f} {cache.stats.hit_rate:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
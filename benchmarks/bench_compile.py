@@ -0,0 +1,54 @@
+"""
+Compiled plans versus interpreting the same expression shape.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_compile.py
+
+Each row evaluates one expression shape with a fresh leaf value per call,
+either by building and interpreting the syntax tree, by interpreting a tree
+built ahead of time, or by calling a plan compiled once from the shape.
+"""
+
+import timeit
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.compile import compile, param
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine
+
+
+inc = lambda v: v + 1
+double = lambda v: Just(v * 2)
+pair = lambda a: lambda b: (a, b)
+
+
+def shapes():
+    return {
+        "fmap":     (lambda x: x |fmap| inc, Just(1)),
+        "pipeline": (lambda x: ((x |fmap| inc) |bind| double) |fmap| inc, Just(1)),
+        "ap":       (lambda x: (Sequence |pure| pair) |ap| x |ap| Sequence((1, 2)), Sequence((1, 2))),
+        "combine":  (lambda x: (x |combine| Sequence((1,))) |combine| Sequence((2,)), Sequence((0,))),
+    }
+
+
+def measure(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=20000):
+    print(f"{'shape':<10} {'build+eval':>11} {'eval':>8} {'plan':>8}   (us/call)")
+    for name, (shape, value) in shapes().items():
+        built = shape(value)
+        plan = compile(shape(param("x")))
+        assert plan(x=value) == evaluate(built)
+
+        both = measure(lambda: evaluate(shape(value)), number)
+        only = measure(lambda: evaluate(built), number)
+        compiled = measure(lambda: plan(x=value), number)
+        print(f"{name:<10} {both:>11.2f} {only:>8.2f} {compiled:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Per-node dispatch cost: structural `match` versus the `HANDLERS` table.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_dispatch.py
+
+`classify` reproduces the case order of the interpreter's former `match`
+statement, including positional captures, and only selects a branch. The
+table lookup is what `normalize` does today. Neither side calls a handler,
+so the numbers isolate the cost of finding the right one.
+"""
+
+import timeit
+
+from typeclass.data.thunk import delay
+from typeclass.interpret.run import HANDLERS
+
+from typeclass.typeclasses.functor import Map
+from typeclass.typeclasses.applicative import Ap, Pure
+from typeclass.typeclasses.alternative import Otherwise, Empty, Some, Many
+from typeclass.typeclasses.monad import Bind, Return
+from typeclass.typeclasses.comonad import Extract, Duplicate
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.category import ID
+from typeclass.typeclasses.groupoid import Invert
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.monoid import MEmpty
+from typeclass.typeclasses.group import Inverse
+from typeclass.typeclasses.arrow import Arr, First, Second, Split, Fanout
+from typeclass.typeclasses.arrowchoice import Left, Right, PlusPlus, OrOr
+from typeclass.typeclasses.arrowapply import Apply
+
+
+def classify(free):
+    match free:
+        case Map(function, value): return Map
+        case Pure(cls, value): return Pure
+        case Ap(function, value): return Ap
+        case Empty(cls): return Empty
+        case Otherwise(alter, native): return Otherwise
+        case Many(cls, value): return Many
+        case Some(cls, value): return Some
+        case Return(cls, value): return Return
+        case Bind(ma, f): return Bind
+        case Extract(wa): return Extract
+        case Duplicate(wa): return Duplicate
+        case Compose(fbc, fab): return Compose
+        case ID(cls): return ID
+        case Invert(fab): return Invert
+        case Combine(a, b): return Combine
+        case MEmpty(cls): return MEmpty
+        case Inverse(fab): return Inverse
+        case Arr(cls, fab): return Arr
+        case First(cls, aab): return First
+        case Second(cls, aab): return Second
+        case Split(cls, aab, acd): return Split
+        case Fanout(cls, aab, aac): return Fanout
+        case Left(cls, aab): return Left
+        case Right(cls, aab): return Right
+        case PlusPlus(cls, aab, acd): return PlusPlus
+        case OrOr(cls, aab, acb): return OrOr
+        case Apply(cls): return Apply
+        case _: return None
+
+
+def samples():
+    x = delay(None)
+    return [
+        Map(x, x), Pure(object, x), Ap(x, x),
+        Empty(object), Otherwise(x, x), Many(object, x), Some(object, x),
+        Return(object, x), Bind(x, x),
+        Extract(x), Duplicate(x),
+        Compose(x, x), ID(object), Invert(x),
+        Combine(x, x), MEmpty(object), Inverse(x),
+        Arr(object, x), First(object, x), Second(object, x),
+        Split(object, x, x), Fanout(object, x, x),
+        Left(object, x), Right(object, x), PlusPlus(object, x, x), OrOr(object, x, x),
+        Apply(object),
+        42,
+    ]
+
+
+def main(number=200_000):
+    get = HANDLERS.get
+    print(f"{'node':<10} {'match ns':>10} {'table ns':>10} {'speedup':>8}")
+    for node in samples():
+        matched = min(timeit.repeat(lambda: classify(node), number=number, repeat=5))
+        table = min(timeit.repeat(lambda: get(type(node)), number=number, repeat=5))
+        name = type(node).__name__
+        print(f"{name:<10} {matched / number * 1e9:>10.1f} {table / number * 1e9:>10.1f} {matched / table:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
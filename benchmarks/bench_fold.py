@@ -0,0 +1,65 @@
+"""
+Repeated evaluation of pipeline templates before and after `fold`.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_fold.py
+
+Each template mixes closed parts, which `fold` realizes once, with an open
+`Map` over user code, and is evaluated many times as a long-lived template
+would be.
+"""
+
+import timeit
+
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.optimize import Report
+from typeclass.interpret.fold import fold
+from typeclass.typeclasses.monoid import mempty
+from typeclass.typeclasses.category import identity
+from typeclass.typeclasses.symbols import fmap, pure, combine, compose, arrow, fanout, second
+
+
+inc = lambda v: v + 1
+
+
+def header(n):
+    expr = mempty(Sequence)
+    for i in range(n):
+        expr = expr |combine| (Sequence |pure| i)
+    return expr |fmap| inc
+
+
+def circuit(n):
+    f = Morphism |arrow| inc
+    expr = identity(Morphism)
+    for _ in range(n):
+        expr = expr |compose| (Morphism |second| (f |fanout| (Morphism, f)))
+    return expr
+
+
+TEMPLATES = {
+    "combine x16": header(16),
+    "combine x64": header(64),
+    "circuit x8": circuit(8),
+}
+
+
+def main():
+    number = 500
+    print(f"{'template':<14} {'before us':>10} {'after us':>9} {'folded':>7}")
+    for name, expr in TEMPLATES.items():
+        report = Report()
+        folded = fold(expr, report)
+        before = min(timeit.repeat(lambda: evaluate(expr), number=number, repeat=5))
+        after = min(timeit.repeat(lambda: evaluate(folded), number=number, repeat=5))
+        print(
+            f"{name:<14} {before / number * 1e6:>10.1f} {after / number * 1e6:>9.1f} "
+            f"{report.rewrites['constant fold']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Arrow circuits: nested runtime closures versus a scheduled dataflow graph.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_graph.py
+
+"closures" evaluates the arrow expression to a runtime `Morphism`, whose
+call recurses through one closure per node. "graph" lowers it with
+`interpret.graph.circuit` and runs the flat schedule; "graph x4" adds a
+thread pool for the independent branches of every `Fanout`, whose stages
+sleep to stand in for I/O or native signal-processing kernels.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.graph import circuit
+from typeclass.typeclasses.symbols import compose, arrow, fanout
+
+
+def gain(v):
+    return v * 0.5 + 1
+
+
+def kernel(v):
+    time.sleep(0.001)
+    return v
+
+
+def chain(n):
+    expr = Morphism |arrow| gain
+    for _ in range(n - 1):
+        expr = expr |compose| (Morphism |arrow| gain)
+    return expr
+
+
+def bank(width):
+    merge = Morphism |arrow| (lambda pair: pair[0] + pair[1])
+    expr = Morphism |arrow| kernel
+    for _ in range(width - 1):
+        expr = merge |compose| (expr |fanout| (Morphism, Morphism |arrow| kernel))
+    return expr
+
+
+def best(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'circuit':<14} {'closures ms':>12} {'graph ms':>9} {'graph x4 ms':>12}")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for name, expr, calls in (
+            ("chain 100", chain(100), 1000),
+            ("chain 10000", chain(10_000), 10),
+            ("bank 8", bank(8), 5),
+        ):
+            graph, pooled = circuit(expr), circuit(expr, executor)
+            try:
+                closures = evaluate(expr)
+                nested = f"{best(lambda: [closures(1.0) for _ in range(calls)]) * 1e3:>12.2f}"
+            except RecursionError:
+                nested = f"{'overflow':>12}"
+            flat = best(lambda: [graph(1.0) for _ in range(calls)])
+            parallel = best(lambda: [pooled(1.0) for _ in range(calls)])
+            print(f"{name:<14} {nested} {flat * 1e3:>9.2f} {parallel * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Import time of the package's entry points, measured with `-X importtime`.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --check
+
+Each module is imported in a fresh interpreter several times and the best
+cumulative time reported by `-X importtime` is kept, along with the number
+of `typeclass` modules the import loaded. With `--check` the script exits
+non-zero when a module loads more `typeclass` modules than its budget, or
+takes more than its time budget, so it can guard against regressions in CI.
+Module counts are exact; time budgets are loose, for noisy machines.
+"""
+
+import re
+import subprocess
+import sys
+
+# module: (statement, most typeclass modules, most milliseconds)
+BUDGETS = {
+    "typeclass": ("import typeclass", 1, 10),
+    "symbols": ("import typeclass.typeclasses.symbols", 5, 20),
+    "fmap": ("from typeclass.typeclasses.symbols import fmap", 12, 60),
+    "data.maybe": ("import typeclass.data.maybe", 40, 120),
+    "data.stream": ("import typeclass.data.stream", 45, 120),
+    "interpret.run": ("import typeclass.interpret.run", 80, 200),
+}
+
+LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(statement, repeat=5):
+    best, count = None, None
+    code = f"{statement}\nimport sys\nprint(sum(m.startswith('typeclass') for m in sys.modules))"
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        total = sum(
+            int(match[1])
+            for match in map(LINE.match, result.stderr.splitlines())
+            if match and not match[2] and match[3].startswith("typeclass")
+        )
+        best = total if best is None else min(best, total)
+        count = int(result.stdout.split()[-1])
+    return best / 1e3, count
+
+
+def main(check=False):
+    failures = []
+    print(f"{'import':<14} {'ms':>8} {'modules':>8}")
+    for name, (statement, modules, budget) in BUDGETS.items():
+        ms, count = measure(statement)
+        print(f"{name:<14} {ms:>8.1f} {count:>8}")
+        if count > modules:
+            failures.append(f"{name} loads {count} typeclass modules, budget {modules}")
+        if ms > budget:
+            failures.append(f"{name} takes {ms:.1f} ms, budget {budget} ms")
+
+    if check and failures:
+        print("\n".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(check="--check" in sys.argv)
@@ -0,0 +1,104 @@
+"""
+Recurrent pipelines with `loop`: running average and a first-order IIR
+filter over a Stream.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_loop.py
+
+"python" is a hand-written generator, the baseline for the recurrence
+itself. "loop" ties the feedback knot through `Morphism.loop`, evaluated
+by the interpreter; "graph" runs the same expression as a scheduled
+`interpret.graph.circuit`. Both feed back a lazy Stream, so each sample
+costs one step of the recurrence.
+"""
+
+import time
+from itertools import islice
+from operator import add
+
+from typeclass.data.thunk import delay
+from typeclass.data.morphism import Morphism
+from typeclass.data.sequence import Sequence
+from typeclass.data.stream import Stream, iterate, take
+from typeclass.data.stream.lib import _zipwith
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.graph import circuit
+from typeclass.typeclasses.symbols import arrow, loop, compose
+
+N = 20_000
+ALPHA = 0.9
+
+
+def fed_back(step):
+    """
+    Loop body `(xs, ys) -> (out, out)` with out = step(xs, 0 : ys).
+    """
+    def body(pair):
+        xs, ys = pair
+        out = _zipwith(step, delay(xs), delay(Stream(0.0, ys)))
+        return out, out
+    return Morphism |loop| (Morphism |arrow| body)
+
+
+def average(pair):
+    n, total = pair
+    return total / n
+
+
+def indexed(totals):
+    return _zipwith(lambda n, t: (n, t), delay(iterate(lambda n: n + 1, 1)), delay(totals))
+
+
+def running_average():
+    averages = Morphism |arrow| (lambda totals: totals.fmap(delay(average)))
+    return averages |compose| ((Morphism |arrow| indexed) |compose| fed_back(add))
+
+
+def iir():
+    return fed_back(lambda x, y: x + ALPHA * y)
+
+
+def python_average(xs):
+    total = 0.0
+    for n, x in enumerate(xs, 1):
+        total += x
+        yield total / n
+
+
+def python_iir(xs):
+    y = 0.0
+    for x in xs:
+        y = x + ALPHA * y
+        yield y
+
+
+def best(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    signal = lambda: iterate(lambda v: (v * 7 + 3) % 11, 1.0)
+
+    print(f"{'pipeline':<16} {'python ms':>10} {'loop ms':>9} {'graph ms':>9}")
+    for name, expr, baseline in (
+        ("running average", running_average(), python_average),
+        ("iir filter", iir(), python_iir),
+    ):
+        interpreted, graph = evaluate(expr), circuit(expr)
+        expected = Sequence(tuple(islice(baseline(iter(signal())), 100)))
+        assert take(100, interpreted(signal())) == take(100, graph(signal())) == expected
+
+        python = best(lambda: list(islice(baseline(iter(signal())), N)))
+        looped = best(lambda: take(N, interpreted(signal())))
+        graphed = best(lambda: take(N, graph(signal())))
+        print(f"{name:<16} {python * 1e3:>10.2f} {looped * 1e3:>9.2f} {graphed * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
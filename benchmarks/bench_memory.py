@@ -0,0 +1,150 @@
+"""
+Memory retained by forced Thunks: long Stream traversals and deep `Map`
+chains.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_memory.py
+
+Each case builds a structure, forces it, drops every reference but the
+one a program would keep, and reports what `tracemalloc` still sees
+allocated. A forced Thunk holds its value only, so a mapped Stream kept
+by its head retains its own cells but not the source Stream it was
+mapped from, and a forced `run` Thunk retains its result but not the
+syntax tree it evaluated.
+
+The second table explores the same structures built from `Evictable`
+Thunks, which keep at most `RETAINED.maxsize` forced values alive and
+recompute the rest, trading time for a bounded footprint.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from itertools import islice
+
+from typeclass.data.thunk import Thunk, Evictable, RETAINED
+from typeclass.data.maybe import Just
+from typeclass.data.stream.lib import _iterate
+from typeclass.data.streamtree.lib import paths
+from typeclass.interpret.run import run
+from typeclass.typeclasses.symbols import fmap
+
+LENGTH = 100_000
+DEPTH = 20_000
+RETAIN = 1_000
+
+
+def retained(build):
+    """
+    Bytes still allocated once `build()` returns, counting only what its
+    result keeps alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def mapped_stream():
+    head = _iterate(lambda n: n + 1, 0).fmap(Thunk(lambda: lambda n: n * 2))
+    for _ in islice(head, LENGTH):
+        pass
+    return head
+
+
+def plain_stream():
+    head = _iterate(lambda n: n + 1, 0)
+    for _ in islice(head, LENGTH):
+        pass
+    return head
+
+
+def map_chain():
+    expr = Just(0)
+    for _ in range(DEPTH):
+        expr = expr |fmap| (lambda v: v + 1)
+    result = run(expr, None, None)
+    result.force()
+    return result
+
+
+def explore(tree, depth, width):
+    if depth:
+        for child in islice(tree.children.force(), width):
+            explore(child, depth - 1, width)
+
+
+def stream_of(thunk):
+    def build():
+        head = _iterate(lambda n: n + 1, 0, thunk)
+        for _ in islice(head, LENGTH):
+            pass
+        return head
+    return build
+
+
+def tree_of(thunk):
+    def build():
+        tree = paths(thunk=thunk)
+        explore(tree, 5, 8)
+        return tree
+    return build
+
+
+def timed(build):
+    start = time.perf_counter()
+    build()
+    return (time.perf_counter() - start) * 1e3
+
+
+def forcing(count=200_000):
+    thunks = [Thunk(int) for _ in range(count)]
+    start = time.perf_counter()
+    for thunk in thunks:
+        thunk.force()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main():
+    thunk = Thunk(int)
+    extra = sys.getsizeof(thunk.__dict__) if hasattr(thunk, "__dict__") else 0
+    print(f"Thunk instance: {sys.getsizeof(thunk)} bytes + {extra} bytes of __dict__")
+    print(f"first force: {forcing():.0f} ns\n")
+
+    print(f"{'case':<28} {'retained':>12} {'per item':>10}")
+    for name, build, items in (
+        (f"stream, {LENGTH} cells", plain_stream, LENGTH),
+        (f"mapped stream, {LENGTH} cells", mapped_stream, LENGTH),
+        (f"run of {DEPTH} fmaps", map_chain, DEPTH),
+    ):
+        size = retained(build)
+        print(f"{name:<28} {size / 1e6:>10.1f}MB {size / items:>9.0f}B")
+
+    previous = RETAINED.resize(RETAIN)
+    try:
+        print(f"\nretaining {RETAIN} Evictable values")
+        print(f"{'case':<28} {'thunk':<10} {'retained':>10} {'ms':>8}")
+        for name, build_of in (
+            (f"stream, {LENGTH} cells", stream_of),
+            ("paths, depth 5, width 8", tree_of),
+        ):
+            for thunk in (Thunk, Evictable):
+                RETAINED.clear()
+                size = retained(build_of(thunk))
+                RETAINED.clear()
+                print(f"{name:<28} {thunk.__name__:<10} {size / 1e6:>8.1f}MB {timed(build_of(thunk)):>8.0f}")
+    finally:
+        RETAINED.resize(previous)
+        RETAINED.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Node counts and evaluation time before and after the law-driven optimizer.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_optimize.py
+
+Each row optimizes one program once and then times `evaluate` on the
+original and on the optimized tree.
+"""
+
+import timeit
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.optimize import optimize, pure_function, Report
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, return_, arrow, compose
+
+
+inc = pure_function(lambda v: v + 1)
+
+
+def fmap_chain(depth):
+    expr = Just(0)
+    for _ in range(depth):
+        expr = expr |fmap| inc
+    return expr
+
+
+def arrow_chain(depth):
+    expr = Morphism |arrow| inc
+    for _ in range(depth - 1):
+        expr = (Morphism |arrow| inc) |compose| expr
+    return expr
+
+
+def programs():
+    return {
+        "fmap x10":   fmap_chain(10),
+        "fmap x1000": fmap_chain(1000),
+        "arr x100":   arrow_chain(100),
+        "return>>=":  ((Just |return_| 1) |bind| pure_function(lambda v: Just(v + 1))) |fmap| inc,
+        "pure<*>":    (Sequence |pure| inc) |ap| (Sequence |pure| 1),
+    }
+
+
+def realize(value):
+    return value(0) if isinstance(value, Morphism) else value
+
+
+def measure(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=200):
+    print(f"{'program':<12} {'nodes':>7} {'->':>3} {'nodes':<7} {'fired':>6} {'eval':>10} {'optimized':>10}   (us/eval)")
+    for name, expr in programs().items():
+        report = Report()
+        optimized = optimize(expr, report)
+        assert realize(evaluate(optimized)) == realize(evaluate(expr))
+
+        before = measure(lambda: realize(evaluate(expr)), number)
+        after = measure(lambda: realize(evaluate(optimized)), number)
+        print(f"{name:<12} {report.before:>7} {'->':>3} {report.after:<7} {report.fired:>6} {before:>10.2f} {after:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Serial versus executor-backed evaluation of independent applicative checks.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_parallel.py
+
+Each program applies a validation function to a number of independent
+checks, each of which sleeps to stand in for an I/O round trip.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from typeclass.data.maybe import Just
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.parallel import Parallel
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure
+
+
+def check(i, latency=0.005):
+    time.sleep(latency)
+    return Just(i)
+
+
+def program(count):
+    expr = Just |pure| ()
+    for i in range(count):
+        expr = (expr |fmap| (lambda results: lambda r: results + (r,))) |ap| (Just(i) |bind| check)
+    return expr
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    print(f"{'checks':<8} {'serial':>10} {'threads':>10}   (ms)")
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for count in (4, 16, 64):
+            expr = program(count)
+            serial = measure(lambda: evaluate(expr))
+            threaded = measure(lambda: evaluate(expr, Parallel(executor)))
+            print(f"{count:<8} {serial:>10.1f} {threaded:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Reading a Stream with and without prefetching its cells.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_prefetch.py
+
+Each cell of the Stream takes a few milliseconds to produce, as a fetch
+would, and the consumer spends a few milliseconds on each element. Read
+in order, the two costs add up; with `prefetch`, up to `count` cells are
+produced while the consumer works, so a read costs about the larger of
+the two.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from typeclass.data.stream import iterate, prefetch
+
+CELLS = 100
+PRODUCE = 0.002
+CONSUME = 0.002
+
+
+def fetch(n):
+    time.sleep(PRODUCE)
+    return n + 1
+
+
+def consume(stream):
+    start = time.perf_counter()
+    for _ in islice(stream, CELLS):
+        time.sleep(CONSUME)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    print(f"{CELLS} cells, {PRODUCE * 1e3:.0f}ms to produce and {CONSUME * 1e3:.0f}ms to consume each\n")
+    print(f"{'ahead':<8} {'ms':>8}")
+    print(f"{'none':<8} {consume(iterate(fetch, 0)):>8.1f}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for count in (1, 2, 4, 8):
+            print(f"{count:<8} {consume(prefetch(count, executor, iterate(fetch, 0))):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Interpreter overhead of the per-node profiler.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_profile.py
+
+Rows time `evaluate` before any profiler is used, with a `Profiler` as
+its evaluation context, and again without one afterwards, then print the
+flat report for the profiled runs.
+"""
+
+import timeit
+
+from typeclass.data.maybe import Just
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.profile import Profiler
+from typeclass.typeclasses.symbols import fmap, bind
+
+
+inc = lambda v: v + 1
+expr = ((Just(1) |fmap| inc) |bind| (lambda v: Just(v * 2))) |fmap| inc
+
+
+def measure(number, env=None):
+    return min(timeit.repeat(lambda: evaluate(expr, env), number=number, repeat=5)) / number * 1e6
+
+
+def main(number=20000):
+    before = measure(number)
+    profiler = Profiler()
+    during = measure(number, profiler)
+    after = measure(number)
+
+    print(f"{'off (before)':<14} {before:>8.2f} us/eval")
+    print(f"{'on':<14} {during:>8.2f} us/eval")
+    print(f"{'off (after)':<14} {after:>8.2f} us/eval")
+    print()
+    print(profiler.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Interpreter throughput on shallow and deep syntax trees.
+
+Run from the repository root with the package installed:
+
+    python benchmarks/bench_run.py
+
+Shallow trees measure per-node interpreter overhead; deep trees check that
+long left-nested chains evaluate without exhausting the Python stack.
+"""
+
+import sys
+import timeit
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.lowering import LOWERED
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine, compose, arrow, fanout, second
+
+
+def shallow():
+    inc = lambda x: x + 1
+    return {
+        "fmap":    Just(1) |fmap| inc,
+        "bind":    Just(1) |bind| (lambda x: Just(x + 1)),
+        "ap":      Just |pure| inc |ap| Just(1),
+        "combine": Sequence((1,)) |combine| Sequence((2,)),
+        "compose": (Morphism |arrow| inc) |compose| (Morphism |arrow| inc),
+        "fanout":  (Morphism |arrow| inc) |fanout| (Morphism, Morphism |arrow| inc),
+        "pipeline": ((Just(1) |fmap| inc) |bind| (lambda x: Just(x * 2))) |fmap| inc,
+        "circuit": (Morphism |second| (Morphism |arrow| inc)) |compose| ((Morphism |arrow| inc) |fanout| (Morphism, Morphism |arrow| inc)),
+    }
+
+
+def deep(depth):
+    expr = Just(0)
+    for _ in range(depth):
+        expr = expr |bind| (lambda x: Just(x + 1))
+    return expr
+
+
+def measure(expr, number):
+    best = min(timeit.repeat(lambda: evaluate(expr), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main(number=20000):
+    print(f"{'expression':<12} {'us/eval':>10} {'lowerings':>10}")
+    for name, expr in shallow().items():
+        lowered = LOWERED.total()
+        elapsed = measure(expr, number)
+        print(f"{name:<12} {elapsed:>10.2f} {LOWERED.total() - lowered:>10}")
+
+    for depth in (100, 10_000):
+        try:
+            elapsed = measure(deep(depth), 10)
+            print(f"{'bind x' + str(depth):<12} {elapsed:>10.2f}")
+        except RecursionError:
+            print(f"{'bind x' + str(depth):<12} {'RecursionError':>10}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
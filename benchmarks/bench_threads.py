@@ -0,0 +1,101 @@
+"""
+Thread scaling of evaluation and of shared Streams, and the cost of
+once-only forcing.
+
+Run from the repository root with the package installed, preferably on a
+free-threaded build (python3.14t) where threads run Python in parallel:
+
+    python benchmarks/bench_threads.py
+
+`independent` gives each thread its own expressions to evaluate, so on a
+free-threaded build throughput should grow with the thread count. `shared`
+has every thread read the same fresh Stream, whose elements are each
+computed once whichever thread gets there first; its work is fixed, so the
+useful measure is that it does not get slower. `forcing` times the first
+force of fresh Thunks on one thread with once-only forcing off and on.
+"""
+
+import sys
+import threading
+import time
+from itertools import islice
+
+from typeclass.data.thunk import Thunk, threadsafe
+from typeclass.data.sequence import Sequence
+from typeclass.data.stream.lib import _iterate
+from typeclass.interpret.run import evaluate
+from typeclass.typeclasses.symbols import fmap
+
+THREADS = (1, 2, 4, 8)
+
+
+def chain(seed, depth=200):
+    expr = Sequence((seed,))
+    for _ in range(depth):
+        expr = expr |fmap| (lambda v: v + 1)
+    return expr
+
+
+def spin(n, work=200):
+    for _ in range(work):
+        n = (n * 31 + 7) % 1_000_003
+    return n
+
+
+def parallel(count, work):
+    barrier = threading.Barrier(count + 1)
+
+    def body(i):
+        barrier.wait()
+        work(i)
+
+    threads = [threading.Thread(target=body, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def independent(count, per_thread=100):
+    seconds = parallel(count, lambda i: [evaluate(chain(i)) for _ in range(per_thread)])
+    return count * per_thread / seconds
+
+
+def shared(count, length=20_000):
+    stream = _iterate(spin, 1)
+    return parallel(count, lambda i: sum(islice(stream, length))) * 1e3
+
+
+def forcing(enabled, count=200_000):
+    previous = threadsafe(enabled)
+    try:
+        thunks = [Thunk(int) for _ in range(count)]
+        start = time.perf_counter()
+        for thunk in thunks:
+            thunk.force()
+        return (time.perf_counter() - start) / count * 1e9
+    finally:
+        threadsafe(previous)
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    print(f"\nforcing: off {forcing(False):.0f} ns, on {forcing(True):.0f} ns per first force")
+
+    previous = threadsafe(True)
+    try:
+        print(f"\n{'threads':<8} {'independent':>14} {'shared':>10}")
+        print(f"{'':<8} {'(evals/s)':>14} {'(ms)':>10}")
+        for count in THREADS:
+            print(f"{count:<8} {independent(count):>14.0f} {shared(count):>10.1f}")
+    finally:
+        threadsafe(previous)
+
+
+if __name__ == "__main__":
+    main()
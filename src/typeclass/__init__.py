@@ -1,3 +1,9 @@
-from importlib.metadata import version
+def __getattr__(name):
+    # Reading the installed metadata costs more than importing the rest of
+    # the package, so the version is looked up on first use.
+    if name == "__version__":
+        from importlib.metadata import version
 
-__version__ = version("typeclass-core")
+        globals()["__version__"] = result = version("typeclass-core")
+        return result
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
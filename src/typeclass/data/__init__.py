@@ -0,0 +1,41 @@
+from importlib import import_module
+
+# Runtime data types, imported from their packages on first use (PEP 562),
+# so `from typeclass.data import Just` loads the Maybe package only.
+TYPES = {
+    "Maybe": "maybe",
+    "Just": "maybe",
+    "Nothing": "maybe",
+    "Either": "either",
+    "Left": "either",
+    "Right": "either",
+    "Identity": "identity",
+    "Sequence": "sequence",
+    "Stream": "stream",
+    "Tree": "tree",
+    "StreamTree": "streamtree",
+    "Morphism": "morphism",
+    "Endomorphism": "endomorphism",
+    "Automorphism": "automorphism",
+    "Isomorphism": "isomorphism",
+    "Parser": "parser",
+    "NDParser": "ndparser",
+    "Reader": "reader",
+    "State": "state",
+    "Writer": "writer",
+    "Thunk": "thunk",
+}
+
+__all__ = list(TYPES)
+
+def __getattr__(name):
+    try:
+        module = TYPES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    globals()[name] = value = getattr(import_module(f"{__name__}.{module}"), name)
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
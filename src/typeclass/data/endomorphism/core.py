@@ -7,6 +7,7 @@ from typeclass.typeclasses.semigroup import Semigroup
 from typeclass.typeclasses.monoid import Monoid
 
 T = TypeVar("T")
+C = TypeVar("C")
 
 
 @dataclass(frozen=True)
@@ -39,3 +40,7 @@ class Endomorphism(Monoid, Semigroup, Morphism[T, T], Generic[T]):
     @classmethod
     def mempty(cls) -> Endomorphism[T]:
         return Endomorphism(lambda x: x)
+
+    @classmethod
+    def loop(cls, self: Endomorphism[tuple[T, C]]) -> Endomorphism[T]:
+        return Endomorphism(Morphism.loop(self)._run)
@@ -12,6 +12,7 @@ from typeclass.typeclasses.arrowloop import ArrowLoop
 from typeclass.data.either import Either, Left, Right
 
 from typeclass.typeclasses.force import Force
+from typeclass.data.thunk import Feedback, NoFixpoint
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -19,7 +20,7 @@ C = TypeVar("C")
 
 
 @dataclass(frozen=True)
-class Morphism(ArrowApply, ArrowChoice, Arrow, Category, Semigroupoid, Generic[A, B]):
+class Morphism(ArrowLoop, ArrowApply, ArrowChoice, Arrow, Category, Semigroupoid, Generic[A, B]):
     """
     Base arrow A -> B.
     """
@@ -68,6 +69,30 @@ class Morphism(ArrowApply, ArrowChoice, Arrow, Category, Semigroupoid, Generic[A
 
         return Morphism(inner)
 
+    # --- ArrowLoop ---
+
+    @classmethod
+    def loop(cls, self: Force[Morphism[tuple[A, C], tuple[B, C]]]) -> Morphism[A, B]:
+        """
+        The body receives `(a, c)` where `c` is a `Feedback` Thunk. Forced
+        lazily, it is tied to the body's own `C` output in a single call.
+        Read early with `c.get(default)`, the body is rerun from `default`
+        until its `C` output repeats, at most `Feedback.LIMIT` times; forced
+        early, it raises `LoopDetected`, as there is nothing to read yet.
+        """
+        def inner(a: A) -> B:
+            f = self.force()
+            feedback = Feedback()
+            for _ in range(Feedback.LIMIT):
+                b, c = f((a, feedback))
+                if feedback.matches(c):
+                    feedback.tie(c)
+                    return b
+                feedback = Feedback(c)
+            raise NoFixpoint(f"feedback did not settle after {Feedback.LIMIT} iterations")
+
+        return Morphism(inner)
+
     # --- ArrowApply ---
 
     @classmethod
@@ -1,4 +1,5 @@
 from typeclass.data.ndparser import NDParser
+from typeclass.data.thunk import Thunk
 
 
 def item():
@@ -35,14 +36,11 @@ def none_of(chars):
 
 
 def fix(f):
-    parser = None
-
-    def inner(s):
-        return parser.run(s)
-
-    parser = NDParser(inner)
-    parser = f(parser)
-    return parser
+    # The knot is a Thunk, so a parser which runs itself while `f` is
+    # still building it raises `LoopDetected` instead of failing on a
+    # parser which does not exist yet.
+    knot = Thunk(lambda: f(NDParser(lambda s: knot.force().run(s))))
+    return knot.force()
 
 
 def delay(f):
@@ -1,6 +1,7 @@
 from typeclass.data.sequence import Sequence
 from typeclass.data.maybe import Just, Nothing
 from typeclass.data.parser import Parser  # adjust import if needed
+from typeclass.data.thunk import Thunk
 
 
 def item():
@@ -34,14 +35,11 @@ def none_of(chars):
 
 
 def fix(f):
-    parser = None
-
-    def inner(s):
-        return parser.run(s)
-
-    parser = Parser(inner)
-    parser = f(parser)
-    return parser
+    # The knot is a Thunk, so a parser which runs itself while `f` is
+    # still building it raises `LoopDetected` instead of failing on a
+    # parser which does not exist yet.
+    knot = Thunk(lambda: f(Parser(lambda s: knot.force().run(s))))
+    return knot.force()
 
 
 def delay(f):
@@ -17,6 +17,7 @@ from typeclass.data.stream.lib import (
     _cycle_sequence,
     _repeat_last,
     _prefix,
+    _prefetch,
 )
 from typeclass.runtime.core import evaluated
 
@@ -37,4 +38,5 @@ tails          = evaluated(_tails)
 cycle_sequence = evaluated(_cycle_sequence)
 repeat_last    = evaluated(_repeat_last)
 prefix         = evaluated(_prefix)
+prefetch       = evaluated(_prefetch)
 
@@ -1,6 +1,6 @@
 from typing import Callable, TypeVar
 
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, FutureThunk, delay
 from typeclass.data.stream.core import Stream
 from typeclass.data.sequence import Sequence
 
@@ -23,7 +23,7 @@ def _repeat(value: A) -> Stream[A]:
     return Stream(value, Thunk(lambda: _repeat(value)))
 
 
-def _iterate(function: Callable[[A], A], seed: A) -> Stream[A]:
+def _iterate(function: Callable[[A], A], seed: A, thunk: type[Thunk] = Thunk) -> Stream[A]:
     """
     Construct an infinite Stream by repeatedly applying a function to a seed.
 
@@ -33,15 +33,18 @@ def _iterate(function: Callable[[A], A], seed: A) -> Stream[A]:
     Args:
         function: A function from A to A used to generate successive values.
         seed: The initial value of the Stream.
+        thunk: The Thunk class the tails are made with. Pass `Evictable` to
+            keep a bounded number of cells alive however far the Stream is
+            read, recomputing evicted ones when they are read again.
 
     Returns:
         A Stream beginning at `seed` and continuing with repeated applications
         of `function`.
     """
-    return Stream(seed, Thunk(lambda: _iterate(function, function(seed))))
+    return Stream(seed, thunk(lambda: _iterate(function, function(seed), thunk)))
 
 
-def _unfold(step: Callable[[A], tuple[B, A]], seed: A) -> Stream[B]:
+def _unfold(step: Callable[[A], tuple[B, A]], seed: A, thunk: type[Thunk] = Thunk) -> Stream[B]:
     """
     Construct an infinite Stream from a seed value and a stepping function.
 
@@ -51,12 +54,13 @@ def _unfold(step: Callable[[A], tuple[B, A]], seed: A) -> Stream[B]:
         step: A function that takes a seed of type A and returns a pair
             containing the next value of type B and the next seed of type A.
         seed: The initial seed value.
+        thunk: The Thunk class the tails are made with, as for `_iterate`.
 
     Returns:
         A Stream of values produced by repeatedly applying `step`.
     """
     value, next_seed = step(seed)
-    return Stream(value, Thunk(lambda: _unfold(step, next_seed)))
+    return Stream(value, thunk(lambda: _unfold(step, next_seed, thunk)))
 
 
 def _head(stream: Stream[A]) -> A:
@@ -334,3 +338,56 @@ def _prefix(stream: Stream[A], count: int) -> Sequence[A]:
         A Sequence containing the first `count` elements of the Stream.
     """
     return take(count, stream)
+
+
+def _prefetch(count: int, executor, stream: Stream[A]) -> Stream[A]:
+    """
+    Compute the cells of a Stream ahead of its consumer on an executor.
+
+    The result has the same elements as `stream`. While the consumer reads
+    cell i, cells up to i + `count` are forced in the background, each by
+    a task which waits for the cell before it, so at most `count` cells are
+    computed that nobody has asked for yet. The cells are those of
+    `stream` itself, shared with every other reader of it.
+
+    Use a thread pool: the cells stay in this process. With the GIL, only
+    work which releases it, such as I/O, overlaps with the consumer; on a
+    free-threaded build CPU-bound cells do too. Cells forced from several
+    threads should be pure, or `thunk.threadsafe` turned on, so that each
+    is computed once.
+
+    Args:
+        count: How many cells to compute ahead of the consumer.
+        executor: A `concurrent.futures` executor to compute them on.
+        stream: The Stream to read ahead of.
+
+    Returns:
+        A Stream with the same elements as `stream`.
+
+    Raises:
+        ValueError: If `count` is negative.
+    """
+    if count < 0:
+        raise ValueError("prefetch expects a non-negative count")
+    if count == 0:
+        return stream
+
+    lead = delay(stream)
+    for _ in range(count):
+        lead = FutureThunk(executor, _advance, lead)
+    return _prefetching(executor, stream, lead)
+
+
+def _advance(lead: Thunk[Stream[A]]) -> Stream[A]:
+    return lead.force().tail.force()
+
+
+def _prefetching(executor, stream: Stream[A], lead: Thunk[Stream[A]]) -> Stream[A]:
+    return Stream(
+        stream.head,
+        Thunk(lambda: _prefetching(
+            executor,
+            stream.tail.force(),
+            FutureThunk(executor, _advance, lead),
+        )),
+    )
@@ -3,13 +3,9 @@ from typeclass.data.tree import Tree
 from typeclass.data.sequence import Sequence
 from typeclass.data.streamtree import StreamTree
 from typeclass.data.stream import Stream
-from typeclass.data.thunk import Thunk, suspend, delay, resume
+from typeclass.data.thunk import Thunk, delay, resume
 
 
-from typeclass.interpret.run import evaluate
-
-from typeclass.typeclasses.symbols import pure, ap
-
 def realize(tree: StreamTree[Maybe[A]]) -> Tree[A]:
     match tree.value:
         case Just(value=v):
@@ -35,29 +31,46 @@ def _realize_children(
                 return Sequence(tuple(out))
 
 
-def depths(depth: int = 0) -> StreamTree[int]:
+# `thunk` is the Thunk class the children of these trees are made with.
+# Pass `Evictable` to explore them in bounded memory: forced children
+# beyond `RETAINED.maxsize` are dropped and rebuilt when visited again.
+def depths(depth: int = 0, thunk: type[Thunk] = Thunk) -> StreamTree[int]:
     return StreamTree(
         depth,
-        Thunk(lambda: Stream.pure(depths(depth + 1))),
+        thunk(lambda: Stream.pure(depths(depth + 1, thunk))),
     )
   
-def widths(width: int = 0) -> StreamTree[int]:
-    return StreamTree(width, suspend(_width_children))
+def widths(width: int = 0, thunk: type[Thunk] = Thunk) -> StreamTree[int]:
+    return StreamTree(width, thunk(lambda: _width_children(thunk)))
 
-def _width_children() -> Stream[StreamTree[int]]:
+def _width_children(thunk: type[Thunk] = Thunk) -> Stream[StreamTree[int]]:
     def build(i: int) -> Stream[StreamTree[int]]:
-        return Stream(widths(i), suspend(build, i + 1))
+        return Stream(widths(i, thunk), thunk(lambda: build(i + 1)))
     return build(0)
 
-def coordinates() -> StreamTree[tuple[int, int]]:
-    return evaluate(StreamTree |pure| (lambda x: lambda y: (x, y)) |ap| depths() |ap| widths())
+# `pure (,) <*> depths() <*> widths()`, built directly rather than through
+# `StreamTree.ap`, whose zipped children are always plain Thunks.
+def coordinates(thunk: type[Thunk] = Thunk) -> StreamTree[tuple[int, int]]:
+    return _product(depths(0, thunk), widths(0, thunk), thunk)
+
+def _product(xs: StreamTree[A], ys: StreamTree[B], thunk: type[Thunk] = Thunk) -> StreamTree[tuple[A, B]]:
+    return StreamTree(
+        (xs.value, ys.value),
+        thunk(lambda: _product_children(xs.children.force(), ys.children.force(), thunk)),
+    )
+
+def _product_children(xs: Stream[StreamTree[A]], ys: Stream[StreamTree[B]], thunk: type[Thunk] = Thunk) -> Stream[StreamTree[tuple[A, B]]]:
+    return Stream(
+        _product(xs.head, ys.head, thunk),
+        thunk(lambda: _product_children(xs.tail.force(), ys.tail.force(), thunk)),
+    )
 
-def paths(path: tuple[int, ...] = ()) -> StreamTree[tuple[int, ...]]:
-    return StreamTree(path, suspend(_path_children, path))
+def paths(path: tuple[int, ...] = (), thunk: type[Thunk] = Thunk) -> StreamTree[tuple[int, ...]]:
+    return StreamTree(path, thunk(lambda: _path_children(path, thunk)))
 
 
-def _path_children(path: tuple[int, ...]) -> Stream[StreamTree[tuple[int, ...]]]:
+def _path_children(path: tuple[int, ...], thunk: type[Thunk] = Thunk) -> Stream[StreamTree[tuple[int, ...]]]:
     def build(i: int) -> Stream[StreamTree[tuple[int, ...]]]:
-        return Stream(paths(path + (i,)), suspend(build, i + 1),)
+        return Stream(paths(path + (i,), thunk), thunk(lambda: build(i + 1)))
 
     return build(0)
@@ -1,32 +1,556 @@
 from __future__ import annotations
+import sys
+from collections import OrderedDict
+from threading import Event, Lock, RLock, get_ident
+from weakref import ref
 from typing import Callable, Generic, TypeVar
 
 from typeclass.typeclasses.force import Force
 
 T = TypeVar("T")
 
+# Whether forcing takes a lock so that a Thunk shared between threads runs
+# its computation once. On by default when the GIL is disabled; see
+# `threadsafe`.
+THREADSAFE = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+def threadsafe(enabled: bool = True) -> bool:
+    """
+    Turn once-only forcing on or off and return the previous setting.
+
+    With it on, threads forcing the same unevaluated Thunk queue on a lock
+    created for that Thunk: one runs the computation and the others read
+    its value. An evaluated Thunk is read without locking either way, so
+    the cost is paid once per Thunk, on its first force.
+
+    It is on by default on a free-threaded build. With the GIL, two threads
+    can still both run a shared Thunk's computation when one is switched
+    out mid-way, so turn it on if those computations have effects.
+    """
+    global THREADSAFE
+    previous, THREADSAFE = THREADSAFE, enabled
+    return previous
+
+# Guard the creation of per-Thunk locks, striped by address so that
+# threads forcing different Thunks rarely contend. A guard is only held to
+# allocate a lock, never while a computation runs.
+GUARDS = tuple(Lock() for _ in range(64))
+
+def once(owner) -> RLock:
+    """
+    The lock serializing the first evaluation of `owner`, kept on it as
+    `_lock` and created on first use. Whoever holds it and finishes the
+    evaluation may `release` it: threads already waiting keep their
+    reference, and later ones find the value and never lock.
+    """
+    lock = owner._lock
+    if lock is None:
+        with GUARDS[id(owner) >> 4 & 63]:
+            lock = owner._lock
+            if lock is None:
+                lock = owner._lock = RLock()
+    return lock
+
+def release(owner) -> None:
+    owner._lock = None
+
+# `_thunk` of a Thunk whose closure is running. Forcing it again from the
+# same thread raises `LoopDetected`; other threads wait for the value.
+BLACKHOLE = object()
+
+# Events of threads waiting, with once-only forcing off, for a blackholed
+# Thunk which another thread is evaluating, keyed by the Thunk. The
+# evaluating thread sets and removes its entry once `_thunk` changes.
+WAITING = {}
+
+# Estimate of a `Feedback` which has none: the first pass of a loop with
+# no seed.
+UNSEEDED = object()
+
+def wake(owner) -> None:
+    with GUARDS[id(owner) >> 4 & 63]:
+        event = WAITING.pop(owner, None)
+    if event is not None:
+        event.set()
+
 class Thunk(Force[T], Generic[T]):
+    """
+    A delayed value, computed by calling `thunk` on first `force`.
+
+    Once forced, a Thunk holds its value only: the closure, and whatever
+    it captured, such as the previous cell of a Stream or the syntax tree
+    of a `run`, is released. `_thunk` is None exactly when the value is
+    known. Instances are slotted.
+
+    While its closure runs a Thunk is blackholed, as in GHC, and records
+    the thread running it in `_owner`: forcing it again on that thread
+    raises `LoopDetected` at once instead of recursing until the stack runs
+    out, and other threads wait for the value.
+    """
+    __slots__ = ("_thunk", "_value", "_lock", "_owner")
+
     def __init__(self, thunk: Callable[[], T]):
         self._thunk = thunk
-        self._evaluated = False
         self._value: T | None = None
+        self._lock = None
+        self._owner = None
 
     def force(self) -> T:
+        thunk = self._thunk
+        if thunk is not None:
+            if THREADSAFE:
+                return self._force_once()
+            if thunk is BLACKHOLE:
+                self._wait()
+                return self.force()
+
+            self._owner = get_ident()
+            self._thunk = BLACKHOLE
+            try:
+                value = thunk()
+            except BaseException:
+                self._thunk = thunk
+                raise
+            else:
+                # The value is stored before the closure is dropped, so a
+                # thread which finds `_thunk` cleared also finds the value.
+                self._value = value
+                self._thunk = None
+            finally:
+                if WAITING:
+                    wake(self)
+        return self._value
+
+    def _force_once(self) -> T:
+        with once(self):
+            thunk = self._thunk
+            if thunk is BLACKHOLE:
+                raise LoopDetected(f"{self!r} depends on its own value")
+            if thunk is not None:
+                self._thunk = BLACKHOLE
+                try:
+                    value = thunk()
+                except BaseException:
+                    self._thunk = thunk
+                    raise
+                self._value = value
+                self._thunk = None
+            release(self)
+        return self._value
+
+    def _wait(self) -> None:
+        """
+        `self` is being evaluated and once-only forcing is off: raise if
+        this thread is the one evaluating it, else wait until it is done.
+
+        The event is registered before `_thunk` is checked again, and the
+        evaluating thread changes `_thunk` before it looks for events, so
+        one of the two always sees the other.
+        """
+        if self._owner == get_ident():
+            raise LoopDetected(f"{self!r} depends on its own value")
+
+        guard = GUARDS[id(self) >> 4 & 63]
+        with guard:
+            event = WAITING.get(self)
+            if event is None:
+                event = WAITING[self] = Event()
+        try:
+            if self._thunk is BLACKHOLE:
+                event.wait()
+        finally:
+            with guard:
+                if WAITING.get(self) is event and self._thunk is not BLACKHOLE:
+                    del WAITING[self]
+
+    def __repr__(self):
+        if self._thunk is None:
+            return f"Thunk({self._value!r})"
+        return "Thunk(<evaluating>)" if self._thunk is BLACKHOLE else "Thunk(<unevaluated>)"
+
+
+class Strict(Thunk[T]):
+    """
+    A Thunk whose value is already known.
+
+    Syntax builders wrap realized operands in `Strict` rather than
+    `Thunk(lambda: value)`, which saves the closure: forcing is a plain
+    attribute read.
+    """
+    __slots__ = ()
+
+    def __init__(self, value: T):
+        self._value = value
+
+    def force(self) -> T:
+        return self._value
+
+    def __repr__(self):
+        return f"Strict({self._value!r})"
+
+
+class Feedback(Thunk[T]):
+    """
+    The fed back input of a loop: a Thunk for a value the loop body has not
+    produced yet.
+
+    The body receives a `Feedback` with its input. If the body never forces
+    it before returning, the knot is tied: the Feedback is pointed at the
+    value the body returned and later forcing reads it. A body which needs
+    the value early reads `get(default)` instead, which returns `estimate`,
+    or `default` if there is none yet, and whoever runs the loop calls the
+    body again with a new estimate until the value fed back stops changing.
+    Forcing a Feedback which has neither been tied nor given an estimate
+    raises `LoopDetected`.
+    """
+    __slots__ = ("_evaluated", "demanded")
+
+    LIMIT = 1000
+
+    def __init__(self, estimate: T = UNSEEDED):
+        self._value = estimate
+        self._evaluated = False
+        self.demanded = False
+
+    def force(self) -> T:
+        if not self._evaluated:
+            self.demanded = True
+            if self._value is UNSEEDED:
+                raise LoopDetected(f"{self!r} was forced before the loop body produced it")
+        return self._value
+
+    def get(self, default: T) -> T:
+        """
+        The value fed back, or `default` while there is no estimate of it.
+        """
         if not self._evaluated:
-            self._value = self._thunk()
-            self._evaluated = True
+            self.demanded = True
+            if self._value is UNSEEDED:
+                return default
         return self._value
 
+    def matches(self, value: T) -> bool:
+        """
+        True if tying the knot to `value` is consistent with what the body
+        has already read.
+        """
+        if not self.demanded or value is self._value:
+            return True
+        if self._value is UNSEEDED:
+            return False
+        try:
+            return bool(value == self._value)
+        except Exception:
+            return False
+
+    def tie(self, value: T) -> None:
+        self._value = value
+        self._evaluated = True
+
+    def __repr__(self):
+        return f"Feedback({self._value!r})" if self._evaluated else "Feedback(<untied>)"
+
+
+class FutureThunk(Thunk[T]):
+    """
+    A Thunk computed ahead of demand: `fn(*args, **kwargs)` is submitted to
+    `executor` when the FutureThunk is made, and `force` joins the result.
+
+        tail = FutureThunk(executor, expensive, seed)
+        ...
+        tail.force()   # waits for the background result, or reads it
+
+    If the work has not started when it is forced, it is cancelled and run
+    in the forcing thread instead, so a computation which forces other
+    FutureThunks cannot deadlock a saturated pool. An exception raised in
+    the background is raised by `force`. With a process pool, `fn` and its
+    arguments must pickle.
+
+    Otherwise it behaves as a Thunk: it is forced once, and it releases the
+    future and its arguments once it holds the value.
+    """
+    __slots__ = ()
+
+    def __init__(self, executor, fn: Callable[..., T], *args, **kwargs):
+        future = executor.submit(fn, *args, **kwargs)
+
+        def join() -> T:
+            if future.cancel():
+                return fn(*args, **kwargs)
+            return future.result()
+
+        super().__init__(join)
+
+
+class Retained:
+    """
+    Size-bounded LRU table holding the values of `Evictable` Thunks, shared
+    by all of them as `RETAINED`.
+
+    At most `maxsize` values are held; forcing an Evictable refreshes its
+    entry, and the least recently forced is evicted first. Counters record
+    forces answered from the table (`hits`), from a value still alive
+    elsewhere after eviction (`revived`), and by recomputing (`misses`).
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.revived = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.values)
+
     def __repr__(self):
-        return f"Thunk({self._value!r})" if self._evaluated else "Thunk(<unevaluated>)"
+        return (
+            f"Retained({len(self.values)}/{self.maxsize}, hits={self.hits}, "
+            f"revived={self.revived}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def get(self, thunk: Evictable[T]) -> T:
+        """
+        The value held for `thunk`, or `MISSING`.
+        """
+        with self.lock:
+            value = self.values.get(thunk, MISSING)
+            if value is not MISSING:
+                self.values.move_to_end(thunk)
+                self.hits += 1
+            return value
+
+    def put(self, thunk: Evictable[T], value: T, recomputed: bool) -> None:
+        with self.lock:
+            if recomputed:
+                self.misses += 1
+            else:
+                self.revived += 1
+            self.values[thunk] = value
+            self.values.move_to_end(thunk)
+            self.evict()
+
+    def evict(self) -> None:
+        while len(self.values) > self.maxsize:
+            self.values.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: int) -> int:
+        """
+        Bound the table to `maxsize` values and return the previous bound.
+        """
+        with self.lock:
+            previous, self.maxsize = self.maxsize, maxsize
+            self.evict()
+        return previous
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+
+MISSING = object()
+
+RETAINED = Retained()
+
+class Evictable(Thunk[T]):
+    """
+    A Thunk whose value may be dropped under memory pressure and is
+    recomputed when forced again, as built by `recompute`.
+
+    The value is held in the global LRU `RETAINED` rather than by the Thunk,
+    so a structure built from Evictables, such as a Stream whose tails are
+    Evictable, keeps at most `RETAINED.maxsize` of its forced parts alive
+    however far it is explored. After eviction the Thunk still holds its
+    value weakly, where the value allows it, and reuses it while something
+    else keeps it alive; otherwise it calls its closure again. The closure
+    is never released, and should be pure: a recomputed value is equal to,
+    not the same object as, the first.
+
+    Recomputing blackholes the Evictable and, with `threadsafe` on, holds
+    its lock, as the first force of a Thunk does.
+    """
+    __slots__ = ("_weak",)
+
+    def __init__(self, thunk: Callable[[], T]):
+        super().__init__(thunk)
+        self._weak = None
+
+    def force(self) -> T:
+        value = RETAINED.get(self)
+        if value is not MISSING:
+            return value
+
+        if not THREADSAFE:
+            return self._realize()
+        with once(self):
+            value = self._realize()
+            release(self)
+        return value
+
+    def _realize(self) -> T:
+        """
+        Revive or recompute the value, blackholing the closure while it
+        runs as `Thunk.force` does. Under the lock, a thread which waited
+        for another finds the value back in `RETAINED`.
+        """
+        thunk = self._thunk
+        if thunk is BLACKHOLE:
+            if THREADSAFE:
+                raise LoopDetected(f"{self!r} depends on its own value")
+            self._wait()
+            return self.force()
+
+        value = RETAINED.get(self)
+        if value is not MISSING:
+            return value
+
+        weak = self._weak
+        value = weak() if weak is not None else None
+        recomputed = value is None
+        if recomputed:
+            self._owner = get_ident()
+            self._thunk = BLACKHOLE
+            try:
+                value = thunk()
+            finally:
+                self._thunk = thunk
+                if WAITING:
+                    wake(self)
+            try:
+                self._weak = ref(value)
+            except TypeError:
+                self._weak = None
+
+        RETAINED.put(self, value, recomputed)
+        return value
+
+    def __repr__(self):
+        if self._thunk is BLACKHOLE:
+            return "Evictable(<evaluating>)"
+        value = RETAINED.values.get(self, MISSING)
+        return "Evictable(<evicted>)" if value is MISSING else f"Evictable({value!r})"
+
+
+# `_thunk` of a `Forward` whose closure has run: its target is known but
+# the value at the end of the chain is not yet.
+FORWARDED = object()
+
+class Forward(Thunk[T]):
+    """
+    A Thunk whose computation returns another Thunk to take the value of,
+    as built by `resume`.
+
+    Forcing one follows the chain of Forwards it leads to in a loop, not
+    by recursion, forces the first Thunk which is not a Forward, and then
+    writes that value into every Forward it passed, as GHC shortcuts
+    indirections. A chain of any length is forced in constant Python
+    stack, and forcing any of its links again is a plain read.
+
+    Each closure runs once: after it runs the Forward drops it and keeps
+    its target in `_target` until the value is known.
+    """
+    __slots__ = ("_target",)
+
+    def __init__(self, thunk: Callable[[], Force[T]]):
+        super().__init__(thunk)
+        self._target = None
+
+    def force(self) -> T:
+        if self._thunk is None:
+            return self._value
+
+        # A chain leading back into itself is caught by Brent's method:
+        # compare each link with one remembered at every power of two.
+        chain, current = [], self
+        mark, power = None, 1
+        while True:
+            if not isinstance(current, Forward):
+                value = current.force()
+                break
+            if current._thunk is None:
+                value = current._value
+                break
+            if current is mark:
+                raise LoopDetected(f"{self!r} forwards to itself")
+            chain.append(current)
+            if len(chain) == power:
+                mark, power = current, power * 2
+            current = current._follow()
+
+        for link in chain:
+            link._value = value
+            link._thunk = None
+            link._target = None
+        return value
+
+    def _follow(self) -> Force[T]:
+        """
+        The Thunk this one forwards to, running the closure if it has not
+        run yet. Returns `self` if the value became known meanwhile.
+        """
+        target = self._target
+        if target is not None:
+            return target
+
+        if not THREADSAFE:
+            return self._expand()
+
+        with once(self):
+            if self._thunk is BLACKHOLE:
+                raise LoopDetected(f"{self!r} depends on its own value")
+            target = self._expand()
+            release(self)
+        return target
+
+    def _expand(self) -> Force[T]:
+        target = self._target
+        if target is None:
+            thunk = self._thunk
+            if thunk is None or thunk is FORWARDED:
+                return self
+            if thunk is BLACKHOLE:
+                self._wait()
+                return self._expand()
+
+            self._owner = get_ident()
+            self._thunk = BLACKHOLE
+            try:
+                target = self._target = thunk()
+            except BaseException:
+                self._thunk = thunk
+                raise
+            else:
+                self._thunk = FORWARDED
+            finally:
+                if WAITING:
+                    wake(self)
+        return target
+
+
+class LoopDetected(RuntimeError):
+    """
+    Raised when forcing a Thunk needs the value of that same Thunk, such as
+    a Stream defined by forcing itself or a knot tied too eagerly.
+    """
+
+
+class NoFixpoint(RuntimeError):
+    """
+    Raised when a feedback loop does not settle within its iteration limit.
+    """
 
 
 def delay(value: T) -> Thunk[T]:
-    return Thunk(lambda: value)
+    return Strict(value)
 
 
 def suspend(fn, *args, **kwargs):
     return Thunk(lambda: fn(*args, **kwargs))
 
 def resume(fn, *args, **kwargs):
-    return Thunk(lambda: fn(*args, **kwargs).force())
+    return Forward(lambda: fn(*args, **kwargs))
+
+def recompute(fn, *args, **kwargs):
+    return Evictable(lambda: fn(*args, **kwargs))
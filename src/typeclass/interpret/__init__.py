@@ -0,0 +1,44 @@
+from importlib import import_module
+
+# Entry points of the interpreter and its passes, imported from their
+# modules on first use (PEP 562): `from typeclass.interpret import evaluate`
+# does not load the optimizer, the profiler or the executors. Names which
+# are also module names, such as `run` or `compile`, are not listed, since
+# importing the module would replace them.
+NAMES = {
+    "evaluate": "run",
+    "interpret": "run",
+    "register": "run",
+    "Env": "run",
+    "param": "compile",
+    "Plan": "compile",
+    "Report": "optimize",
+    "pure_function": "optimize",
+    "Limits": "annotate",
+    "run_annotated": "annotate",
+    "Profiler": "profile",
+    "Parallel": "parallel",
+    "evaluate_async": "asynchronous",
+    "evaluate_many": "batch",
+    "Batch": "batch",
+    "dumps": "serialize",
+    "loads": "serialize",
+    "named": "serialize",
+    "register_function": "serialize",
+    "Cache": "cache",
+    "circuit": "graph",
+}
+
+__all__ = list(NAMES)
+
+def __getattr__(name):
+    try:
+        module = NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    globals()[name] = value = getattr(import_module(f"{__name__}.{module}"), name)
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, field
+
+from typeclass.typeclasses.arrow import Second, Split, Fanout
+from typeclass.typeclasses.arrowchoice import Right, PlusPlus, OrOr
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.interpret.run import HANDLERS, normalize, trampoline
+from typeclass.interpret.syntax import is_syntax, operands
+
+# Relative cost of interpreting one node of each type. Derived combinators
+# pay for the nodes they lower into; every other node costs one dispatch.
+COSTS = {
+    Second: 4,
+    Split: 6,
+    Fanout: 8,
+    Right: 4,
+    PlusPlus: 6,
+    OrOr: 8,
+}
+
+@dataclass(frozen=True)
+class Annotation:
+    """
+    Static facts about a subtree.
+
+    `nodes` and `cost` count the subtree as the interpreter walks it, so a
+    node shared by two parents is counted twice. `closed` is False when any
+    leaf is opaque code: a function, lambda or other callable.
+    """
+    nodes: int
+    depth: int
+    cost: int
+    closed: bool
+
+@dataclass
+class Cofree:
+    """
+    A syntax node paired with its annotation, and the annotated operands.
+    """
+    annotation: Annotation
+    free: object
+    children: dict = field(default_factory=dict, repr=False)
+
+    def __getitem__(self, name):
+        return self.children[name]
+
+LEAF = Annotation(nodes=0, depth=0, cost=0, closed=True)
+OPAQUE = Annotation(nodes=0, depth=0, cost=0, closed=False)
+
+def annotate(expression):
+    """
+    Build the cofree-annotated tree for `expression`.
+
+    The walk is iterative and visits each distinct node once, so annotating
+    is linear in the size of the expression DAG even when the annotation
+    counts are not.
+    """
+    done = {}
+    stack = [(expression, False)]
+
+    while stack:
+        free, visited = stack.pop()
+
+        if id(free) in done:
+            continue
+
+        if not is_syntax(free):
+            opaque = callable(free) and not isinstance(free, type)
+            done[id(free)] = Cofree(OPAQUE if opaque else LEAF, free)
+            continue
+
+        children = operands(free)
+
+        if not visited:
+            stack.append((free, True))
+            stack.extend((child, False) for _, child in children)
+            continue
+
+        annotated = {name: done[id(child)] for name, child in children}
+        facts = [child.annotation for child in annotated.values()]
+        done[id(free)] = Cofree(
+            Annotation(
+                nodes=1 + sum(a.nodes for a in facts),
+                depth=1 + max((a.depth for a in facts), default=0),
+                cost=COSTS.get(type(free), 1) + sum(a.cost for a in facts),
+                closed=all(a.closed for a in facts),
+            ),
+            free,
+            annotated,
+        )
+
+    return done[id(expression)]
+
+class PathologicalExpression(ValueError):
+    """
+    Raised when an expression exceeds the `Limits` it is run under.
+    """
+
+@dataclass(frozen=True)
+class Limits:
+    """
+    Upper bounds checked before an expression is run. None disables a bound.
+    """
+    nodes: int | None = 1_000_000
+    depth: int | None = 1_000_000
+    cost: int | None = 10_000_000
+
+def check(cofree, limits):
+    """
+    Raise `PathologicalExpression` if the annotated tree exceeds `limits`.
+    """
+    for name in ("nodes", "depth", "cost"):
+        bound = getattr(limits, name)
+        value = getattr(cofree.annotation, name)
+        if bound is not None and value > bound:
+            raise PathologicalExpression(f"expression {name} {value} exceeds the limit of {bound}")
+
+EAGER_COST = 32
+
+def strategy(cofree, eager=EAGER_COST):
+    """
+    "eager" for closed subtrees costing at most `eager`, otherwise "lazy".
+
+    A closed subtree contains no user code, so realizing it early cannot
+    run effects the program did not ask for, and a cheap one is not worth a
+    suspended Thunk. Everything else is left to the trampoline, which keeps
+    deep subtrees off the Python stack.
+    """
+    annotation = cofree.annotation
+    return "eager" if annotation.closed and annotation.cost <= eager else "lazy"
+
+class Annotated:
+    """
+    Evaluation context running every node with the strategy its own
+    annotation selects.
+
+    Handlers receive the `Cofree` of the node they interpret, and each
+    operand they `run` is realized at once when `strategy` finds it cheap
+    and closed, or suspended in a Thunk otherwise. Nodes are matched to
+    their annotations by identity, so syntax built while evaluating, such
+    as the result of a `bind` continuation, runs lazily and unannotated.
+    `eagerly` counts the operands realized at once.
+    """
+
+    def __init__(self, cofree, eager=EAGER_COST):
+        self.eager = eager
+        self.eagerly = 0
+        self.nodes = {}
+        self.handlers = {}
+
+        stack = [cofree]
+        while stack:
+            node = stack.pop()
+            if id(node.free) not in self.nodes:
+                self.nodes[id(node.free)] = node
+                stack.extend(node.children.values())
+
+    def get(self, node):
+        try:
+            return self.handlers[node]
+        except KeyError:
+            pass
+
+        handler = HANDLERS.get(node)
+        if handler is not None:
+            def dispatch(free, run, cofree, env):
+                return handler(free, self.run, self.nodes.get(id(free)), env)
+            self.handlers[node] = dispatch
+            return dispatch
+        return None
+
+    def normalize(self, free, cofree):
+        return trampoline(free, cofree, self, self)
+
+    def run(self, free, cofree, env):
+        own = self.nodes.get(id(free))
+        if own is not None and strategy(own, self.eager) == "eager":
+            self.eagerly += 1
+            return delay(normalize(free, own, env))
+        return Thunk(lambda: normalize(free, own, env))
+
+def run_annotated(expression, limits=Limits(), eager=EAGER_COST):
+    """
+    Annotate `expression`, reject it if it exceeds `limits`, and run it in
+    an `Annotated` context, which picks the strategy of every node from its
+    own annotation.
+    """
+    cofree = annotate(expression)
+    check(cofree, limits)
+
+    context = Annotated(cofree, eager)
+    return context.run(expression, cofree, context)
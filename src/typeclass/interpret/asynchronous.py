@@ -0,0 +1,263 @@
+from asyncio import gather, get_running_loop, run_coroutine_threadsafe
+from contextvars import copy_context
+from dataclasses import replace
+from inspect import isawaitable, iscoroutine
+from threading import Thread
+from types import GeneratorType
+
+from typeclass.typeclasses.applicative import Ap
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import HANDLERS, normalize
+from typeclass.interpret.syntax import is_syntax
+
+OPERAND, RESULT = object(), object()
+
+class Suspend(BaseException):
+    """
+    Raised through a runtime call when it forces an operand or continuation
+    result which the async interpreter has not realized yet.
+
+    It is a `BaseException` so that user and runtime code catching
+    `Exception` lets it through to the driver.
+    """
+
+    def __init__(self, frame, expression, cofree, env):
+        self.frame = frame
+        self.expression = expression
+        self.cofree = cofree
+        self.env = env
+
+class Frame:
+    """
+    A handler frame which can be replayed.
+
+    Runtime calls are synchronous, so a continuation cannot await inside
+    `bind` or `fmap`. Instead, the `run` handed to the handler returns
+    Thunks for its expressions. A plain runtime value is returned as it is,
+    but an awaitable or a syntax tree, which may hold awaitables, raises
+    `Suspend` the first time it is forced on the event loop. The driver
+    awaits the expression, appends its value to `cache`, and replays the
+    handler once more, resending the operands it already received. The
+    replay runs on a thread of its own (see `detach`): the first Thunk
+    answers from `cache`, and any later one blocks that thread while the
+    loop normalizes its expression. A frame is thus run at most twice,
+    however many of its continuations suspend.
+
+    Callables returned to the handler are wrapped so that their calls are
+    recorded in order as well: on the replay the n-th call answers from
+    `results[n]` instead of running user code again. A `Morphism` keeps
+    its type, with its function wrapped. A frame whose continuations never
+    suspend, such as `fmap` of a synchronous function, runs once and on
+    the loop, and each user function is called once per element.
+
+    Thunks forced and functions called after the frame has finished, e.g.
+    when a returned `Morphism` is called later, run synchronously, and an
+    awaitable met then, such as the head of a lazily mapped `Stream`,
+    raises `TypeError`: there is no driver left to await it.
+    """
+
+    def __init__(self, free, handler, cofree, env):
+        self.free = free
+        self.handler = handler
+        self.cofree = cofree
+        self.env = env
+        self.received = []
+        self.cache = []
+        self.results = {}
+        self.calls = 0
+        self.made = 0
+        self.done = False
+        self.generator = None
+        self.loop = None
+
+    def run(self, expression, cofree, env):
+        return Thunk(lambda: self.force(expression, cofree, env))
+
+    def force(self, expression, cofree, env):
+        if self.done:
+            return synchronous(expression, normalize(expression, cofree, env))
+
+        if not isawaitable(expression) and not is_syntax(expression):
+            return self.recorded(expression)
+
+        index = self.calls
+        self.calls += 1
+        if index < len(self.cache):
+            if iscoroutine(expression):
+                expression.close()
+            return self.recorded(self.cache[index])
+        if self.loop is None:
+            raise Suspend(self, expression, cofree, env)
+
+        value = run_coroutine_threadsafe(run_async(expression, cofree, env), self.loop).result()
+        self.cache.append(value)
+        return self.recorded(value)
+
+    def recorded(self, value):
+        if isinstance(value, Morphism):
+            return replace(value, _run=self.record(value._run))
+        return self.record(value) if callable(value) else value
+
+    def record(self, function):
+        """
+        `function`, with its calls made while the frame runs answered by
+        position from `results` once they have returned.
+        """
+        def call(*args, **kwargs):
+            if self.done:
+                return function(*args, **kwargs)
+
+            index = self.made
+            self.made += 1
+            if index in self.results:
+                result, self.made, self.calls = self.results[index]
+                return result
+
+            result = function(*args, **kwargs)
+            self.results[index] = result, self.made, self.calls
+            return result
+
+        return call
+
+    def replay(self):
+        self.calls = self.made = 0
+        try:
+            generator = self.handler(self.free, self.run, self.cofree, self.env)
+            if type(generator) is not GeneratorType:
+                return self.finish(generator)
+
+            self.generator = generator
+            step = generator.send(None)
+            for value in self.received:
+                step = generator.send(value)
+            return OPERAND, step
+        except StopIteration as done:
+            return self.finish(done.value)
+
+    def send(self, value):
+        self.received.append(value)
+        try:
+            return OPERAND, self.generator.send(value)
+        except StopIteration as done:
+            return self.finish(done.value)
+
+    def finish(self, result):
+        self.done = True
+        return RESULT, result
+
+    async def detach(self, step):
+        """
+        Run `step` on a new thread, in a copy of the current context, and
+        await its result. The thread is not taken from a pool: it blocks on
+        the loop while nested frames run, which may detach in turn.
+        """
+        loop = self.loop
+        future = loop.create_future()
+        context = copy_context()
+
+        def settle(method, value):
+            if not future.done():
+                method(value)
+
+        def target():
+            try:
+                result = context.run(step)
+            except BaseException as error:
+                outcome = future.set_exception, error
+            else:
+                outcome = future.set_result, result
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass
+
+        Thread(target=target, daemon=True).start()
+        return await future
+
+def synchronous(expression, value):
+    """
+    `value`, unless it or `expression` is awaitable: raise, as nothing is
+    left to await it.
+    """
+    for awaitable in (expression, value):
+        if isawaitable(awaitable):
+            if iscoroutine(awaitable):
+                awaitable.close()
+            raise TypeError(
+                f"{awaitable!r} was forced after its evaluation finished; "
+                "force lazy parts of the result before evaluate_async returns"
+            )
+    return value
+
+async def run_async(free, cofree, env):
+    """
+    Normalize a syntax tree on the running event loop.
+
+    The async counterpart of `run`: instead of a Thunk it returns a
+    coroutine. Any awaitable the interpreter meets is awaited in place, and
+    whatever it produces is normalized in turn:
+
+        - awaitable leaves and operands, e.g. `fetch(url) |fmap| parse`;
+        - continuation results, e.g. `Just(url) |bind| fetch_async`
+          where `fetch_async` is an `async def`;
+        - the final result.
+
+    Awaitables nested inside runtime values (a `Just` holding a coroutine)
+    are values like any other and are left alone.
+
+    Both sides of an `Ap` are normalized concurrently with `asyncio.gather`,
+    so a left-nested chain of independent checks has all of them in flight at
+    once. The argument is realized even if the runtime would not have forced
+    it (`Nothing <*> x`).
+
+    Handler frames live on an explicit list, as in `normalize`, so a deep
+    tree only deepens the coroutine stack through `Ap`, whose sides run as
+    separate coroutines. Continuations which suspend are resolved by
+    replaying their frame once, on a thread of its own; see `Frame`.
+    """
+    stack = []
+
+    while True:
+        if isawaitable(free):
+            free = await free
+            continue
+
+        if type(free) is Ap:
+            function, value = await gather(
+                run_async(free.ff.force(), cofree, env),
+                run_async(free.fa.force(), cofree, env),
+            )
+            free = function.ap(delay(value))
+            continue
+
+        handler = HANDLERS.get(type(free))
+
+        if handler is not None:
+            frame = Frame(free, handler, cofree, env)
+            stack.append(frame)
+            step = frame.replay
+        elif stack:
+            frame = stack[-1]
+            step = lambda: frame.send(free)
+        else:
+            return free
+
+        while True:
+            try:
+                kind, free = step() if frame.loop is None else await frame.detach(step)
+                break
+            except Suspend as suspend:
+                if suspend.frame is not frame:
+                    raise RuntimeError("operand forced outside of its frame") from None
+                value = await run_async(suspend.expression, suspend.cofree, suspend.env)
+                frame.cache.append(value)
+                frame.loop = get_running_loop()
+                step = frame.replay
+
+        if kind is RESULT:
+            stack.pop()
+
+async def evaluate_async(expression):
+    return await run_async(expression, None, None)
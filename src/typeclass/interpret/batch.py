@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from time import perf_counter
+
+from typeclass.data.thunk import Thunk
+from typeclass.interpret.run import HANDLERS, evaluate
+from typeclass.interpret.syntax import is_syntax, names, rebuild
+from typeclass.interpret.compile import compile, param
+
+DEPTH = 200
+
+@dataclass
+class Batch:
+    """
+    What an `evaluate_many` call did: how many expressions it evaluated,
+    how many distinct shapes they had, how many went through the
+    interpreter instead of a plan, and how long it took.
+    """
+    expressions: int = 0
+    shapes: int = 0
+    interpreted: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self):
+        return self.expressions / self.seconds if self.seconds else 0.0
+
+def evaluate_many(expressions, report=None):
+    """
+    Evaluate a batch of expressions, sharing work across identical shapes.
+
+    Two expressions have the same shape when they differ only in their leaf
+    values: the runtime values and functions at the bottom of the tree. Each
+    shape is compiled once into a `Plan` whose parameters are those leaves,
+    so dispatch and the lowering of derived nodes are paid once per shape
+    and every expression of that shape is a plan call.
+
+    Expressions deeper than `DEPTH` are evaluated by the interpreter, which
+    unlike a plan is stack-safe. Pass a `Batch` to collect counts and timing.
+    """
+    report = Batch() if report is None else report
+    start = perf_counter()
+
+    plans, results = {}, []
+    for expression in expressions:
+        shape, leaves = skeleton(expression)
+
+        if shape is None:
+            report.interpreted += 1
+            results.append(evaluate(expression))
+            continue
+
+        plan = plans.get(shape)
+        if plan is None:
+            plan = plans[shape] = compile(template(expression))
+        results.append(plan.call(dict(zip(parameters(len(leaves)), leaves))))
+
+    report.expressions += len(results)
+    report.shapes += len(plans)
+    report.seconds += perf_counter() - start
+    return results
+
+PARAMETERS = []
+GROWING = Lock()
+
+def parameters(count):
+    """
+    The first `count` parameter names, `x0`, `x1`, ...
+    """
+    if len(PARAMETERS) < count:
+        with GROWING:
+            while len(PARAMETERS) < count:
+                PARAMETERS.append(f"x{len(PARAMETERS)}")
+    return PARAMETERS[:count]
+
+class TooDeep(Exception):
+    pass
+
+LAYOUTS = {}
+
+def layout(free):
+    """
+    Operand and static field names of a node's type, split once per type.
+    """
+    try:
+        return LAYOUTS[type(free)]
+    except KeyError:
+        fields = names(type(free))
+        operands = tuple(name for name in fields if isinstance(getattr(free, name), Thunk))
+        static = tuple(name for name in fields if name not in operands)
+        LAYOUTS[type(free)] = result = (operands, static)
+        return result
+
+def skeleton(expression):
+    """
+    Hashable shape of `expression` and its leaves in walk order, or
+    `(None, None)` if it is too deep for a plan or has an unhashable static
+    field.
+
+    Walks use Python recursion, bounded by `DEPTH`: shapes are small, and
+    recursion is much cheaper per node than an explicit stack.
+    """
+    leaves = []
+
+    def shape(free, depth):
+        node = type(free)
+        if node not in HANDLERS:
+            leaves.append(free)
+            return None
+        if depth > DEPTH:
+            raise TooDeep
+
+        operands, static = LAYOUTS.get(node) or layout(free)
+        parts = [node, tuple([getattr(free, name) for name in static])]
+        for name in operands:
+            parts.append(shape(getattr(free, name).force(), depth + 1))
+        return tuple(parts)
+
+    try:
+        result = shape(expression, 0)
+        hash(result)
+    except (TooDeep, TypeError):
+        return None, None
+    return result, leaves
+
+def template(expression):
+    """
+    Copy of `expression` with every leaf replaced by a parameter named by
+    its position in walk order.
+    """
+    position = count()
+
+    def copy(free):
+        if not is_syntax(free):
+            return param(parameters(next(position) + 1)[-1])
+        operands, _ = layout(free)
+        return rebuild(free, {name: copy(getattr(free, name).force()) for name in operands})
+
+    return copy(expression)
@@ -0,0 +1,315 @@
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import cache
+from hashlib import blake2b
+
+from typeclass.data.thunk import Thunk
+from typeclass.interpret.run import run
+from typeclass.interpret.syntax import is_syntax
+from typeclass.interpret.serialize import registered_name
+
+@dataclass
+class Stats:
+    """
+    Counters for a `Cache`: lookups answered from memory or disk, misses
+    which were evaluated and stored, expressions skipped because they are
+    not closed, and entries evicted from memory and from disk.
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    skipped: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+class Cache:
+    """
+    Result cache for closed expressions, shared across evaluations.
+
+    Expressions are keyed by a structural hash, so two separately built but
+    identical expressions share one entry. Only closed expressions are
+    cached: every leaf must be plain data, a class, or a function registered
+    with `interpret.serialize.register_function`. Anything else, such as a
+    lambda, is opaque code whose result cannot be keyed, and the expression
+    is evaluated without the cache.
+
+        cache = Cache(maxsize=1024, path=".typeclass-cache")
+        cache.evaluate(expr)
+        cache.stats.hit_rate
+
+    Memory entries are evicted least recently used first once there are
+    more than `maxsize` of them or, if `maxbytes` is set, once their pickled
+    size exceeds it. With a `path`, picklable results are also written to
+    that directory and survive restarts; results which cannot be pickled,
+    such as a `Morphism`, are kept in memory only. The directory is held to
+    the same bounds, separately: files are removed least recently used
+    first, by modification time across restarts. Keys include the package
+    version and the key format, so files written by another version of the
+    library are never read, and are the first to be removed.
+
+    A cache may be shared between threads. Its table and counters are
+    updated under a lock, which is not held while an expression is
+    evaluated, so two threads missing on the same key both evaluate it.
+    """
+
+    def __init__(self, maxsize=1024, maxbytes=None, path=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.path = path
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.files = OrderedDict()
+        self.disk_bytes = 0
+        self.stats = Stats()
+        self.lock = threading.RLock()
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self.scan()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"Cache(entries={len(self.entries)}, bytes={self.bytes}, stats={self.stats})"
+
+    def run(self, expression, cofree=None, env=None):
+        """
+        `run` through the cache: a Thunk which looks the expression up when
+        forced and normalizes it on a miss.
+        """
+        return Thunk(lambda: self.evaluate(expression, cofree, env))
+
+    def evaluate(self, expression, cofree=None, env=None):
+        key = structural_key(expression)
+        if key is None:
+            with self.lock:
+                self.stats.skipped += 1
+            return run(expression, cofree, env).force()
+
+        found, value = self.lookup(key)
+        if found:
+            return value
+
+        with self.lock:
+            self.stats.misses += 1
+        value = run(expression, cofree, env).force()
+        self.store(key, value)
+        return value
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, entry[0]
+
+        if self.path is not None:
+            try:
+                with open(self.file(key), "rb") as file:
+                    data = file.read()
+                value = pickle.loads(data)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                return False, None
+            with self.lock:
+                self.stats.disk_hits += 1
+                self.remember(key, value, len(data))
+                self.touch(key, len(data))
+            return True, value
+
+        return False, None
+
+    def store(self, key, value):
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            data = None
+
+        written = data is not None and self.path is not None and (
+            self.maxbytes is None or len(data) <= self.maxbytes
+        )
+        if written:
+            temporary = f"{self.file(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self.file(key))
+
+        with self.lock:
+            self.remember(key, value, len(data) if data is not None else sys.getsizeof(value))
+            if written:
+                self.touch(key, len(data))
+
+    def remember(self, key, value, size):
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.bytes += size
+
+        while len(self.entries) > self.maxsize or (
+            self.maxbytes is not None and self.bytes > self.maxbytes
+        ):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= evicted
+            self.stats.evictions += 1
+
+    def scan(self):
+        """
+        Index the files already in `path`, oldest first, and trim them to
+        the bounds.
+        """
+        found = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and is_key(entry.name):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, key, size in sorted(found):
+            self.files[key] = size
+            self.disk_bytes += size
+        self.trim()
+
+    def touch(self, key, size):
+        """
+        Record `key` as the most recently used file. Its modification time
+        is refreshed so the order survives a restart.
+        """
+        if key in self.files:
+            self.disk_bytes -= self.files.pop(key)
+            try:
+                os.utime(self.file(key))
+            except OSError:
+                pass
+        self.files[key] = size
+        self.disk_bytes += size
+        self.trim()
+
+    def trim(self):
+        while len(self.files) > self.maxsize or (
+            self.maxbytes is not None and self.disk_bytes > self.maxbytes
+        ):
+            key, size = self.files.popitem(last=False)
+            self.disk_bytes -= size
+            self.stats.disk_evictions += 1
+            try:
+                os.remove(self.file(key))
+            except FileNotFoundError:
+                pass
+
+    def file(self, key):
+        return os.path.join(self.path, key)
+
+    def clear(self):
+        """
+        Drop the memory tier. Files on disk are left in place.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+KEYS = {}
+
+def keyed(node):
+    """
+    Names of the fields which take part in a node's structural key: those
+    compared for equality, so bookkeeping fields are left out.
+    """
+    try:
+        return KEYS[node]
+    except KeyError:
+        KEYS[node] = result = tuple(field.name for field in fields(node) if field.compare)
+        return result
+
+def structural_key(expression):
+    """
+    Hex digest identifying `expression` by structure, or None if it holds
+    a leaf with no stable identity: unregistered code, or a value which
+    cannot be pickled.
+
+    Each distinct node is hashed once from its type, its static fields and
+    the digests of its operands, so the walk is linear in the size of the
+    expression DAG and iterative. The result is salted with `salt()`.
+    """
+    digests = {}
+    stack = [(expression, False)]
+
+    while stack:
+        free, visited = stack.pop()
+
+        if id(free) in digests:
+            continue
+
+        if not is_syntax(free):
+            digest = leaf(free)
+            if digest is None:
+                return None
+            digests[id(free)] = digest
+            continue
+
+        values = [getattr(free, name) for name in keyed(type(free))]
+        values = [value.force() if isinstance(value, Thunk) else value for value in values]
+
+        if not visited:
+            stack.append((free, True))
+            stack.extend((value, False) for value in values)
+            continue
+
+        node = type(free)
+        digest = blake2b(f"{node.__module__}.{node.__qualname__}".encode(), digest_size=16)
+        for value in values:
+            digest.update(digests[id(value)])
+        digests[id(free)] = digest.digest()
+
+    return blake2b(digests[id(expression)], digest_size=16, key=salt()).hexdigest()
+
+# Version of the key derivation and of the files it names. Bump it when
+# digests or the pickled results they stand for change meaning.
+FORMAT = 1
+
+@cache
+def salt():
+    """
+    Key mixed into every structural key: the key format and the installed
+    version of the package, since runtime types and handlers may change
+    between releases.
+    """
+    import typeclass
+    from importlib.metadata import PackageNotFoundError
+
+    try:
+        version = typeclass.__version__
+    except PackageNotFoundError:
+        version = "unknown"
+    return blake2b(f"typeclass {version} format {FORMAT}".encode(), digest_size=16).digest()
+
+def is_key(name):
+    return len(name) == 32 and all(char in "0123456789abcdef" for char in name)
+
+def leaf(value):
+    """
+    Digest of a leaf value, or None if it is opaque.
+    """
+    if isinstance(value, type):
+        data = f"type:{value.__module__}.{value.__qualname__}".encode()
+    elif (name := registered_name(value)) is not None:
+        data = f"function:{name}".encode()
+    elif callable(value):
+        return None
+    else:
+        try:
+            data = b"value:" + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+    return blake2b(data, digest_size=16).digest()
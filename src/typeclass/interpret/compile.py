@@ -0,0 +1,280 @@
+from dataclasses import dataclass
+
+from typeclass.typeclasses.functor import Map
+from typeclass.typeclasses.applicative import Ap, Pure
+from typeclass.typeclasses.alternative import Otherwise, Some, Many
+from typeclass.typeclasses.monad import Bind, Return
+from typeclass.typeclasses.comonad import Extract, Duplicate
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.groupoid import Invert
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.group import Inverse
+from typeclass.typeclasses.arrow import Arr, First, Second, Split, Fanout
+from typeclass.typeclasses.arrowchoice import Left, Right, PlusPlus, OrOr
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.interpret.run import HANDLERS, register, run, evaluate
+from typeclass.interpret.syntax import is_syntax, operands, rebuild
+
+@dataclass
+class Param:
+    name: str
+
+def param(name):
+    """
+    A named hole in a syntax tree, filled in when a compiled `Plan` is called.
+    """
+    return Param(name)
+
+def handle_param(free, run, cofree, env):
+    raise LookupError(f"unbound parameter {free.name!r}; bind it by calling compile(expr)")
+
+register(Param, handle_param)
+
+class Plan:
+    """
+    A syntax tree lowered once into nested Python closures.
+
+    Calling a plan with keyword arguments for its parameters runs the
+    lowered closures directly against the runtime: no tree walk, no handler
+    dispatch and no continuation rebuilding happen per call. Subtrees which do
+    not mention a parameter are realized once, the first time the plan needs
+    them, and shared by every later call. Thunks are only allocated per call
+    for lazy operands and continuations which depend on a parameter.
+
+    Plans are built with ordinary Python recursion, so they are meant for the
+    small, hot expression shapes that are evaluated many times, not for the
+    deep chains `normalize` handles.
+    """
+
+    def __init__(self, code, params):
+        self._code = code
+        self.params = params
+
+    def __call__(self, **params):
+        return self._code(params)
+
+    def call(self, params):
+        """
+        Call the plan with a ready-made dict of parameters.
+        """
+        return self._code(params)
+
+    def __repr__(self):
+        return f"Plan(params={sorted(self.params)!r})"
+
+def compile(expression):
+    """
+    Lower `expression`, which may contain `Param` holes, into a `Plan`.
+
+        plan = compile(param("x") |fmap| (lambda v: v + 1))
+        plan(x=Just(1))   # Just(2)
+    """
+    open_, names = _open(expression)
+    return Plan(Lowering(open_).strict(expression), frozenset(names))
+
+class Lowering:
+    """
+    Lowers operands according to how the interpreter consumes them.
+
+    `open` holds the ids of nodes which depend on a parameter; every other
+    subtree is realized once through `run` and shared between calls.
+    """
+
+    def __init__(self, open_):
+        self.open = open_
+
+    def strict(self, free):
+        if type(free) is Param:
+            name = free.name
+            return lambda params: params[name]
+
+        if not is_syntax(free):
+            return lambda params: free
+
+        if id(free) not in self.open:
+            cell = run(free, None, None)
+            return lambda params: cell.force()
+
+        return COMPILERS.get(type(free), compile_substitution)(free, self)
+
+    def lazy(self, free):
+        if type(free) is Param:
+            name = free.name
+            return lambda params: delay(params[name])
+
+        if not is_syntax(free):
+            value = delay(free)
+            return lambda params: value
+
+        if id(free) not in self.open:
+            cell = run(free, None, None)
+            return lambda params: cell
+
+        code = self.strict(free)
+        return lambda params: Thunk(lambda: code(params))
+
+    def continuation(self, free):
+        if id(free) not in self.open:
+            cell = run(free, None, None)
+            k = delay(lambda a: evaluate(cell.force()(a)))
+            return lambda params: k
+
+        code = self.strict(free)
+
+        def bind(params):
+            function = Thunk(lambda: code(params))
+            return delay(lambda a: evaluate(function.force()(a)))
+
+        return bind
+
+def _open(expression):
+    """
+    Ids of every node on a path from the root to a `Param`, and the names of
+    the parameters found.
+    """
+    open_, names = set(), set()
+    stack, seen = [(expression, False)], set()
+
+    while stack:
+        free, visited = stack.pop()
+
+        if type(free) is Param:
+            open_.add(id(free))
+            names.add(free.name)
+        elif visited:
+            if any(id(child) in open_ for _, child in operands(free)):
+                open_.add(id(free))
+        elif is_syntax(free) and id(free) not in seen:
+            seen.add(id(free))
+            stack.append((free, True))
+            stack.extend((child, False) for _, child in operands(free))
+
+    return open_, names
+
+# ----- Lowering ------------------------------------------------------------
+# Each compiler receives an open node and the `Lowering` for its operands,
+# and returns a closure from parameters to the realized runtime value. The
+# operand discipline matches the interpreter handlers: whatever a handler
+# yields is lowered strictly, whatever it wraps with `run` is lowered lazily.
+
+def compile_map(free, lowering):
+    value = lowering.strict(free.value.force())
+    function = lowering.continuation(free.func.force())
+    return lambda params: value(params).fmap(function(params))
+
+def compile_pure(free, lowering):
+    cls, value = free.cls, lowering.strict(free.value.force())
+    return lambda params: cls.pure(value(params))
+
+def compile_ap(free, lowering):
+    function = lowering.strict(free.ff.force())
+    value = lowering.lazy(free.fa.force())
+    return lambda params: function(params).ap(value(params))
+
+def compile_otherwise(free, lowering):
+    alter = lowering.strict(free.fa.force())
+    native = lowering.lazy(free.fb.force())
+    return lambda params: alter(params).otherwise(native(params))
+
+def compile_many(free, lowering):
+    cls, value = free.internal, lowering.lazy(free.v.force())
+    return lambda params: cls.many(value(params))
+
+def compile_some(free, lowering):
+    cls, value = free.internal, lowering.lazy(free.v.force())
+    return lambda params: cls.some(value(params))
+
+def compile_bind(free, lowering):
+    ma = lowering.strict(free.ma.force())
+    f = lowering.continuation(free.f.force())
+    return lambda params: ma(params).bind(f(params))
+
+def compile_extract(free, lowering):
+    wa = lowering.strict(free.wa.force())
+    return lambda params: wa(params).extract()
+
+def compile_duplicate(free, lowering):
+    wa = lowering.strict(free.wa.force())
+    return lambda params: wa(params).duplicate()
+
+def compile_compose(free, lowering):
+    fbc = lowering.strict(free.fbc.force())
+    fab = lowering.continuation(free.fab.force())
+    return lambda params: fbc(params).compose(fab(params))
+
+def compile_invert(free, lowering):
+    fab = lowering.strict(free.self.force())
+    return lambda params: fab(params).invert()
+
+def compile_combine(free, lowering):
+    a = lowering.strict(free.a.force())
+    b = lowering.lazy(free.b.force())
+    return lambda params: a(params).combine(b(params))
+
+def compile_inverse(free, lowering):
+    fab = lowering.strict(free.self.force())
+    return lambda params: fab(params).inverse()
+
+def compile_arr(free, lowering):
+    cls, fab = free.cls, lowering.strict(free.fab.force())
+    return lambda params: cls.arrow(delay(fab(params)))
+
+def compile_first(free, lowering):
+    cls, aab = free.cls, lowering.strict(free.aab.force())
+    return lambda params: cls.first(delay(aab(params)))
+
+def compile_left(free, lowering):
+    cls, aab = free.cls, lowering.strict(free.aab.force())
+    return lambda params: cls.left(delay(aab(params)))
+
+def compile_lowering(free, lowering):
+    """
+    Derived combinators are lowered once, by their interpreter handler,
+    and the lowered expression is compiled in their place.
+    """
+    lowered = HANDLERS[type(free)](free, run, None, None)
+    lowering.open |= _open(lowered)[0]
+    return lowering.strict(lowered)
+
+def compile_substitution(free, lowering):
+    """
+    Fallback for node types without a compiler: substitute the parameters
+    into the subtree and interpret it on every call.
+    """
+    def substitute(node, params):
+        if type(node) is Param:
+            return params[node.name]
+        if not is_syntax(node):
+            return node
+        return rebuild(node, {
+            name: substitute(child, params) for name, child in operands(node)
+        })
+
+    return lambda params: evaluate(substitute(free, params))
+
+COMPILERS = {
+    Map: compile_map,
+    Pure: compile_pure,
+    Ap: compile_ap,
+    Otherwise: compile_otherwise,
+    Many: compile_many,
+    Some: compile_some,
+    Return: compile_pure,
+    Bind: compile_bind,
+    Extract: compile_extract,
+    Duplicate: compile_duplicate,
+    Compose: compile_compose,
+    Invert: compile_invert,
+    Combine: compile_combine,
+    Inverse: compile_inverse,
+    Arr: compile_arr,
+    First: compile_first,
+    Left: compile_left,
+    Second: compile_lowering,
+    Split: compile_lowering,
+    Fanout: compile_lowering,
+    Right: compile_lowering,
+    PlusPlus: compile_lowering,
+    OrOr: compile_lowering,
+}
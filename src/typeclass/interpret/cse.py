@@ -0,0 +1,266 @@
+from dataclasses import dataclass, fields, is_dataclass
+from threading import Event, get_ident
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.typeclasses import symbols
+from typeclass.typeclasses.infix import Infix
+from typeclass.interpret.run import HANDLERS, register, trampoline
+from typeclass.interpret.syntax import is_syntax, operands, rebuild, size
+
+@dataclass
+class Shared:
+    """
+    A node reached through more than one parent, realized once per
+    evaluation.
+
+    Its value is kept in the `shared` table of the evaluation context, not
+    on the node, so evaluating the same tree again computes it again. Under
+    an `Env`, which memoizes every node, it is a plain indirection.
+    """
+    expression: Thunk
+
+@dataclass
+class Scope:
+    """
+    Root of a tree rewritten by `cse`: evaluated without a context, it
+    opens a `Sharing` one for its `Shared` nodes.
+    """
+    expression: Thunk
+
+class Sharing:
+    """
+    Evaluation context holding the values of `Shared` nodes for one
+    evaluation, and otherwise normalizing as `normalize` does.
+    """
+
+    def __init__(self):
+        self.shared = {}
+
+    def normalize(self, free, cofree):
+        return trampoline(free, cofree, self, HANDLERS)
+
+def handle_scope(free, run, cofree, env):
+    if env is None:
+        return Sharing().normalize(free.expression.force(), cofree)
+    return free.expression.force()
+
+class Pending:
+    """
+    Value of a `Shared` node in a `shared` table while one thread normalizes
+    its expression, as a blackhole: other threads reaching the node wait
+    for `done`, and the same thread reaching it again is a cycle.
+    """
+    __slots__ = ("owner", "done")
+
+    def __init__(self):
+        self.owner = get_ident()
+        self.done = Event()
+
+def handle_shared(free, run, cofree, env):
+    table = getattr(env, "shared", None)
+    if table is None:
+        return free.expression.force()
+
+    key = id(free)
+    while True:
+        entry = table.get(key)
+        if entry is None:
+            pending = Pending()
+            entry = table.setdefault(key, (free, pending))
+            if entry[1] is pending:
+                break
+        if type(entry[1]) is not Pending:
+            return entry[1]
+        if entry[1].owner == get_ident():
+            raise RuntimeError("Shared node depends on its own value")
+        entry[1].done.wait()
+
+    # No lock is held across the yield: the entry itself marks the node as
+    # taken, and is removed again if the normalization is abandoned.
+    try:
+        value = yield free.expression.force()
+    except BaseException:
+        del table[key]
+        pending.done.set()
+        raise
+    table[key] = (free, value)
+    pending.done.set()
+    return value
+
+register(Scope, handle_scope)
+register(Shared, handle_shared)
+
+class HashCons:
+    """
+    Interning table for syntax nodes.
+
+    Two nodes are identical when they have the same type, the same static
+    fields and identical operands. Syntax operands are compared by identity
+    once interned. Leaves are compared by type as well as value all the way
+    down: scalars by type and value, tuples and frozen dataclasses such as
+    `Just` by type and the keys of their parts, and anything else (lambdas,
+    lists, other runtime values) by identity. So `Just(1)`, `Just(True)`
+    and `Just(1.0)` stay distinct although they compare equal. Interning an expression returns
+    the canonical instance of every node in it, so structurally identical
+    subexpressions become the same object.
+
+    Attribute access builds interning symbols from `typeclass.typeclasses.symbols`:
+
+        h = HashCons()
+        (Just(1) |h.fmap| f) is (Just(1) |h.fmap| f)   # True
+    """
+
+    def __init__(self):
+        self.table = {}
+        self.hits = 0
+
+    def __getattr__(self, name):
+        symbol = getattr(symbols, name)
+        if not isinstance(symbol, Infix):
+            raise AttributeError(name)
+        return Infix(lambda left, right: self.intern(symbol.func(left, right)))
+
+    def intern(self, expression):
+        done = {}
+        stack = [(expression, False)]
+
+        while stack:
+            free, visited = stack.pop()
+
+            if id(free) in done:
+                continue
+
+            if not is_syntax(free):
+                done[id(free)] = free
+                continue
+
+            children = operands(free)
+
+            if not visited:
+                stack.append((free, True))
+                stack.extend((child, False) for _, child in children)
+                continue
+
+            changes = {
+                name: done[id(child)]
+                for name, child in children
+                if done[id(child)] is not child
+            }
+            node = rebuild(free, changes) if changes else free
+
+            key = self.key(node)
+            canonical = self.table.get(key)
+            if canonical is None:
+                canonical = self.table[key] = node
+            else:
+                self.hits += 1
+            done[id(free)] = canonical
+
+        return done[id(expression)]
+
+    def key(self, free):
+        parts = [type(free)]
+        for f in fields(free):
+            if not f.compare:
+                continue
+            value = getattr(free, f.name)
+            if isinstance(value, Thunk):
+                value = value.force()
+            parts.append((id, id(value)) if is_syntax(value) else leaf(value))
+        return tuple(parts)
+
+SCALARS = frozenset({int, bool, str, bytes, type(None)})
+
+INEXACT = frozenset({float, complex})
+
+# Deeper leaves are keyed by identity: they are only merged when they are
+# the same object.
+DEPTH = 32
+
+def leaf(value, depth=DEPTH):
+    """
+    Interning key of a leaf, tagged with the type of every part of it.
+    """
+    kind = type(value)
+    if kind in SCALARS:
+        return (kind, value)
+    if kind in INEXACT:
+        return (kind, repr(value))
+    if depth:
+        if kind is tuple:
+            return (kind, tuple(leaf(part, depth - 1) for part in value))
+        if kind is frozenset:
+            return (kind, frozenset(leaf(part, depth - 1) for part in value))
+        if is_dataclass(kind) and kind.__dataclass_params__.frozen:
+            return (kind, tuple(
+                leaf(getattr(value, f.name), depth - 1)
+                for f in fields(value)
+                if f.compare
+            ))
+    return (id, id(value))
+
+def cse(expression, report=None):
+    """
+    Common-subexpression elimination over a syntax DAG.
+
+    Structurally identical subexpressions are merged, and every merged node
+    reachable through more than one parent is wrapped in `Shared`, which
+    realizes it once per evaluation, the first time it is needed, and hands
+    the same value to every other use. The result is wrapped in a `Scope`
+    which gives each evaluation its own table of shared values. Run
+    `optimize` first: the rewrite rules do not look through `Shared`.
+
+    Pass an `optimize.Report` to collect the number of merged nodes.
+    """
+    canonical = HashCons().intern(expression)
+
+    parents, seen, stack = {}, set(), [canonical]
+    while stack:
+        free = stack.pop()
+        if id(free) in seen:
+            continue
+        seen.add(id(free))
+        for _, child in operands(free):
+            if is_syntax(child):
+                parents[id(child)] = parents.get(id(child), 0) + 1
+                stack.append(child)
+
+    done = {}
+    stack = [(canonical, False)]
+    while stack:
+        free, visited = stack.pop()
+
+        if id(free) in done:
+            continue
+
+        if not is_syntax(free):
+            done[id(free)] = free
+            continue
+
+        children = operands(free)
+
+        if not visited:
+            stack.append((free, True))
+            stack.extend((child, False) for _, child in children)
+            continue
+
+        changes = {
+            name: done[id(child)]
+            for name, child in children
+            if done[id(child)] is not child
+        }
+        node = rebuild(free, changes) if changes else free
+        done[id(free)] = Shared(delay(node)) if parents.get(id(free), 0) > 1 else node
+
+    result = done[id(canonical)]
+    after = size(result)
+    if any(count > 1 for count in parents.values()) and type(result) is not Scope:
+        result = Scope(delay(result))
+
+    if report is not None:
+        before = size(expression)
+        report.rewrites["common subexpression"] += before - size(canonical)
+        report.before += before
+        report.after += after
+
+    return result
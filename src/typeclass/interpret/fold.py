@@ -0,0 +1,108 @@
+from typeclass.typeclasses.applicative import Pure
+from typeclass.typeclasses.alternative import Empty, Otherwise
+from typeclass.typeclasses.monad import Return
+from typeclass.typeclasses.comonad import Duplicate
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.category import ID
+from typeclass.typeclasses.groupoid import Invert
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.monoid import MEmpty
+from typeclass.typeclasses.group import Inverse
+from typeclass.typeclasses.arrow import Arr, First, Second, Split, Fanout
+from typeclass.typeclasses.arrowchoice import Left, Right, PlusPlus, OrOr
+from typeclass.typeclasses.arrowapply import Apply
+from typeclass.typeclasses.arrowloop import Loop
+
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.syntax import is_syntax, operands, rebuild, size
+from typeclass.interpret.optimize import Report
+
+# Nodes whose interpretation only builds or combines runtime values: none
+# of them calls a function found in its operands. `Map`, `Ap`, `Bind` and
+# `Extract` run user code, and `Some`/`Many` unfold a recursion, so those
+# are always left to evaluation time.
+FOLDABLE = frozenset({
+    Pure,
+    Return,
+    Empty,
+    Otherwise,
+    MEmpty,
+    Combine,
+    Inverse,
+    Compose,
+    ID,
+    Invert,
+    Duplicate,
+    Arr,
+    First,
+    Second,
+    Split,
+    Fanout,
+    Left,
+    Right,
+    PlusPlus,
+    OrOr,
+    Apply,
+    Loop,
+})
+
+def fold(expression, report=None):
+    """
+    Partially evaluate `expression`, realizing its closed parts.
+
+    A `FOLDABLE` node whose operands are all runtime values is evaluated
+    once, here, and replaced by its value; its parent then sees a runtime
+    operand and may fold in turn. Whatever depends on user code or on a
+    `compile.Param` stays syntax, so the result is a smaller template for
+    repeated evaluation or compilation:
+
+        template = fold((Sequence |pure| 1) |combine| (param("xs") |fmap| inc))
+        plan = compile(template)
+
+    A fully closed expression folds to its value. A node whose evaluation
+    raises is left as syntax, so the error surfaces at evaluation time as
+    before.
+
+    Pass an `optimize.Report` to count folded nodes.
+    """
+    report = Report() if report is None else report
+    report.before += size(expression)
+
+    done = {}
+    stack = [(expression, False)]
+
+    while stack:
+        free, visited = stack.pop()
+
+        if id(free) in done:
+            continue
+
+        if not is_syntax(free):
+            done[id(free)] = free
+            continue
+
+        children = operands(free)
+
+        if not visited:
+            stack.append((free, True))
+            stack.extend((child, False) for _, child in children)
+            continue
+
+        changes = {
+            name: done[id(child)]
+            for name, child in children
+            if done[id(child)] is not child
+        }
+        node = rebuild(free, changes) if changes else free
+        done[id(free)] = node
+
+        if type(node) in FOLDABLE and not any(is_syntax(child) for _, child in operands(node)):
+            try:
+                done[id(free)] = evaluate(node)
+            except Exception:
+                continue
+            report.rewrites["constant fold"] += 1
+
+    folded = done[id(expression)]
+    report.after += size(folded)
+    return folded
@@ -0,0 +1,379 @@
+from dataclasses import dataclass, field
+from types import GeneratorType
+
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.category import ID
+from typeclass.typeclasses.arrow import Arr, First, Second, Split, Fanout
+from typeclass.typeclasses.arrowloop import Loop
+
+from typeclass.data.thunk import Feedback, NoFixpoint, UNSEEDED
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.syntax import is_syntax
+
+INPUT, APPLY, PAIR, PROJECT, FEEDBACK = "input", "apply", "pair", "project", "feedback"
+
+LIMIT = Feedback.LIMIT
+
+@dataclass
+class Node:
+    """
+    One operation of a dataflow graph.
+
+    `args` are the indices of the nodes it reads. `data` is the function of
+    an APPLY, the component of a PROJECT, and the seed of a FEEDBACK, whose
+    single argument is the node its value is fed back from.
+    """
+    op: str
+    args: tuple = ()
+    data: object = None
+
+@dataclass
+class Graph:
+    """
+    Dataflow graph of a function-arrow program.
+
+    Nodes are numbered in creation order and, apart from the sources of
+    FEEDBACK nodes, only ever read nodes created before them, so node order
+    is a topological order of every forward edge. Node 0 is the input.
+    """
+    nodes: list = field(default_factory=lambda: [Node(INPUT)])
+    output: int = 0
+
+    def add(self, op, args=(), data=None):
+        self.nodes.append(Node(op, args, data))
+        return len(self.nodes) - 1
+
+    def apply(self, function, wire):
+        return self.add(APPLY, (wire,), function)
+
+    def pair(self, a, b):
+        return self.add(PAIR, (a, b))
+
+    def project(self, wire, index):
+        return self.add(PROJECT, (wire,), index)
+
+    def feedback(self, seed=UNSEEDED):
+        """
+        A wire carrying a `Feedback` Thunk for the value of a later node,
+        with `seed`, if given, as its first estimate. Connect it with `tie`
+        once its source exists.
+        """
+        return self.add(FEEDBACK, (), seed)
+
+    def tie(self, wire, source):
+        self.nodes[wire].args = (source,)
+
+class NotACircuit(TypeError):
+    """
+    Raised when an expression is not a function-arrow program.
+    """
+
+# ----- Lowering ---------------------------------------------------------
+# A lowering is called as `lowering(graph, free, wire)`, where `wire`
+# carries the arrow's input, and returns the arrow's output wire. Like a
+# handler, it may be a generator which yields `(expression, wire)` for each
+# sub-arrow to lower and receives that sub-arrow's output wire back. Nodes
+# without a lowering are evaluated to a runtime arrow and applied as a
+# single opaque step.
+
+def arrow_class(free):
+    cls = free.cls
+    if not (isinstance(cls, type) and issubclass(cls, Morphism)):
+        raise NotACircuit(f"{cls!r} is not a function arrow")
+    return cls
+
+def lower_arr(graph, free, wire):
+    arrow_class(free)
+    fab = free.fab.force()
+    return graph.apply(evaluate(fab) if is_syntax(fab) else fab, wire)
+
+def lower_id(graph, free, wire):
+    arrow_class(free)
+    return wire
+
+def lower_compose(graph, free, wire):
+    middle = yield free.fab.force(), wire
+    return (yield free.fbc.force(), middle)
+
+def lower_first(graph, free, wire):
+    arrow_class(free)
+    b = yield free.aab.force(), graph.project(wire, 0)
+    return graph.pair(b, graph.project(wire, 1))
+
+def lower_second(graph, free, wire):
+    arrow_class(free)
+    b = yield free.aab.force(), graph.project(wire, 1)
+    return graph.pair(graph.project(wire, 0), b)
+
+def lower_split(graph, free, wire):
+    arrow_class(free)
+    b = yield free.aab.force(), graph.project(wire, 0)
+    d = yield free.acd.force(), graph.project(wire, 1)
+    return graph.pair(b, d)
+
+def lower_fanout(graph, free, wire):
+    arrow_class(free)
+    b = yield free.aab.force(), wire
+    c = yield free.acd.force(), wire
+    return graph.pair(b, c)
+
+def lower_loop(graph, free, wire):
+    arrow_class(free)
+    c = graph.feedback()
+    out = yield free.aab.force(), graph.pair(wire, c)
+    graph.tie(c, graph.project(out, 1))
+    return graph.project(out, 0)
+
+LOWERINGS = {
+    Arr: lower_arr,
+    ID: lower_id,
+    Compose: lower_compose,
+    First: lower_first,
+    Second: lower_second,
+    Split: lower_split,
+    Fanout: lower_fanout,
+    Loop: lower_loop,
+}
+
+def opaque(graph, free, wire):
+    arrow = evaluate(free) if is_syntax(free) else free
+    if not isinstance(arrow, Morphism):
+        raise NotACircuit(f"{arrow!r} is not a function arrow")
+    return graph.apply(arrow, wire)
+
+def lower(expression):
+    """
+    Lower an arrow expression over `Morphism` into a `Graph`.
+
+    The walk keeps its frames on an explicit stack, so arbitrarily deep
+    compositions lower without recursion. A sub-arrow reached twice with the
+    same input wire, such as a node shared by both sides of a `Fanout`, is
+    lowered once.
+    """
+    graph = Graph()
+    lowered = {}
+    frames, keys = [], []
+    request, value = (expression, 0), None
+
+    while True:
+        if request is not None:
+            free, wire = request
+            key = (id(free), wire)
+            lowering = LOWERINGS.get(type(free))
+
+            if key in lowered:
+                value = lowered[key]
+            elif lowering is None:
+                value = lowered[key] = opaque(graph, free, wire)
+            else:
+                value = lowering(graph, free, wire)
+                if type(value) is GeneratorType:
+                    frames.append(value)
+                    keys.append(key)
+                    value = None
+                else:
+                    lowered[key] = value
+
+        if not frames:
+            graph.output = value
+            return graph
+
+        try:
+            request = frames[-1].send(value)
+        except StopIteration as done:
+            frames.pop()
+            key, value = keys.pop(), done.value
+            lowered[key] = value
+            request = None
+
+# ----- Scheduling -------------------------------------------------------
+
+@dataclass
+class Schedule:
+    """
+    Evaluation order of a `Graph`.
+
+    `levels` lists the strongly connected components of the graph level by
+    level: every component reads only components of earlier levels, so the
+    components of one level are independent of each other. A component of
+    more than one node is a feedback loop, evaluated to a fixpoint.
+    """
+    levels: list
+
+    @property
+    def components(self):
+        return [component for level in self.levels for component in level]
+
+def dependencies(graph, index):
+    return graph.nodes[index].args
+
+def components(graph):
+    """
+    Strongly connected components, dependencies first (iterative Tarjan).
+    """
+    count = len(graph.nodes)
+    order, low = [None] * count, [0] * count
+    on_stack, stack, result = [False] * count, [], []
+    counter = 0
+
+    for root in range(count):
+        if order[root] is not None:
+            continue
+
+        work = [(root, 0)]
+        while work:
+            node, position = work.pop()
+
+            if position == 0:
+                order[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            args = dependencies(graph, node)
+            if position < len(args):
+                work.append((node, position + 1))
+                child = args[position]
+                if order[child] is None:
+                    work.append((child, 0))
+                elif on_stack[child]:
+                    low[node] = min(low[node], order[child])
+                continue
+
+            for child in args:
+                if on_stack[child]:
+                    low[node] = min(low[node], low[child])
+
+            if low[node] == order[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                result.append(tuple(sorted(component)))
+
+    return result
+
+def schedule(graph):
+    """
+    Order the graph's components into levels of independent work.
+    """
+    owner, level, levels = {}, {}, []
+
+    for component in components(graph):
+        depth = 0
+        for node in component:
+            for arg in dependencies(graph, node):
+                if owner.get(arg) is not None:
+                    depth = max(depth, level[owner[arg]] + 1)
+        for node in component:
+            owner[node] = component
+        level[component] = depth
+
+        while len(levels) <= depth:
+            levels.append([])
+        levels[depth].append(component)
+
+    return Schedule(levels)
+
+# ----- Execution --------------------------------------------------------
+
+class Circuit:
+    """
+    A lowered and scheduled arrow program, callable on its input.
+
+    Nodes are evaluated in schedule order with no recursion, so a circuit
+    of any depth runs on a flat stack. With an `executor`, independent
+    applications in one level, such as the two sides of a `Split` or
+    `Fanout`, run concurrently; the calling thread evaluates one of them
+    itself. A feedback loop is evaluated as in `Morphism.loop`: its wires
+    carry `Feedback` Thunks, tied after one pass if nothing forced them,
+    and otherwise iterated from their seeds until every value fed back
+    equals the estimate read, at most `limit` times.
+    """
+
+    def __init__(self, graph, executor=None, limit=LIMIT):
+        self.graph = graph
+        self.schedule = schedule(graph)
+        self.executor = executor
+        self.limit = limit
+        self.forked = 0
+
+    def __call__(self, a):
+        values = [None] * len(self.graph.nodes)
+        values[0] = a
+
+        for level in self.schedule.levels:
+            single = [component[0] for component in level if len(component) == 1]
+            applies = [node for node in single if self.graph.nodes[node].op == APPLY]
+
+            if self.executor is not None and len(applies) > 1:
+                self.concurrently(applies, values)
+                forked = set(applies)
+                single = [node for node in single if node not in forked]
+
+            for node in single:
+                self.step(node, values)
+            for component in level:
+                if len(component) > 1:
+                    self.fixpoint(component, values)
+
+        return values[self.graph.output]
+
+    def step(self, index, values, feedback=None):
+        node = self.graph.nodes[index]
+        op = node.op
+
+        if op is APPLY:
+            values[index] = node.data(values[node.args[0]])
+        elif op is PAIR:
+            values[index] = (values[node.args[0]], values[node.args[1]])
+        elif op is PROJECT:
+            values[index] = values[node.args[0]][node.data]
+        elif op is FEEDBACK:
+            if feedback is not None:
+                values[index] = feedback[index]
+            else:
+                values[index] = Feedback(node.data)
+                if node.args:
+                    values[index].tie(values[node.args[0]])
+
+    def concurrently(self, applies, values):
+        nodes = self.graph.nodes
+        *forked, last = applies
+        futures = [
+            (index, self.executor.submit(nodes[index].data, values[nodes[index].args[0]]))
+            for index in forked
+        ]
+        self.forked += len(futures)
+        self.step(last, values)
+        for index, future in futures:
+            values[index] = future.result()
+
+    def fixpoint(self, component, values):
+        nodes = self.graph.nodes
+        loops = [index for index in component if nodes[index].op is FEEDBACK]
+        feedback = {index: Feedback(nodes[index].data) for index in loops}
+
+        for _ in range(self.limit):
+            for index in component:
+                self.step(index, values, feedback)
+
+            fed = {index: values[nodes[index].args[0]] for index in loops}
+            if all(feedback[index].matches(fed[index]) for index in loops):
+                for index in loops:
+                    feedback[index].tie(fed[index])
+                return
+            feedback = {index: Feedback(fed[index]) for index in loops}
+
+        raise NoFixpoint(f"feedback did not settle after {self.limit} iterations")
+
+def circuit(expression, executor=None, limit=LIMIT):
+    """
+    Compile an arrow expression over `Morphism` into a `Morphism` running
+    its dataflow graph. See `Circuit`.
+    """
+    return Morphism(Circuit(lower(expression), executor, limit))
@@ -0,0 +1,26 @@
+from collections import Counter
+from functools import wraps
+
+LOWERED = Counter()
+
+def memoized(handler):
+    """
+    Lower each instance of a derived node at most once.
+
+    Derived combinators such as `second` or `|||` are interpreted by lowering
+    them into simpler syntax. The lowering depends only on the node's own
+    fields, never on `cofree` or `env`, so it is kept on the instance and
+    handed back on every later visit: evaluating the same arrow graph again
+    allocates no new lowering nodes or closures.
+
+    `LOWERED` counts the lowerings actually performed, keyed by node type.
+    """
+    @wraps(handler)
+    def handle(free, run, cofree, env):
+        cache = vars(free)
+        lowered = cache.get("_lowered")
+        if lowered is None:
+            lowered = cache["_lowered"] = handler(free, run, cofree, env)
+            LOWERED[type(free)] += 1
+        return lowered
+    return handle
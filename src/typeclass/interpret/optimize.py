@@ -0,0 +1,266 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+from typeclass.typeclasses.functor import Map
+from typeclass.typeclasses.applicative import Ap, Pure
+from typeclass.typeclasses.monad import Bind, Return
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.category import ID
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.monoid import MEmpty
+from typeclass.typeclasses.arrow import Arr
+
+from typeclass.data.thunk import delay
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.syntax import is_syntax, operands, rebuild, size
+
+@dataclass
+class Report:
+    """
+    What an `optimize` pass did: how often each rule fired, and the number
+    of syntax nodes before and after.
+    """
+    rewrites: Counter = field(default_factory=Counter)
+    before: int = 0
+    after: int = 0
+
+    @property
+    def fired(self):
+        return sum(self.rewrites.values())
+
+ENTER, EXIT, ALIAS = object(), object(), object()
+
+# Functions marked with `pure_function`, by id. The function is kept as
+# well, so an id reused after it is collected does not count as marked.
+PURE = {}
+
+def pure_function(function):
+    """
+    Mark `function` as free of effects, so `optimize` may call it while
+    rewriting, and return it.
+
+        @pure_function
+        def step(v):
+            return Just(v + 1)
+
+    Only calls to marked functions are folded by the left identity and
+    homomorphism laws: the call then runs once, in `optimize`, instead of
+    at each evaluation, and an exception it raises propagates from there.
+    """
+    PURE[id(function)] = function
+    return function
+
+def is_pure(function):
+    return PURE.get(id(function)) is function
+
+# Rewrites allowed at one position of the tree. A rule which calls user
+# code can return a node it applies to again, as `return x >>= f` does
+# when `f` recurses, so the chain is cut off after this many.
+LIMIT = 64
+
+def optimize(expression, report=None, limit=LIMIT):
+    """
+    Rewrite `expression` with the typeclass laws, oriented to shrink it.
+
+    The pass runs bottom-up until no rule applies and returns an expression
+    with the same meaning for lawful instances. It never runs the
+    interpreter on the tree itself; the only user code it calls early is
+    `f x` for the left identity and homomorphism laws, and only when `f` is
+    marked with `pure_function`. An exception raised by that call is not
+    caught. A position, and any syntax a rewrite built there, is rewritten
+    at most `limit` times, which stops a recursive `bind` from unfolding
+    forever.
+
+    Pass a `Report` to collect rewrite counts and node counts.
+    """
+    report = Report() if report is None else report
+    report.before += size(expression)
+
+    done, keep = {}, []
+    rewrites = {}
+    stack = [(ENTER, expression, None)]
+
+    while stack:
+        action, free, result = stack.pop()
+
+        if action is ALIAS:
+            done[id(free)] = (free, done[id(result)][1])
+            continue
+
+        if id(free) in done:
+            continue
+
+        if not is_syntax(free):
+            done[id(free)] = (free, free)
+            continue
+
+        children = operands(free)
+
+        if action is ENTER:
+            stack.append((EXIT, free, None))
+            stack.extend((ENTER, child, None) for _, child in children)
+            count = rewrites.get(id(free))
+            if count is not None:
+                for _, child in children:
+                    if id(child) not in done:
+                        rewrites.setdefault(id(child), count)
+            continue
+
+        changes = {
+            name: done[id(child)][1]
+            for name, child in children
+            if done[id(child)][1] is not child
+        }
+        node = rebuild(free, changes) if changes else free
+
+        count = rewrites.get(id(free), 0)
+        rewritten = rewrite(node, report) if count < limit else None
+        if rewritten is None:
+            done[id(free)] = (free, node)
+        else:
+            keep.append(node)
+            if id(rewritten) not in done:
+                rewrites[id(rewritten)] = count + 1
+            stack.append((ALIAS, free, rewritten))
+            stack.append((ENTER, rewritten, None))
+
+    optimized = done[id(expression)][1]
+    report.after += size(optimized)
+    return optimized
+
+def rewrite(free, report):
+    for name, rule in RULES.get(type(free), ()):
+        result = rule(free)
+        if result is not None:
+            report.rewrites[name] += 1
+            return result
+    return None
+
+class Pipeline:
+    """
+    The composition `then . first` of two single-argument functions.
+
+    Fusing a long chain nests pipelines inside each other. The first call
+    flattens the nesting into a tuple of stages, which are then applied in a
+    loop, so a fused chain of any length costs no Python stack. `between`,
+    when given, is applied to every intermediate result.
+    """
+
+    def __init__(self, first, then, between=None):
+        self.first = first
+        self.then = then
+        self.between = between
+        self.stages = None
+
+    def __call__(self, a):
+        if self.stages is None:
+            self.stages = self.flatten()
+
+        between = self.between
+        for stage in self.stages:
+            a = stage(a) if between is None else between(stage(a))
+        return a
+
+    def flatten(self):
+        stages, stack = [], [self]
+        while stack:
+            f = stack.pop()
+            if type(f) is Pipeline and f.between is self.between:
+                stack.append(f.then)
+                stack.append(f.first)
+            else:
+                stages.append(f)
+        return tuple(stages)
+
+# ----- Rules ---------------------------------------------------------------
+# Each rule inspects one node whose operands are already optimized and
+# returns its replacement, or None when it does not apply.
+
+def functor_composition(free):
+    """
+    fmap f (fmap g x) == fmap (f . g) x
+    """
+    inner = free.value.force()
+    if type(inner) is not Map:
+        return None
+
+    f, g = free.func.force(), inner.func.force()
+    if is_syntax(f) or is_syntax(g):
+        return None
+
+    return Map(delay(Pipeline(g, f, evaluate)), inner.value)
+
+def applicative_homomorphism(free):
+    """
+    pure f <*> pure x == pure (f x)
+    """
+    ff, fa = free.ff.force(), free.fa.force()
+    if type(ff) is not Pure or type(fa) is not Pure or ff.cls is not fa.cls:
+        return None
+
+    f, x = ff.value.force(), fa.value.force()
+    if is_syntax(f) or is_syntax(x) or not is_pure(f):
+        return None
+
+    return Pure(ff.cls, delay(f(x)))
+
+def monad_left_identity(free):
+    """
+    return x >>= f == f x
+    """
+    ma, f = free.ma.force(), free.f.force()
+    if type(ma) not in (Return, Pure) or is_syntax(f) or not is_pure(f):
+        return None
+
+    x = ma.value.force()
+    if is_syntax(x):
+        return None
+
+    return f(x)
+
+def category_identity(free):
+    """
+    id . f == f == f . id
+    """
+    fbc, fab = free.fbc.force(), free.fab.force()
+    if type(fbc) is ID:
+        return fab
+    if type(fab) is ID:
+        return fbc
+    return None
+
+def arrow_composition(free):
+    """
+    arr g . arr f == arr (g . f)
+    """
+    fbc, fab = free.fbc.force(), free.fab.force()
+    if type(fbc) is not Arr or type(fab) is not Arr or fbc.cls is not fab.cls:
+        return None
+
+    g, f = fbc.fab.force(), fab.fab.force()
+    if is_syntax(g) or is_syntax(f):
+        return None
+
+    return Arr(fbc.cls, delay(Pipeline(f, g, evaluate)))
+
+def monoid_identity(free):
+    """
+    mempty <> a == a == a <> mempty
+    """
+    a, b = free.a.force(), free.b.force()
+    if type(a) is MEmpty:
+        return b
+    if type(b) is MEmpty:
+        return a
+    return None
+
+RULES = {
+    Map: [("functor composition", functor_composition)],
+    Ap: [("applicative homomorphism", applicative_homomorphism)],
+    Bind: [("monad left identity", monad_left_identity)],
+    Compose: [
+        ("category identity", category_identity),
+        ("arrow composition", arrow_composition),
+    ],
+    Combine: [("monoid identity", monoid_identity)],
+}
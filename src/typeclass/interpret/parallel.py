@@ -0,0 +1,157 @@
+import pickle
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+
+from typeclass.typeclasses.applicative import Ap
+from typeclass.typeclasses.arrow import Split
+
+from typeclass.data.thunk import FutureThunk, Thunk
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import HANDLERS, evaluate, trampoline, normalize
+from typeclass.interpret.syntax import is_syntax
+from typeclass.interpret.annotate import annotate
+from typeclass.interpret.serialize import NotSerializable, dumps, loads
+
+# Annotated cost (see `interpret.annotate`) a branch must reach to be forked.
+# Node counts measure the size of a tree, not how long it takes: a single
+# `Just(i) |bind| fetch` costs 1 however slow `fetch` is, so by default
+# every independent branch is forked.
+THRESHOLD = 0
+
+class Parallel:
+    """
+    Evaluation context normalizing independent branches on an executor.
+
+        with ThreadPoolExecutor() as executor:
+            evaluate(expr, Parallel(executor))
+
+    The argument of an `Ap` is independent of its function, so when it is
+    syntax it is submitted to the executor before the function is
+    normalized, and the runtime receives a Thunk which joins the result. A left-nested chain
+    `pure f <*> a <*> b <*> c` therefore has all of its arguments in flight
+    at once. Arguments are evaluated speculatively: a runtime which never
+    forces its argument (`Nothing <*> x`) leaves the work done for nothing.
+
+    `Split` over `Morphism`, and `Fanout`, which lowers to it, applies both
+    arrows concurrently.
+
+    Every such branch is forked by default. Pass a `threshold` to fork only
+    branches whose estimated cost (see `interpret.annotate`) reaches it,
+    which keeps many small CPU-bound branches off the executor.
+
+    With a `ProcessPoolExecutor` branches are shipped in the encoding of
+    `interpret.serialize`; branches holding unregistered functions cannot be
+    encoded and are evaluated in the calling thread, as are branches the
+    worker fails to load, such as functions it cannot import. A join whose work has not
+    started yet cancels it and runs it in place, so nested forks cannot
+    deadlock a saturated pool.
+
+    The values of `cse.Shared` nodes are kept in `shared`, so like an `Env`
+    a `Parallel` should be used for one evaluation.
+    """
+
+    def __init__(self, executor, threshold=THRESHOLD):
+        self.executor = executor
+        self.threshold = threshold
+        self.processes = isinstance(executor, ProcessPoolExecutor)
+        self.handlers = {Ap: self.handle_ap, Split: self.handle_split}
+        self.costs = {}
+        self.shared = {}
+        self.forked = 0
+        self.lock = Lock()
+
+    def __repr__(self):
+        return f"Parallel({self.executor!r}, threshold={self.threshold}, forked={self.forked})"
+
+    def get(self, node):
+        return self.handlers.get(node) or HANDLERS.get(node)
+
+    def normalize(self, free, cofree):
+        return trampoline(free, cofree, self, self)
+
+    def worth(self, free):
+        if not is_syntax(free):
+            return False
+        if self.threshold <= 0:
+            return True
+
+        entry = self.costs.get(id(free))
+        if entry is None:
+            entry = self.costs[id(free)] = (free, annotate(free).annotation.cost)
+        return entry[1] >= self.threshold
+
+    def fork(self, call, *args):
+        """
+        Submit `call(*args)` and return a `FutureThunk` joining its result,
+        or None when the work cannot be shipped to the executor.
+        """
+        if self.processes:
+            try:
+                pickle.dumps((call, args))
+            except Exception:
+                return None
+
+        future = FutureThunk(self.executor, call, *args)
+        with self.lock:
+            self.forked += 1
+        return future
+
+    def ship(self, free, cofree):
+        """
+        Fork the evaluation of `free` to a worker process, if it encodes.
+
+        If the worker cannot load it, `free` is normalized by the thread
+        joining the result instead.
+        """
+        try:
+            data = dumps(free)
+        except NotSerializable:
+            return None
+
+        future = self.fork(evaluate_shipped, data)
+        if future is None:
+            return None
+
+        def join():
+            loaded, value = future.force()
+            return value if loaded else normalize(free, cofree, self)
+        return Thunk(join)
+
+    def handle_ap(self, free, run, cofree, env):
+        fa = free.fa.force()
+
+        future = None
+        if self.worth(fa):
+            future = self.ship(fa, cofree) if self.processes else self.fork(normalize, fa, cofree, self)
+
+        value = future if future is not None else run(fa, cofree, env)
+        function = yield free.ff.force()
+        return function.ap(value)
+
+    def handle_split(self, free, run, cofree, env):
+        aab, acd = free.aab.force(), free.acd.force()
+        morphism = isinstance(free.cls, type) and issubclass(free.cls, Morphism)
+
+        if not (morphism and self.worth(aab) and self.worth(acd)):
+            return HANDLERS[Split](free, run, cofree, env)
+
+        f = yield aab
+        g = yield acd
+
+        def both(pair):
+            a, c = pair
+            future = self.fork(f, a)
+            d = g(c)
+            return (future.force() if future is not None else f(a)), d
+        return free.cls(both)
+
+def evaluate_shipped(data):
+    """
+    Evaluate an encoded branch in a worker process, returning `(True, value)`,
+    or `(False, None)` when it cannot be loaded there.
+    """
+    try:
+        expression = loads(data)
+    except Exception:
+        return False, None
+    return True, evaluate(expression)
@@ -0,0 +1,308 @@
+from collections import Counter
+from inspect import isgeneratorfunction
+from threading import Lock, local
+from time import perf_counter_ns
+
+from typeclass.typeclasses.functor import Map
+from typeclass.typeclasses.applicative import Ap, Pure
+from typeclass.typeclasses.alternative import Empty, Otherwise, Some, Many
+from typeclass.typeclasses.monad import Bind, Return
+from typeclass.typeclasses.comonad import Extract, Duplicate
+from typeclass.typeclasses.semigroupoid import Compose
+from typeclass.typeclasses.category import ID
+from typeclass.typeclasses.groupoid import Invert
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.monoid import MEmpty
+from typeclass.typeclasses.group import Inverse
+from typeclass.typeclasses.arrow import Arr, First
+from typeclass.typeclasses.arrowchoice import Left
+from typeclass.typeclasses.arrowapply import Apply
+from typeclass.typeclasses.arrowloop import Loop
+
+from typeclass.data.thunk import Thunk, Strict
+from typeclass.interpret.run import HANDLERS, trampoline
+
+# Runtime method each node type ends in, used to label the runtime class.
+METHODS = {
+    Map: "fmap",
+    Pure: "pure",
+    Ap: "ap",
+    Empty: "empty",
+    Otherwise: "otherwise",
+    Many: "many",
+    Some: "some",
+    Return: "pure",
+    Bind: "bind",
+    Extract: "extract",
+    Duplicate: "duplicate",
+    Compose: "compose",
+    ID: "id",
+    Invert: "invert",
+    Combine: "combine",
+    MEmpty: "mempty",
+    Inverse: "inverse",
+    Arr: "arrow",
+    First: "first",
+    Left: "left",
+    Apply: "app",
+    Loop: "loop",
+}
+
+class Stat:
+    __slots__ = ("count", "own", "cumulative", "thunks")
+
+    def __init__(self):
+        self.count = 0
+        self.own = 0
+        self.cumulative = 0
+        self.thunks = 0
+
+class Counting:
+    """
+    Counts Thunk allocations for the `Profiler` normalizing on the current
+    thread. The counting constructors are installed while any profiler is
+    normalizing, and the saved ones are put back when the last finishes.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.users = 0
+        self.saved = None
+        self.current = local()
+
+    def enter(self, profiler):
+        with self.lock:
+            if not self.users:
+                self.saved = thunk, strict = Thunk.__init__, Strict.__init__
+                Thunk.__init__ = self.counting(thunk)
+                Strict.__init__ = self.counting(strict)
+            self.users += 1
+        previous = getattr(self.current, "profiler", None)
+        self.current.profiler = profiler
+        return previous
+
+    def leave(self, previous):
+        self.current.profiler = previous
+        with self.lock:
+            self.users -= 1
+            if not self.users:
+                Thunk.__init__, Strict.__init__ = self.saved
+                self.saved = None
+
+    def counting(self, init):
+        current = self.current
+
+        def count(thunk, value):
+            profiler = getattr(current, "profiler", None)
+            if profiler is not None:
+                profiler.state.thunks += 1
+            init(thunk, value)
+        return count
+
+COUNTING = Counting()
+
+class State(local):
+    """
+    The part of a profiler's state which follows one thread's evaluation.
+    """
+
+    def __init__(self):
+        self.path = []
+        self.active = Counter()
+        self.nested = [[0, 0]]
+        self.thunks = 0
+        self.last = None
+
+class Profiler:
+    """
+    Per-node profiler for the interpreter, used as an evaluation context.
+
+    Passed as the `env` of an evaluation, it dispatches every node to an
+    instrumented wrapper of its handler in `HANDLERS`, which it leaves as it
+    is: evaluations without it and handlers registered meanwhile are
+    unaffected. The Thunk constructors count allocations while any profiler
+    is normalizing (see `Counting`), each charged to the profiler of the
+    allocating thread, and the interpreter path is kept per thread.
+
+        profiler = Profiler()
+        evaluate(expr, profiler)
+        print(profiler.report())
+        profiler.dump("expr.folded")
+
+    Statistics are kept per node type (`Map`, `Bind`, `Fanout`, ...) and per
+    runtime method (`Maybe.fmap`, `Parser.bind`, ...): the number of calls,
+    self time, cumulative time and the Thunks allocated in self time. Time
+    spent normalizing an operand or running a continuation is charged to the
+    node doing that work, not to the node waiting on it. A runtime method row
+    is the part of its node's self time spent in the final runtime call, so
+    the two kinds of row are two views of the same time.
+
+    Stacks are the logical interpreter stacks: a node waiting for its
+    operand stays on the stack while the operand is normalized, even though
+    the trampoline has no Python frame for it. `collapsed()` renders them in
+    the folded format read by flamegraph tools, weighted in nanoseconds.
+    """
+
+    def __init__(self, clock=perf_counter_ns):
+        self.clock = clock
+        self.stats = {}
+        self.stacks = Counter()
+        self.handlers = {}
+        self.state = State()
+
+    def get(self, node):
+        handler = HANDLERS.get(node)
+        if handler is None:
+            return None
+        handle = self.handlers.get(node)
+        if handle is None or handle.__wrapped__ is not handler:
+            handle = self.handlers[node] = self.instrument(node, handler)
+        return handle
+
+    def normalize(self, free, cofree):
+        previous = COUNTING.enter(self)
+        try:
+            return trampoline(free, cofree, self, self)
+        finally:
+            COUNTING.leave(previous)
+
+    def instrument(self, node, handler):
+        name = node.__name__
+        method = METHODS.get(node)
+
+        if isgeneratorfunction(handler):
+            def handle(free, run, cofree, env):
+                return self.frame(name, method, free, handler(free, run, cofree, env))
+        else:
+            def handle(free, run, cofree, env):
+                self.enter(name)
+                start = self.clock()
+                try:
+                    result = self.segment(handler, (free, run, cofree, env))
+                    if method is not None:
+                        self.charge(runtime(free, None, method), self.state.last)
+                    else:
+                        self.charge(None, self.state.last)
+                    return result
+                finally:
+                    self.leave(name, start)
+
+        handle.__wrapped__ = handler
+        return handle
+
+    def frame(self, name, method, free, frame):
+        self.enter(name)
+        start = self.clock()
+        received, value = None, None
+
+        try:
+            while True:
+                try:
+                    free_ = self.segment(frame.send, (value,))
+                except StopIteration as done:
+                    if method is not None:
+                        self.charge(runtime(free, received, method), self.state.last)
+                    else:
+                        self.charge(None, self.state.last)
+                    return done.value
+
+                self.charge(None, self.state.last)
+                value = yield free_
+                if received is None:
+                    received = (value,)
+        finally:
+            self.leave(name, start)
+
+    def segment(self, call, args):
+        """
+        Run one uninterrupted slice of a handler, measuring self time and
+        Thunk allocations net of any nested interpreter work.
+        """
+        state = self.state
+        state.nested.append([0, 0])
+        start, thunks = self.clock(), state.thunks
+        try:
+            return call(*args)
+        finally:
+            elapsed, allocated = self.clock() - start, state.thunks - thunks
+            inner = state.nested.pop()
+            outer = state.nested[-1]
+            outer[0] += elapsed
+            outer[1] += allocated
+            state.last = (elapsed - inner[0], allocated - inner[1], elapsed)
+
+    def enter(self, name):
+        state = self.state
+        state.path.append(name)
+        state.active[name] += 1
+        self.stat(name).count += 1
+
+    def leave(self, name, start):
+        state = self.state
+        state.active[name] -= 1
+        if not state.active[name]:
+            self.stat(name).cumulative += self.clock() - start
+        state.path.pop()
+
+    def charge(self, label, cost):
+        own, thunks, elapsed = cost
+        path = self.state.path
+        stat = self.stat(path[-1])
+        stat.own += own
+        stat.thunks += thunks
+
+        if label is None:
+            self.stacks[tuple(path)] += own
+            return
+
+        stat = self.stat(label)
+        stat.count += 1
+        stat.own += own
+        stat.cumulative += elapsed
+        stat.thunks += thunks
+        self.stacks[(*path, label)] += own
+
+    def stat(self, label):
+        try:
+            return self.stats[label]
+        except KeyError:
+            self.stats[label] = stat = Stat()
+            return stat
+
+    def report(self, limit=None):
+        """
+        Flat report, heaviest self time first.
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1].own, reverse=True)
+        lines = [f"{'label':<24} {'count':>9} {'self ms':>10} {'cum ms':>10} {'thunks':>9}"]
+        for label, stat in rows[:limit]:
+            lines.append(
+                f"{label:<24} {stat.count:>9} {stat.own / 1e6:>10.3f} "
+                f"{stat.cumulative / 1e6:>10.3f} {stat.thunks:>9}"
+            )
+        return "\n".join(lines)
+
+    def collapsed(self):
+        """
+        Stacks in the folded `frame;frame;frame weight` format.
+        """
+        return "\n".join(
+            f"{';'.join(stack)} {weight}"
+            for stack, weight in sorted(self.stacks.items())
+            if weight > 0
+        )
+
+    def dump(self, path):
+        with open(path, "w") as file:
+            file.write(self.collapsed() + "\n")
+
+def runtime(free, received, method):
+    """
+    `Class.method` label for the runtime call a node ended in.
+    """
+    owner = getattr(free, "cls", None) or getattr(free, "internal", None)
+    if owner is None:
+        owner = type(received[0]) if received else type(free)
+    elif not isinstance(owner, type):
+        owner = type(owner)
+    return f"{owner.__name__}.{method}"
@@ -1,26 +1,88 @@
-from typeclass.typeclasses.functor import Map 
-from typeclass.typeclasses.applicative import Ap, Pure
-from typeclass.typeclasses.alternative import Otherwise, Empty, Some, Many
-from typeclass.typeclasses.monad import Bind, Return
-from typeclass.typeclasses.comonad import Extract, Duplicate
-from typeclass.typeclasses.semigroupoid import Compose
-from typeclass.typeclasses.category import ID
-from typeclass.typeclasses.groupoid import Invert
-from typeclass.typeclasses.semigroup import Combine
-from typeclass.typeclasses.monoid import MEmpty
-from typeclass.typeclasses.group import Inverse
-from typeclass.typeclasses.arrow import Arr, First, Second, Split, Fanout
-from typeclass.typeclasses.arrowchoice import Left, Right, PlusPlus, OrOr
-from typeclass.typeclasses.arrowapply import Apply
-
-from typeclass.data.either import Left as ELeft, Right as ERight
-from typeclass.data.thunk import Thunk, suspend, delay, resume
-
-def interpret(expression):
-    return run(expression, None, None)
-
-def evaluate(expression):
-    return interpret(expression).force()
+from types import GeneratorType
+
+from typeclass.typeclasses.functor.interpret import HANDLERS as FUNCTOR
+from typeclass.typeclasses.applicative.interpret import HANDLERS as APPLICATIVE
+from typeclass.typeclasses.alternative.interpret import HANDLERS as ALTERNATIVE
+from typeclass.typeclasses.monad.interpret import HANDLERS as MONAD
+from typeclass.typeclasses.comonad.interpret import HANDLERS as COMONAD
+from typeclass.typeclasses.semigroupoid.interpret import HANDLERS as SEMIGROUPOID
+from typeclass.typeclasses.category.interpret import HANDLERS as CATEGORY
+from typeclass.typeclasses.groupoid.interpret import HANDLERS as GROUPOID
+from typeclass.typeclasses.semigroup.interpret import HANDLERS as SEMIGROUP
+from typeclass.typeclasses.monoid.interpret import HANDLERS as MONOID
+from typeclass.typeclasses.group.interpret import HANDLERS as GROUP
+from typeclass.typeclasses.arrow.interpret import HANDLERS as ARROW
+from typeclass.typeclasses.arrowchoice.interpret import HANDLERS as ARROWCHOICE
+from typeclass.typeclasses.arrowapply.interpret import HANDLERS as ARROWAPPLY
+from typeclass.typeclasses.arrowloop.interpret import HANDLERS as ARROWLOOP
+
+from typeclass.data.thunk import Thunk
+
+HANDLERS = {}
+for group in (
+    FUNCTOR,
+    APPLICATIVE,
+    ALTERNATIVE,
+    MONAD,
+    COMONAD,
+    SEMIGROUPOID,
+    CATEGORY,
+    GROUPOID,
+    SEMIGROUP,
+    MONOID,
+    GROUP,
+    ARROW,
+    ARROWCHOICE,
+    ARROWAPPLY,
+    ARROWLOOP,
+):
+    HANDLERS.update(group)
+
+def register(node, handler):
+    """
+    Install `handler` as the interpretation of syntax nodes of type `node`.
+
+    A handler is called as `handler(free, run, cofree, env)`. It either
+    returns its result directly, or is a generator which yields each operand
+    it needs realized and receives the realized value back before returning.
+    Results which are themselves syntax are normalized in turn.
+
+    Dispatch is keyed on the exact type of the node, so subclasses of an
+    existing node must be registered explicitly.
+    """
+    HANDLERS[node] = handler
+
+def interpret(expression, env=None):
+    return run(expression, None, env)
+
+def evaluate(expression, env=None):
+    return normalize(expression, None, env)
+
+class Env:
+    """
+    Evaluation context memoizing normalized nodes by identity.
+
+    Pass one `Env` to `evaluate` and every syntax node reached through more
+    than one parent within that evaluation, such as the same operand shared
+    by two `Ap` branches or the `aab` reused by an arrow lowering, is
+    normalized once. Nodes built fresh inside continuations are distinct
+    objects and are normalized as usual; intern them with
+    `interpret.cse.HashCons` to share structurally identical subtrees too.
+
+    The table keeps every node it has seen alive, so use a new `Env` for
+    each evaluation.
+    """
+
+    def __init__(self):
+        self.memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"Env(hits={self.hits}, misses={self.misses})"
+
+    def normalize(self, free, cofree):
+        return memoized(free, cofree, self)
 
 def run(free, cofree, env):
     """
@@ -32,7 +94,7 @@ def run(free, cofree, env):
     Execution model:
 
         syntax node
-        → interpreter pattern match
+        → handler lookup on type(node)
         → runtime method call
         → possibly another syntax expression
         → interpreter normalization
@@ -43,7 +105,9 @@ def run(free, cofree, env):
     repeatedly normalizes until a realized value is obtained.
 
     All results are returned wrapped in `Thunk` so evaluation remains delayed
-    until the final `.force()` boundary.
+    until the final `.force()` boundary. Forcing the thunk runs `normalize`,
+    which walks the tree with an explicit continuation stack, so arbitrarily
+    deep expressions are evaluated in constant Python stack.
 
     Parameters
     ----------
@@ -51,282 +115,130 @@ def run(free, cofree, env):
         The syntax node being runed.
 
     cofree:
-        Reserved for future extensions (e.g. annotated syntax trees).
+        None, or the annotated tree built by `interpret.annotate`.
 
     env:
-        Reserved for environment-based interpreters.
+        None, or an evaluation context: an `Env` memoizing normalized nodes,
+        or an `interpret.parallel.Parallel` running branches concurrently.
 
     Returns
     -------
     Thunk
         A delayed runtime value.
     """
+    return Thunk(lambda: normalize(free, cofree, env))
 
-    match free:
-
-        # ----- Functor ---------------------------------------------------------
-        # Implements fmap by runing both the function and value, then
-        # delegating to the runtime Functor implementation.
-
-        case Map(function, value):
-            value = run(value.force(), cofree, env).force()
-            function = run(function.force(), cofree, env)
-
-            def k(a):
-                return run(function.force()(a), cofree, env).force()
-
-            return suspend(value.fmap, delay(k))
-
-        # ----- Applicative -----------------------------------------------------
-        # Implements fmap by runing both the function and value, then
-        # delegating to the runtime Functor implementation.
-            
-        case Pure(cls, value):
-            value = run(value.force(), cofree, env).force()
-            return suspend(cls.pure, value)
-
-        case Ap(function, value):
-            function = run(function.force(), cofree, env).force()
-            value    = run(value.force(), cofree, env)
-            return suspend(function.ap, value)
-
-        # ----- Alternative -----------------------------------------------------
-        # Implements empty, otherwise, and the derived combinators some/many.
-        # some/many are lowered into pure/ap/otherwise expressions.
-
-        case Empty(cls):
-            return suspend(cls.empty)
-
-        case Otherwise(alter, native):
-            alter  = run(alter.force(), cofree, env).force()
-            native = run(native.force(), cofree, env)
-            return suspend(alter.otherwise, native)
-        
-        case Many(cls, value):
-            value = run(value.force(), None, None)
-            return suspend(cls.many, value)
-
-        case Some(cls, value):
-            value = run(value.force(), None, None)
-            return suspend(cls.some, value)
-
-        # ----- Monad -----------------------------------------------------------
-        # Implements empty, otherwise, and the derived combinators some/many.
-        # some/many are lowered into pure/ap/otherwise expressions.
-
-        case Return(cls, value):
-            value = run(value.force(), cofree, env).force()
-            return suspend(cls.pure, value)
-
-        case Bind(ma, f):
-            ma = run(ma.force(), cofree, env).force()
-            f = run(f.force(), cofree, env)
-
-            def k(a):
-                return run(f.force()(a), cofree, env).force()
-
-            return suspend(ma.bind, delay(k))
-
-        # ----- Comonad ---------------------------------------------------------
-        # Core Comonad operations. `extend` is derived and lowered through
-        # `duplicate` and `fmap`, so only extract and duplicate are primitive.
-
-        case Extract(wa):
-            wa = run(wa.force(), cofree, env).force()
-            return suspend(wa.extract)
-
-        case Duplicate(wa):
-            wa = run(wa.force(), cofree, env).force()
-            return suspend(wa.duplicate)
-
-        # ----- Semigroupoid -----------------------------------------------------
-        # Sequential composition of morphisms.
-
-        case Compose(fbc, fab):
-            fbc = run(fbc.force(), cofree, env).force()
-            fab = run(fab.force(), cofree, env)
-
-            def k(a):
-                return run(fab.force()(a), cofree, env).force()
-
-            return suspend(fbc.compose, delay(k))
-
-        # ----- Category ---------------------------------------------------------
-        # Identity morphism.
-
-        case ID(cls):
-            return suspend(cls.id)
-
-        # ----- Groupoid ---------------------------------------------------------
-        # Identity morphism.
-
-        case Invert(fab):
-            fab = run(fab.force(), cofree, env).force()
-            return suspend(fab.invert)
-
-        # ----- Semigroup --------------------------------------------------------
-        # Binary associative combination.
-
-        case Combine(a, b):
-            a = run(a.force(), cofree, env).force()
-            b = run(b.force(), cofree, env)
-
-            return suspend(a.combine, b)
-
-        # ----- Monoid -----------------------------------------------------------
-        # Identity element for a Semigroup.
-
-        case MEmpty(cls):
-            return suspend(cls.mempty)
-
-        # ----- Group ------------------------------------------------------------
-        # Inversion operation for Group structures.
-
-        case Inverse(fab):
-            fab = run(fab.force(), cofree, env).force()
-
-            return suspend(fab.inverse)
-
-        # ----- Arrow ------------------------------------------------------------
-        # Core Arrow operations and derived combinators expressed in terms of
-        # arr and first. Derived operations are lowered into simpler Arrow
-        # expressions and reruned.
-
-        case Arr(cls, fab):
-            def k(a):
-                return run(fab.force(), cofree, env).force()(a)
-            return suspend(cls.arrow, delay(k))
-
-        case First(cls, aab):
-            def k(a):
-                return run(aab.force(), cofree, env).force()(a)
-            return suspend(cls.first, delay(k))
+def normalize(free, cofree, env):
+    """
+    Trampoline driving handler frames until a runtime value is obtained.
+
+    Each syntax node is dispatched through `HANDLERS` on its exact type. A
+    generator handler yields the operand it needs realized before it can call
+    into the runtime, receives the realized value back, and finally returns
+    its result. A result which is itself syntax (e.g. a lowered Arrow
+    combinator) is normalized in place of the finished frame, so lowering
+    behaves as a tail call.
+
+    Pending frames live on an explicit list rather than on the Python stack:
+    a left-nested chain of ten thousand `|bind|` nodes costs ten thousand list
+    entries, not ten thousand interpreter frames. A right-nested chain, whose
+    continuations build the next `|bind|`, runs in constant stack when the
+    runtime returns the continuation's result as its own, as `Maybe` and
+    `Either` do: the handler hands that syntax back as a tail call. Other
+    runtimes normalize each continuation result in a nested `normalize`.
+
+    An `env` decides how it is normalized: `Env` memoizes, and other
+    contexts such as `interpret.parallel.Parallel` supply their own
+    handlers to `trampoline`.
+    """
+    if env is not None:
+        return env.normalize(free, cofree)
+    return trampoline(free, cofree, None, HANDLERS)
 
-        case Second(cls, aab):
-            def swap(pair):
-                x, y = pair
-                return (y, x)
+def trampoline(free, cofree, env, handlers):
+    """
+    The `normalize` loop over an explicit table of `handlers`, which only
+    needs a `get(type)` method.
 
-            arrswap = delay(Arr(cls, delay(swap)))
-            first   = delay(First(cls, aab))
+    If normalizing fails, the handler frames still pending are closed at
+    once, so one which holds a claim across a `yield`, such as
+    `cse.handle_shared`, gives it up before the error propagates.
+    """
+    stack = []
+    value = None
+
+    try:
+        while True:
+            handler = handlers.get(type(free))
+
+            if handler is not None:
+                frame = handler(free, run, cofree, env)
+                if type(frame) is not GeneratorType:
+                    free = frame
+                    continue
+                stack.append(frame)
+                value = None
+            elif stack:
+                value = free
+            else:
+                return free
+
+            try:
+                free = stack[-1].send(value)
+            except StopIteration as done:
+                stack.pop()
+                free = done.value
+    except BaseException:
+        while stack:
+            stack.pop().close()
+        raise
+
+def memoized(free, cofree, env):
+    """
+    `normalize` recording the value of every node it finishes in `env`.
 
-            one  = delay(Compose(first, arrswap))
-            comp = Compose(arrswap, one)
-
-            return resume(run, comp, cofree, env)
-
-        case Split(cls, aab, acd):
-            first_  = delay(First(cls, aab))
-            second_ = delay(Second(cls, acd))
-
-            comp = Compose(second_, first_)
-            return resume(run, comp, cofree, env)
-
-        case Fanout(cls, aab, aac):
-            def duplicate(a):
-                return (a, a)
-            
-            arrduplicate = delay(Arr(cls, delay(duplicate)))
-            split = delay(Split(cls, aab, aac))
-            comp = Compose(split, arrduplicate)
-
-            return resume(run, comp, cofree, env)
-
-        # ----- ArrowChoice  -----------------------------------------------------
-        # Core Arrow operations and derived combinators expressed in terms of
-        # arr and first. Derived operations are lowered into simpler Arrow
-        # expressions and reruned.
-
-        case Left(cls, aab):
-            def k(a):
-                return run(aab.force(), cofree, env).force()(a)
-            return suspend(cls.left, delay(k))
-
-        case Right(cls, aab):
-            def swap(e):
-                match e:
-                    case ELeft(x):
-                        return ERight(x)
-                    case ERight(x):
-                        return ELeft(x)
-
-            arrswap = delay(Arr(cls, delay(swap)))
-            left_   = delay(Left(cls, aab))
-
-            one  = delay(Compose(left_, arrswap))
-            comp = Compose(arrswap, one)
-
-            return resume(run, comp, cofree, env)
-
-        case PlusPlus(cls, aab, acd):
-            left_  = delay(Left(cls, aab))
-            right_ = delay(Right(cls, acd))
-            comp   = Compose(right_, left_)
-            return resume(run, comp, cofree, env)
-
-        case OrOr(cls, aab, acb):
-            def merge(e):
-                match e:
-                    case ELeft(b):
-                        return b
-                    case ERight(b):
-                        return b
-
-            ppg = delay(PlusPlus(cls, aab, acb))
-            arrmerge = delay(Arr(cls, delay(merge)))
-
-            comp = Compose(arrmerge, ppg)
-            return resume(run, comp, cofree, env)
-
-        # ----- ArrowApply  -----------------------------------------------------
-        # Dynamic arrow application. Allows an arrow produced at runtime to be
-        # immediately applied.
-
-        case Apply(cls):
-            return resume(run, cls.app(), cofree, env)
-
-        # ----- Base ------------------------------------------------------------
-        # Base case: already a runtime value.
-
-        case _:
-            return Thunk(lambda: free)
-
-## from typeclass.typeclasses.functor.interpret import HANDLERS as FUNCTOR
-## from typeclass.typeclasses.applicative.interpret import HANDLERS as APPLICATIVE
-## from typeclass.typeclasses.alternative.interpret import HANDLERS as ALTERNATIVE
-## from typeclass.typeclasses.monad.interpret import HANDLERS as MONAD
-## from typeclass.typeclasses.comonad.interpret import HANDLERS as COMONAD
-## from typeclass.typeclasses.semigroupoid.interpret import HANDLERS as SEMIGROUPOID
-## from typeclass.typeclasses.category.interpret import HANDLERS as CATEGORY
-## from typeclass.typeclasses.groupoid.interpret import HANDLERS as GROUPOID
-## from typeclass.typeclasses.semigroup.interpret import HANDLERS as SEMIGROUP
-## from typeclass.typeclasses.monoid.interpret import HANDLERS as MONOID
-## from typeclass.typeclasses.group.interpret import HANDLERS as GROUP
-## from typeclass.typeclasses.arrow.interpret import HANDLERS as ARROW
-## from typeclass.typeclasses.arrowchoice.interpret import HANDLERS as ARROWCHOICE
-## from typeclass.typeclasses.arrowapply.interpret import HANDLERS as ARROWAPPLY
-## 
-## HANDLERS = {}
-## for group in (
-##     FUNCTOR,
-##     APPLICATIVE,
-##     ALTERNATIVE,
-##     MONAD,
-##     COMONAD,
-##     SEMIGROUPOID,
-##     CATEGORY,
-##     GROUPOID,
-##     SEMIGROUP,
-##     MONOID,
-##     GROUP,
-##     ARROW,
-##     ARROWCHOICE,
-##     ARROWAPPLY,
-## ):
-##     HANDLERS.update(group)
-## 
-## def run(expr, cofree=None, env=None):
-##     handler = HANDLERS.get(type(expr))
-##     if handler is None:
-##         return expr
-##     return handler(expr, run, cofree, env)
+    Each frame carries the ids of the nodes whose value it produces: its
+    own node, plus any node which lowered into it as a tail call.
+    """
+    memo = env.memo
+    stack = []
+    pending = []
+    value = None
+
+    while True:
+        handler = HANDLERS.get(type(free))
+
+        if handler is not None:
+            entry = memo.get(id(free))
+            if entry is None:
+                env.misses += 1
+                pending.append(id(free))
+                memo[id(free)] = (free, PENDING)
+                frame = handler(free, run, cofree, env)
+                if type(frame) is not GeneratorType:
+                    free = frame
+                    continue
+                stack.append((frame, pending))
+                pending = []
+                value = None
+            elif entry[1] is not PENDING:
+                env.hits += 1
+                free = entry[1]
+                continue
+            else:
+                raise RuntimeError(f"{type(free).__name__} node depends on its own value")
+        else:
+            for key in pending:
+                memo[key] = (memo[key][0], free)
+            pending = []
+            if not stack:
+                return free
+            value = free
+
+        try:
+            free = stack[-1][0].send(value)
+        except StopIteration as done:
+            _, pending = stack.pop()
+            free = done.value
+
+PENDING = object()
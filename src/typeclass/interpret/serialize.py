@@ -0,0 +1,194 @@
+import pickle
+import importlib
+from dataclasses import dataclass, fields
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.interpret.run import HANDLERS, evaluate
+from typeclass.interpret.syntax import is_syntax
+
+MAGIC = b"TCX1"
+
+FUNCTIONS = {}
+NAMES = {}
+
+def register_function(name, function):
+    """
+    Make `function` serializable under `name`.
+
+    Expressions refer to registered functions by name, together with the
+    module and qualified name of the function. A process loading an
+    expression which has not registered the name yet, such as a fresh
+    `spawn` worker, imports that module, which registers it again.
+    """
+    if FUNCTIONS.get(name, function) is not function:
+        raise ValueError(f"function name {name!r} is already registered")
+    FUNCTIONS[name] = function
+    NAMES[id(function)] = name
+
+def named(name):
+    """
+    Decorator form of `register_function`.
+
+        @named("inc")
+        def inc(v):
+            return v + 1
+    """
+    def register(function):
+        register_function(name, function)
+        return function
+    return register
+
+def registered_name(function):
+    """
+    The name `function` is registered under, or None.
+
+    `NAMES` is keyed by id, so an entry whose function is no longer
+    registered, and may have been collected, is ignored.
+    """
+    name = NAMES.get(id(function))
+    return name if name is not None and FUNCTIONS.get(name) is function else None
+
+@dataclass(frozen=True)
+class FunctionRef:
+    name: str
+    module: str | None = None
+    qualname: str | None = None
+
+    @classmethod
+    def of(cls, name, function):
+        return cls(name, getattr(function, "__module__", None), getattr(function, "__qualname__", None))
+
+    def resolve(self):
+        """
+        The registered function, importing its module if this process has not
+        registered it yet.
+        """
+        function = FUNCTIONS.get(self.name)
+        if function is None and self.module is not None:
+            try:
+                module = importlib.import_module(self.module)
+            except ImportError:
+                module = None
+            function = FUNCTIONS.get(self.name)
+            if function is None and module is not None and self.qualname is not None:
+                function = module
+                for part in self.qualname.split("."):
+                    function = getattr(function, part, None)
+                if function is not None:
+                    register_function(self.name, function)
+        if function is None:
+            raise LookupError(f"function {self.name!r} is not registered")
+        return function
+
+class NotSerializable(TypeError):
+    """
+    Raised when an expression holds a leaf which cannot be encoded, such as
+    an unregistered lambda.
+    """
+
+def dumps(expression):
+    """
+    Encode `expression` as bytes.
+
+    The encoding is a flat table: node types by name, leaf values, and nodes
+    as tuples of small integers referring into both, so a node or value
+    shared by several parents is written once and shared again on load.
+    Registered functions are written as references (see `FunctionRef`);
+    other leaves, including the runtime classes in static fields, are
+    pickled.
+    """
+    types, type_index = [], {}
+    values, value_index = [], {}
+    nodes, node_index = [], {}
+
+    def value(leaf):
+        key = id(leaf)
+        if key not in value_index:
+            value_index[key] = len(values)
+            name = registered_name(leaf)
+            values.append(FunctionRef.of(name, leaf) if name is not None else leaf)
+        return ~value_index[key]
+
+    stack = [(expression, False)]
+    while stack:
+        free, visited = stack.pop()
+
+        if id(free) in node_index or not is_syntax(free):
+            continue
+
+        layout = [(f.name, getattr(free, f.name)) for f in fields(free) if f.init]
+        children = [field.force() for _, field in layout if isinstance(field, Thunk)]
+
+        if not visited:
+            stack.append((free, True))
+            stack.extend((child, False) for child in children if is_syntax(child))
+            continue
+
+        node = type(free)
+        if node not in type_index:
+            type_index[node] = len(types)
+            types.append(f"{node.__module__}.{node.__qualname__}")
+
+        mask, refs = 0, []
+        for position, (_, field) in enumerate(layout):
+            if isinstance(field, Thunk):
+                mask |= 1 << position
+                field = field.force()
+            refs.append(node_index[id(field)] if is_syntax(field) else value(field))
+
+        node_index[id(free)] = len(nodes)
+        nodes.append((type_index[node], mask, *refs))
+
+    root = node_index[id(expression)] if is_syntax(expression) else value(expression)
+
+    try:
+        return MAGIC + pickle.dumps((types, values, nodes, root), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        for leaf in values:
+            try:
+                pickle.dumps(leaf)
+            except Exception:
+                raise NotSerializable(
+                    f"cannot encode {leaf!r}; register it with register_function"
+                ) from error
+        raise
+
+def loads(data):
+    """
+    Rebuild a runnable expression from `dumps` output.
+
+    Only node types known to the interpreter are accepted, but leaf values
+    are unpickled: load only data you trust, as with `pickle`.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not an encoded expression")
+
+    types, values, nodes, root = pickle.loads(data[len(MAGIC):])
+
+    known = {f"{node.__module__}.{node.__qualname__}": node for node in HANDLERS}
+    try:
+        types = [known[name] for name in types]
+    except KeyError as error:
+        raise ValueError(f"unknown syntax node {error.args[0]}") from None
+
+    def leaf(value):
+        return value.resolve() if type(value) is FunctionRef else value
+
+    values = [leaf(value) for value in values]
+
+    built = []
+    for index, mask, *refs in nodes:
+        args = [
+            delay(resolved) if mask >> position & 1 else resolved
+            for position, ref in enumerate(refs)
+            for resolved in (built[ref] if ref >= 0 else values[~ref],)
+        ]
+        built.append(types[index](*args))
+
+    return built[root] if root >= 0 else values[~root]
+
+def evaluate_encoded(data):
+    """
+    Load and evaluate an encoded expression, e.g. in a worker process.
+    """
+    return evaluate(loads(data))
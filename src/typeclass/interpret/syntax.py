@@ -0,0 +1,56 @@
+from dataclasses import fields, replace
+
+from typeclass.data.thunk import Thunk, delay
+from typeclass.interpret.run import HANDLERS
+
+def is_syntax(value):
+    """
+    True when `value` is a node of the free syntax, i.e. has a handler.
+    """
+    return type(value) in HANDLERS
+
+def operands(free):
+    """
+    The delayed operands of a syntax node as `(field, value)` pairs.
+
+    Static fields such as the `cls` witness of `Pure` or `Arr` are not
+    operands and are skipped. Operands are forced, which for syntax built by
+    the symbol layer only unwraps the value captured at construction time.
+    """
+    return [
+        (name, value.force())
+        for name in names(type(free))
+        if isinstance(value := getattr(free, name), Thunk)
+    ]
+
+FIELDS = {}
+
+def names(node):
+    """
+    Field names of a syntax node type, looked up once per type.
+    """
+    try:
+        return FIELDS[node]
+    except KeyError:
+        FIELDS[node] = result = tuple(field.name for field in fields(node))
+        return result
+
+def rebuild(free, changes):
+    """
+    Copy of `free` with the operands named in `changes` replaced.
+    """
+    return replace(free, **{name: delay(value) for name, value in changes.items()})
+
+def size(expression):
+    """
+    Number of distinct syntax nodes reachable from `expression`.
+    """
+    seen, stack = set(), [expression]
+
+    while stack:
+        free = stack.pop()
+        if is_syntax(free) and id(free) not in seen:
+            seen.add(id(free))
+            stack.extend(child for _, child in operands(free))
+
+    return len(seen)
@@ -1,8 +1,6 @@
 from functools import wraps
 from inspect import signature
 
-from typeclass.interpret.run import run
-
 def curry(fn):
     arity = len(signature(fn).parameters)
 
@@ -14,6 +12,9 @@ def curry(fn):
     return curried
 
 def interpret(expression):
+    # Imported here so that data modules using `evaluated` do not load the
+    # interpreter, and every typeclass package with it, at import time.
+    from typeclass.interpret.run import run
     return run(expression, None, None)
 
 def interpreted(fn):
@@ -73,3 +73,16 @@ def composition_pairs():
         for f in fs
         for g in fs
     ]
+
+
+def loop_bodies():
+    """
+    Loop bodies `(a, c) -> (b, c)`: one ignoring its feedback, one passing
+    it straight back unread, and one reading it early, which runs to a
+    fixpoint.
+    """
+    return [
+        Morphism(lambda p: (p[0] * 3, p[0])),
+        Morphism(lambda p: (p[0] - 1, p[1])),
+        Morphism(lambda p: (p[0] + p[1].get(0), p[0] * 2)),
+    ]
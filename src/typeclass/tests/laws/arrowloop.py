@@ -0,0 +1,77 @@
+from typing import Callable, TypeVar
+
+from typeclass.typeclasses.arrowloop import ArrowLoop
+from typeclass.typeclasses.symbols import arrow, first, second, loop, rcompose
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+D = TypeVar("D")
+
+
+def assoc(triple):
+    (x, a), c = triple
+    return (x, (a, c))
+
+
+def unassoc(triple):
+    x, (b, c) = triple
+    return ((x, b), c)
+
+
+def arrowloop_extension_expr(
+    witness: type[ArrowLoop[A, B]],
+    g: Callable[[A], B],
+):
+    """
+    ArrowLoop law (feedback over a wire that is never read):
+        loop(arr(lambda (a, c): (g(a), c))) == arr(g)
+    """
+    lhs = witness |loop| (witness |arrow| (lambda p: (g(p[0]), p[1])))
+    rhs = witness |arrow| g
+    return lhs, rhs
+
+
+def arrowloop_left_tightening_expr(
+    witness: type[ArrowLoop[A, B]],
+    h: ArrowLoop[D, A],
+    f: ArrowLoop[tuple[A, C], tuple[B, C]],
+):
+    """
+    ArrowLoop law:
+        loop(first(h) >>> f) == h >>> loop(f)
+    """
+    lhs = witness |loop| ((witness |first| h) |rcompose| f)
+    rhs = h |rcompose| (witness |loop| f)
+    return lhs, rhs
+
+
+def arrowloop_right_tightening_expr(
+    witness: type[ArrowLoop[A, B]],
+    f: ArrowLoop[tuple[A, C], tuple[B, C]],
+    h: ArrowLoop[B, D],
+):
+    """
+    ArrowLoop law:
+        loop(f >>> first(h)) == loop(f) >>> h
+    """
+    lhs = witness |loop| (f |rcompose| (witness |first| h))
+    rhs = (witness |loop| f) |rcompose| h
+    return lhs, rhs
+
+
+def arrowloop_superposing_expr(
+    witness: type[ArrowLoop[A, B]],
+    f: ArrowLoop[tuple[A, C], tuple[B, C]],
+):
+    """
+    ArrowLoop law:
+        second(loop(f)) == loop(arr(assoc) >>> second(f) >>> arr(unassoc))
+    """
+    lhs = witness |second| (witness |loop| f)
+    rhs = witness |loop| (
+        (witness |arrow| assoc)
+        |rcompose| (witness |second| f)
+        |rcompose| (witness |arrow| unassoc)
+    )
+    return lhs, rhs
@@ -0,0 +1,124 @@
+# typeclass/tests/test_annotate.py
+
+import sys
+import unittest
+
+from typeclass.data.thunk import Thunk, Strict
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.annotate import (
+    Annotated, Annotation, Limits, PathologicalExpression, annotate, check, strategy, run_annotated,
+)
+from typeclass.interpret.run import HANDLERS, register
+from typeclass.typeclasses.semigroup import Combine
+from typeclass.typeclasses.symbols import fmap, bind, combine, arrow, fanout
+
+
+class TestAnnotate(unittest.TestCase):
+    def test_closed_tree(self):
+        expr = (Sequence((1,)) |combine| Sequence((2,))) |combine| Sequence((3,))
+        cofree = annotate(expr)
+
+        self.assertEqual(cofree.annotation, Annotation(nodes=2, depth=2, cost=2, closed=True))
+        self.assertEqual(cofree["a"].annotation.depth, 1)
+        self.assertEqual(cofree["b"].annotation.nodes, 0)
+
+    def test_lambdas_are_not_closed(self):
+        expr = (Just(1) |fmap| (lambda v: v + 1)) |bind| Just
+        cofree = annotate(expr)
+
+        self.assertFalse(cofree.annotation.closed)
+        self.assertFalse(cofree["ma"].annotation.closed)
+        self.assertTrue(cofree["ma"]["value"].annotation.closed)
+
+    def test_derived_nodes_cost_more(self):
+        inc = Morphism |arrow| (lambda v: v + 1)
+        self.assertGreater(annotate(inc |fanout| (Morphism, inc)).annotation.cost, 3)
+
+    def test_shared_nodes_counted_per_use(self):
+        expr = Sequence((1,))
+        for _ in range(64):
+            expr = expr |combine| expr
+
+        self.assertEqual(annotate(expr).annotation.nodes, 2 ** 64 - 1)
+
+    def test_deep_tree(self):
+        expr = Just(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |fmap| (lambda v: v + 1)
+
+        self.assertEqual(annotate(expr).annotation.depth, 10 * sys.getrecursionlimit())
+
+
+class TestLimits(unittest.TestCase):
+    def test_rejects_pathological_expressions(self):
+        expr = Sequence((1,))
+        for _ in range(64):
+            expr = expr |combine| expr
+
+        with self.assertRaises(PathologicalExpression):
+            run_annotated(expr)
+
+    def test_limits_can_be_disabled(self):
+        expr = Sequence((1,)) |combine| Sequence((2,))
+        check(annotate(expr), Limits(nodes=None, depth=None, cost=None))
+
+        with self.assertRaises(PathologicalExpression):
+            check(annotate(expr), Limits(depth=0))
+
+
+class TestStrategy(unittest.TestCase):
+    def test_cheap_closed_trees_run_eagerly(self):
+        expr = Sequence((1,)) |combine| Sequence((2,))
+
+        self.assertEqual(strategy(annotate(expr)), "eager")
+        self.assertEqual(run_annotated(expr).force(), Sequence((1, 2)))
+
+    def test_open_trees_stay_lazy(self):
+        calls = []
+        expr = Just(1) |fmap| (lambda v: calls.append(v) or v)
+
+        self.assertEqual(strategy(annotate(expr)), "lazy")
+        thunk = run_annotated(expr)
+        self.assertEqual(calls, [])
+        self.assertEqual(thunk.force(), Just(1))
+
+    def test_strategy_is_chosen_per_node(self):
+        calls = []
+        closed = Sequence((2,)) |combine| Sequence((3,))
+        expr = (Sequence((1,)) |fmap| (lambda v: calls.append(v) or v)) |combine| closed
+        context = Annotated(annotate(expr))
+
+        self.assertEqual(strategy(annotate(expr)), "lazy")
+        self.assertEqual(type(context.run(closed, None, context)), Strict)
+        self.assertIs(type(context.run(expr, None, context)), Thunk)
+        self.assertEqual(context.eagerly, 2)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(context.run(expr, None, context).force(), Sequence((1, 2, 3)))
+        self.assertEqual(calls, [1])
+
+    def test_handlers_receive_their_own_annotation(self):
+        seen = []
+        handler = HANDLERS[Combine]
+
+        def spy(free, run, cofree, env):
+            seen.append((free, cofree))
+            return handler(free, run, cofree, env)
+
+        inner = Sequence((1,)) |combine| Sequence((2,))
+        expr = inner |combine| (Sequence((3,)) |fmap| (lambda v: v))
+        register(Combine, spy)
+        try:
+            self.assertEqual(run_annotated(expr).force(), Sequence((1, 2, 3)))
+        finally:
+            register(Combine, handler)
+
+        self.assertEqual(len(seen), 2)
+        for free, cofree in seen:
+            self.assertIs(cofree.free, free)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# typeclass/tests/test_asynchronous.py
+
+import asyncio
+import sys
+import unittest
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.stream.lib import _iterate
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.asynchronous import evaluate_async
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine
+
+
+async def fetch(value):
+    await asyncio.sleep(0)
+    return Just(value)
+
+
+class TestEvaluateAsync(unittest.TestCase):
+    def test_awaitable_leaf(self):
+        expr = fetch(3) |fmap| (lambda v: v + 1)
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Just(4))
+
+    def test_async_continuation(self):
+        expr = (Just(1) |bind| fetch) |bind| (lambda v: fetch(v + 1))
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Just(2))
+
+    def test_async_function_in_fmap(self):
+        async def inc(v):
+            await asyncio.sleep(0)
+            return v + 1
+
+        expr = Sequence((1, 2, 3)) |fmap| inc
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence((2, 3, 4)))
+
+    def test_async_continuation_called_per_element(self):
+        calls = []
+
+        async def spread(v):
+            calls.append(v)
+            return Sequence((v, -v))
+
+        expr = Sequence((1, 2, 3)) |bind| spread
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence((1, -1, 2, -2, 3, -3)))
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_synchronous_function_called_once_per_element(self):
+        calls = []
+
+        def f(v):
+            calls.append(v)
+            return v * 2
+
+        expr = Sequence(tuple(range(200))) |fmap| f
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence(tuple(range(0, 400, 2))))
+        self.assertEqual(calls, list(range(200)))
+
+    def test_synchronous_continuation_called_once(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Just(v + 1)
+
+        self.assertEqual(asyncio.run(evaluate_async(Just(1) |bind| g)), Just(2))
+        self.assertEqual(calls, [1])
+
+    def test_functions_called_once_around_suspensions(self):
+        calls = []
+
+        async def later(v):
+            await asyncio.sleep(0)
+            return Sequence((v,))
+
+        def spread(v):
+            calls.append(v)
+            return later(v) if v % 2 else Sequence((v,)) |fmap| (lambda w: w * 10)
+
+        expr = Sequence(tuple(range(6))) |bind| spread
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence((0, 1, 20, 3, 40, 5)))
+        self.assertEqual(calls, list(range(6)))
+
+    def test_callable_objects_called_once_around_suspensions(self):
+        async def later(v):
+            await asyncio.sleep(0)
+            return Sequence((v,))
+
+        class Spread:
+            def __init__(self):
+                self.calls = []
+
+            def __call__(self, v):
+                self.calls.append(v)
+                return later(v) if v % 2 else Sequence((v,))
+
+        spread = Spread()
+        expr = Sequence(tuple(range(6))) |bind| spread
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence(tuple(range(6))))
+        self.assertEqual(spread.calls, list(range(6)))
+
+    def test_runtime_passes_do_not_grow_with_suspensions(self):
+        binds = []
+
+        class Counted(Sequence):
+            def bind(self, mf):
+                binds.append(None)
+                return super().bind(mf)
+
+        async def spread(v):
+            await asyncio.sleep(0)
+            return Sequence((v,))
+
+        passes = []
+        for count in (10, 100):
+            binds.clear()
+            expr = Counted(tuple(range(count))) |bind| spread
+            self.assertEqual(asyncio.run(evaluate_async(expr)), Sequence(tuple(range(count))))
+            passes.append(len(binds))
+
+        self.assertEqual(passes[0], passes[1])
+
+    def test_awaitables_forced_after_the_evaluation(self):
+        async def inc(v):
+            return v + 1
+
+        stream = asyncio.run(evaluate_async(_iterate(lambda v: v + 1, 0) |fmap| inc))
+        self.assertEqual(stream.head, 1)
+        with self.assertRaises(TypeError):
+            stream.tail.force()
+
+    def test_suspend_passes_through_except_exception(self):
+        class Guarded(Just):
+            def bind(self, mf):
+                try:
+                    return mf.force()(self.value)
+                except Exception:
+                    return Nothing()
+
+        self.assertEqual(asyncio.run(evaluate_async(Guarded(3) |bind| fetch)), Just(3))
+
+    def test_synchronous_expressions_agree(self):
+        expr = ((Sequence((1, 2)) |bind| (lambda v: Sequence((v, v)))) |combine| Sequence((9,))) |fmap| str
+        self.assertEqual(asyncio.run(evaluate_async(expr)), evaluate(expr))
+        self.assertEqual(asyncio.run(evaluate_async(Nothing() |bind| fetch)), Nothing())
+
+    def test_ap_branches_are_gathered(self):
+        count = 8
+
+        async def main():
+            arrived = asyncio.Event()
+            seen = []
+
+            async def check(i):
+                seen.append(i)
+                if len(seen) == count:
+                    arrived.set()
+                await arrived.wait()
+                return Just(i)
+
+            expr = Just |pure| ()
+            for i in range(count):
+                expr = (expr |fmap| (lambda rs: lambda r: rs + (r,))) |ap| (Just(i) |bind| check)
+            return await asyncio.wait_for(evaluate_async(expr), timeout=5)
+
+        self.assertEqual(asyncio.run(main()), Just(tuple(range(count))))
+
+    def test_many_evaluations_share_a_loop(self):
+        async def slow(v):
+            await asyncio.sleep(0.01)
+            return Just(v * 2)
+
+        async def main():
+            return await asyncio.gather(*(evaluate_async(Just(i) |bind| slow) for i in range(1000)))
+
+        self.assertEqual(asyncio.run(main()), [Just(i * 2) for i in range(1000)])
+
+    def test_deep_chain(self):
+        depth = 10 * sys.getrecursionlimit()
+        expr = Just(0)
+        for _ in range(depth):
+            expr = expr |bind| (lambda v: Just(v + 1))
+
+        self.assertEqual(asyncio.run(evaluate_async(expr)), Just(depth))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# typeclass/tests/test_batch.py
+
+import sys
+import unittest
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.lowering import LOWERED
+from typeclass.interpret.batch import Batch, evaluate_many, skeleton
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine, arrow, fanout
+
+
+inc = lambda v: v + 1
+
+
+class TestEvaluateMany(unittest.TestCase):
+    def test_matches_evaluate(self):
+        exprs = [
+            *((Just(i) |fmap| inc) |bind| (lambda v: Just(v * 2)) for i in range(5)),
+            Nothing() |fmap| inc,
+            (Sequence |pure| (lambda a: lambda b: a + b)) |ap| Sequence((1, 2)) |ap| Sequence((10,)),
+            Sequence((1,)) |combine| Sequence((2,)),
+            Just(7),
+        ]
+        report = Batch()
+
+        self.assertEqual(evaluate_many(exprs, report), [evaluate(e) for e in exprs])
+        self.assertEqual(report.expressions, len(exprs))
+        self.assertEqual(report.shapes, 4)
+        self.assertEqual(report.interpreted, 1)
+        self.assertGreater(report.throughput, 0)
+
+    def test_shapes_ignore_leaf_values(self):
+        a, _ = skeleton((Just(1) |fmap| inc) |bind| Just)
+        b, _ = skeleton((Just(2) |fmap| str) |bind| Just)
+        c, _ = skeleton((Just(2) |bind| Just) |fmap| str)
+
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_lowering_is_shared_across_a_shape(self):
+        def fan(i):
+            return (Morphism |arrow| (lambda v: v + i)) |fanout| (Morphism, Morphism |arrow| str)
+
+        evaluate_many([fan(0)])
+        lowered = LOWERED.copy()
+        results = evaluate_many([fan(i) for i in range(10)])
+
+        self.assertEqual([f(1) for f in results], [(1 + i, "1") for i in range(10)])
+        self.assertEqual(LOWERED.total() - lowered.total(), 3)
+
+    def test_deep_expressions_are_interpreted(self):
+        expr = Just(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |fmap| inc
+        report = Batch()
+
+        self.assertEqual(evaluate_many([expr], report), [Just(10 * sys.getrecursionlimit())])
+        self.assertEqual(report.interpreted, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
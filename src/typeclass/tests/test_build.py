@@ -0,0 +1,66 @@
+# typeclass/tests/test_build.py
+
+import unittest
+
+from typeclass.data.thunk import Thunk, Strict, delay
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.typeclasses import build
+from typeclass.typeclasses.infix import Infix, Section
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure
+
+
+inc = lambda v: v + 1
+check = lambda v: Just(v * 2)
+
+
+class TestStrict(unittest.TestCase):
+    def test_strict_is_a_forced_thunk(self):
+        thunk = delay([1])
+
+        self.assertIsInstance(thunk, Strict)
+        self.assertIsInstance(thunk, Thunk)
+        self.assertIs(thunk.force(), thunk.force())
+        self.assertEqual(repr(thunk), "Strict([1])")
+
+    def test_builders_hold_operands_strictly(self):
+        expr = Just(1) |fmap| inc
+
+        self.assertIsInstance(expr.func, Strict)
+        self.assertIsInstance(expr.value, Strict)
+        self.assertEqual(expr.value.force(), Just(1))
+
+
+class TestInfix(unittest.TestCase):
+    def test_section_holds_its_left_operand(self):
+        op = Infix(lambda a, b: (a, b))
+        section = 1 |op
+
+        self.assertIsInstance(section, Section)
+        self.assertEqual(section | 2, (1, 2))
+        self.assertEqual(1 |op| 2 |op| 3, ((1, 2), 3))
+
+
+class TestBuild(unittest.TestCase):
+    def test_matches_infix_syntax(self):
+        cases = [
+            (build.bind(build.fmap(Just(1), inc), check), (Just(1) |fmap| inc) |bind| check),
+            (
+                build.ap(build.pure(Sequence, lambda a: (a,)), Sequence((1, 2))),
+                (Sequence |pure| (lambda a: (a,))) |ap| Sequence((1, 2)),
+            ),
+        ]
+        for built, infix in cases:
+            with self.subTest(built=built):
+                self.assertIs(type(built), type(infix))
+                self.assertEqual(evaluate(built), evaluate(infix))
+
+    def test_arrows(self):
+        f = build.arrow(Morphism, inc)
+        self.assertEqual(evaluate(build.fanout(f, (Morphism, f)))(1), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
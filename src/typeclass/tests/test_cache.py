@@ -0,0 +1,176 @@
+# typeclass/tests/test_cache.py
+
+import os
+import sys
+import tempfile
+import unittest
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.interpret.run import evaluate
+from typeclass.interpret import cache as cache_module
+from typeclass.interpret.cache import Cache, structural_key
+from typeclass.interpret.serialize import named
+from typeclass.typeclasses.symbols import fmap, bind, pure, combine
+
+CALLS = []
+
+
+@named("tests.cache.inc")
+def inc(v):
+    CALLS.append(v)
+    return v + 1
+
+
+@named("tests.cache.just")
+def just(v):
+    return Just(v)
+
+
+class TestStructuralKey(unittest.TestCase):
+    def test_identical_expressions_share_a_key(self):
+        a = (Just(1) |fmap| inc) |bind| just
+        b = (Just(1) |fmap| inc) |bind| just
+
+        self.assertIsNotNone(structural_key(a))
+        self.assertEqual(structural_key(a), structural_key(b))
+
+    def test_keys_distinguish_structure_and_leaves(self):
+        keys = {
+            structural_key(Just(1) |fmap| inc),
+            structural_key(Just(2) |fmap| inc),
+            structural_key((Just(1) |fmap| inc) |fmap| inc),
+            structural_key(Sequence((1,)) |combine| Sequence((2,))),
+            structural_key(Sequence((2,)) |combine| Sequence((1,))),
+            structural_key(Sequence |pure| 1),
+            structural_key(Just |pure| 1),
+        }
+        self.assertEqual(len(keys), 7)
+
+    def test_opaque_leaves_have_no_key(self):
+        self.assertIsNone(structural_key(Just(1) |fmap| (lambda v: v)))
+        self.assertIsNone(structural_key(Just |pure| (lambda v: v)))
+
+    def test_keys_are_salted_with_the_format(self):
+        expr = Just(1) |fmap| inc
+        key = structural_key(expr)
+
+        previous = cache_module.FORMAT
+        cache_module.FORMAT = previous + 1
+        cache_module.salt.cache_clear()
+        try:
+            self.assertNotEqual(structural_key(expr), key)
+        finally:
+            cache_module.FORMAT = previous
+            cache_module.salt.cache_clear()
+        self.assertEqual(structural_key(expr), key)
+
+    def test_deep_expression(self):
+        expr = Just(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |fmap| str
+        self.assertIsNotNone(structural_key(expr))
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_hits_skip_evaluation(self):
+        cache = Cache()
+
+        self.assertEqual(cache.evaluate(Just(1) |fmap| inc), Just(2))
+        self.assertEqual(cache.evaluate(Just(1) |fmap| inc), Just(2))
+        self.assertEqual(cache.run(Just(1) |fmap| inc).force(), Just(2))
+
+        self.assertEqual(CALLS, [1])
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 1))
+        self.assertAlmostEqual(cache.stats.hit_rate, 2 / 3)
+
+    def test_opaque_expressions_are_skipped(self):
+        cache = Cache()
+        expr = Just(1) |fmap| (lambda v: inc(v))
+
+        self.assertEqual(cache.evaluate(expr), evaluate(expr))
+        self.assertEqual(cache.evaluate(expr), Just(2))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.skipped, 2)
+        self.assertEqual(len(CALLS), 3)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = Cache(maxsize=2)
+        for i in (1, 2, 1, 3):
+            cache.evaluate(Just(i) |fmap| inc)
+        cache.evaluate(Just(1) |fmap| inc)
+        cache.evaluate(Just(2) |fmap| inc)
+
+        self.assertEqual(cache.stats.evictions, 2)
+        self.assertEqual(CALLS, [1, 2, 3, 2])
+
+    def test_size_bound(self):
+        cache = Cache(maxbytes=200)
+        cache.evaluate(Sequence(tuple(range(1000))) |fmap| inc)
+        for i in range(20):
+            cache.evaluate(Just(i) |fmap| inc)
+
+        self.assertLessEqual(cache.bytes, 200)
+        self.assertGreater(cache.stats.evictions, 0)
+
+    def test_disk_tier_survives_restarts(self):
+        with tempfile.TemporaryDirectory() as path:
+            Cache(path=path).evaluate((Just(1) |fmap| inc) |bind| just)
+
+            cache = Cache(path=path)
+            self.assertEqual(cache.evaluate((Just(1) |fmap| inc) |bind| just), Just(2))
+            self.assertEqual(cache.stats.disk_hits, 1)
+            self.assertEqual(CALLS, [1])
+
+    def test_disk_tier_is_bounded_by_count(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = Cache(maxsize=2, path=path)
+            for i in range(5):
+                cache.evaluate(Just(i) |fmap| inc)
+
+            self.assertEqual(len(os.listdir(path)), 2)
+            self.assertEqual(cache.stats.disk_evictions, 3)
+
+            restarted = Cache(maxsize=2, path=path)
+            self.assertEqual(restarted.evaluate(Just(4) |fmap| inc), Just(5))
+            self.assertEqual(restarted.stats.disk_hits, 1)
+            self.assertEqual(restarted.evaluate(Just(0) |fmap| inc), Just(1))
+            self.assertEqual(restarted.stats.misses, 1)
+
+    def test_disk_tier_is_bounded_by_size(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = Cache(maxbytes=200, path=path)
+            cache.evaluate(Sequence(tuple(range(1000))) |fmap| inc)
+            for i in range(20):
+                cache.evaluate(Just(i) |fmap| inc)
+
+            size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+            self.assertLessEqual(size, 200)
+            self.assertEqual(size, cache.disk_bytes)
+            self.assertGreater(cache.stats.disk_evictions, 0)
+
+    def test_restart_trims_to_the_new_bounds(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = Cache(path=path)
+            for i in range(5):
+                cache.evaluate(Just(i) |fmap| inc)
+
+            Cache(maxsize=3, path=path)
+            self.assertEqual(len(os.listdir(path)), 3)
+
+    def test_unpicklable_results_stay_in_memory(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = Cache(path=path)
+            expr = Just(1) |fmap| named("tests.cache.adder")(lambda v: lambda w: v + w)
+
+            self.assertEqual(cache.evaluate(expr).value(2), 3)
+            self.assertIs(cache.evaluate(expr), cache.evaluate(expr))
+            self.assertEqual(Cache(path=path).evaluate(expr).value(2), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# typeclass/tests/test_compile.py
+
+import unittest
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.parser import char
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.compile import compile, param
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine, otherwise, arrow, fanout, compose
+
+
+class TestCompile(unittest.TestCase):
+    def test_functor(self):
+        plan = compile(param("x") |fmap| (lambda v: v + 1))
+
+        self.assertEqual(plan.params, frozenset({"x"}))
+        for value in (Just(1), Just(10), Nothing()):
+            with self.subTest(value=value):
+                self.assertEqual(plan(x=value), evaluate(value |fmap| (lambda v: v + 1)))
+
+    def test_monad(self):
+        f = lambda v: Just(v * 2) |fmap| (lambda w: w + 1)
+        plan = compile((param("m") |bind| f) |fmap| str)
+
+        for value in (Just(3), Nothing()):
+            with self.subTest(value=value):
+                self.assertEqual(plan(m=value), evaluate((value |bind| f) |fmap| str))
+
+    def test_applicative_with_several_params(self):
+        expr = (Sequence |pure| (lambda a: lambda b: a + b)) |ap| param("xs") |ap| param("ys")
+        plan = compile(expr)
+
+        self.assertEqual(plan(xs=Sequence((1, 2)), ys=Sequence((10,))), Sequence((11, 12)))
+        self.assertEqual(plan(xs=Sequence(()), ys=Sequence((10,))), Sequence(()))
+
+    def test_param_as_function(self):
+        plan = compile(Just(2) |fmap| param("f"))
+
+        self.assertEqual(plan(f=lambda v: v + 1), Just(3))
+        self.assertEqual(plan(f=lambda v: v * 5), Just(10))
+
+    def test_closed_subtrees_are_realized_once(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Sequence((v, v))
+
+        shared = Sequence((1, 2)) |bind| g
+        plan = compile(shared |combine| param("tail"))
+
+        for tail in (Sequence((3,)), Sequence((4,))):
+            self.assertEqual(plan(tail=tail), Sequence((1, 1, 2, 2) + tail._values))
+        self.assertEqual(calls, [1, 2])
+
+    def test_parser(self):
+        plan = compile(param("p") |otherwise| char("b"))
+
+        self.assertEqual(plan(p=char("a")).run("ab"), [("a", "b")])
+        self.assertEqual(plan(p=char("a")).run("ba"), [("b", "a")])
+
+    def test_derived_arrow(self):
+        inc = Morphism |arrow| (lambda v: v + 1)
+        plan = compile(param("f") |fanout| (Morphism, inc))
+
+        self.assertEqual(plan(f=Morphism(lambda v: v * 2))(5), (10, 6))
+        self.assertEqual(plan(f=Morphism(lambda v: -v))(5), (-5, 6))
+
+    def test_compose(self):
+        plan = compile(param("f") |compose| (Morphism |arrow| (lambda v: v + 1)))
+        self.assertEqual(plan(f=Morphism(lambda v: v * 2))(1), 4)
+
+    def test_missing_param(self):
+        plan = compile(param("x") |fmap| (lambda v: v))
+        with self.assertRaises(KeyError):
+            plan()
+
+    def test_unbound_param_in_interpreter(self):
+        with self.assertRaises(LookupError):
+            evaluate(param("x") |fmap| (lambda v: v))
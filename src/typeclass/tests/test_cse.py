@@ -0,0 +1,142 @@
+# typeclass/tests/test_cse.py
+
+import sys
+import unittest
+
+from typeclass.data.maybe import Just
+from typeclass.data.sequence import Sequence
+from typeclass.interpret.run import Env, evaluate
+from typeclass.interpret.cse import HashCons, Shared, Sharing, cse
+from typeclass.interpret.optimize import Report
+from typeclass.typeclasses.symbols import fmap, bind, combine
+
+
+class TestHashCons(unittest.TestCase):
+    def test_identical_trees_are_interned(self):
+        f = lambda v: v + 1
+        h = HashCons()
+
+        a = h.intern((Just(1) |fmap| f) |fmap| f)
+        b = h.intern((Just(1) |fmap| f) |fmap| f)
+
+        self.assertIs(a, b)
+        self.assertIs(a.value.force(), b.value.force())
+
+    def test_builder(self):
+        f = lambda v: v + 1
+        h = HashCons()
+
+        self.assertIs(Just(1) |h.fmap| f, Just(1) |h.fmap| f)
+        self.assertIsNot(Just(1) |h.fmap| f, Just(1) |h.fmap| (lambda v: v + 1))
+        self.assertEqual(evaluate(Just(1) |h.fmap| f), Just(2))
+
+    def test_unhashable_leaves_compare_by_identity(self):
+        h = HashCons()
+        xs, ys = [1], [1]
+
+        self.assertIsNot(h.intern(Just(xs) |fmap| len), h.intern(Just(ys) |fmap| len))
+
+    def test_equal_leaves_of_different_types_stay_distinct(self):
+        h = HashCons()
+        nodes = [Just(1) |h.fmap| repr, Just(True) |h.fmap| repr, Just(1.0) |h.fmap| repr]
+
+        self.assertEqual(len({id(node) for node in nodes}), 3)
+        self.assertEqual([evaluate(node) for node in nodes], [Just("1"), Just("True"), Just("1.0")])
+        self.assertIsNot(h.intern(Just((1, 2)) |fmap| repr), h.intern(Just((True, 2)) |fmap| repr))
+        self.assertIs(Just((1, 2)) |h.fmap| repr, Just((1, 2)) |h.fmap| repr)
+
+    def test_cse_keeps_leaf_types(self):
+        expr = (Sequence((1,)) |fmap| repr) |combine| (Sequence((True,)) |fmap| repr)
+        self.assertEqual(evaluate(cse(expr)), Sequence(("1", "True")))
+
+
+class TestCSE(unittest.TestCase):
+    def test_shared_subterm_runs_once(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Sequence((v, v))
+
+        xs = Sequence((1, 2))
+        build = lambda: xs |bind| g
+        expr = build() |combine| build()
+
+        self.assertEqual(evaluate(cse(expr)), Sequence((1, 1, 2, 2, 1, 1, 2, 2)))
+        self.assertEqual(calls, [1, 2])
+
+    def test_shared_subterm_runs_once_per_evaluation(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Sequence((v,))
+
+        xs = Sequence((1, 2))
+        build = lambda: xs |bind| g
+        expr = cse(build() |combine| build())
+
+        self.assertEqual(evaluate(expr), Sequence((1, 2, 1, 2)))
+        self.assertEqual(evaluate(expr), Sequence((1, 2, 1, 2)))
+        self.assertEqual(calls, [1, 2, 1, 2])
+
+        calls.clear()
+        self.assertEqual(evaluate(expr, Env()), Sequence((1, 2, 1, 2)))
+        self.assertEqual(calls, [1, 2])
+
+    def test_failed_shared_subterm_is_released(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            if len(calls) == 1:
+                raise ValueError(v)
+            return Sequence((v,))
+
+        xs = Sequence((1,))
+        build = lambda: xs |bind| g
+        expr = cse(build() |combine| build())
+        sharing = Sharing()
+
+        with self.assertRaises(ValueError):
+            evaluate(expr, sharing)
+        self.assertEqual(sharing.shared, {})
+
+        self.assertEqual(evaluate(expr, sharing), Sequence((1, 1)))
+        self.assertEqual(calls, [1, 1])
+
+    def test_report(self):
+        f, xs = (lambda v: v * 2), Sequence((3,))
+        build = lambda: xs |fmap| f
+        expr = (build() |combine| build()) |combine| build()
+        report = Report()
+
+        optimized = cse(expr, report)
+        self.assertEqual(evaluate(optimized), evaluate(expr))
+        self.assertEqual(report.rewrites["common subexpression"], 2)
+        self.assertEqual(report.before, 5)
+        self.assertEqual(report.after, 4)
+
+    def test_unshared_tree_is_unchanged(self):
+        expr = (Sequence((1,)) |fmap| (lambda v: v)) |combine| Sequence((2,))
+        self.assertIs(cse(expr), expr)
+
+    def test_idempotent(self):
+        f, xs = (lambda v: v * 2), Sequence((3,))
+        expr = (xs |fmap| f) |combine| (xs |fmap| f)
+        once = cse(expr)
+
+        self.assertIs(type(once.expression.force().a.force()), Shared)
+        self.assertEqual(evaluate(cse(once)), evaluate(expr))
+
+    def test_deep_chain(self):
+        f = lambda v: v + 1
+        expr = Just(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |fmap| f
+
+        self.assertEqual(evaluate(cse(expr)), evaluate(expr))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -46,6 +46,12 @@ from typeclass.tests.laws.arrowchoice import (
 from typeclass.tests.laws.arrowapply import (
     arrowapply_arr_app_expr,
 )
+from typeclass.tests.laws.arrowloop import (
+    arrowloop_extension_expr,
+    arrowloop_left_tightening_expr,
+    arrowloop_right_tightening_expr,
+    arrowloop_superposing_expr,
+)
 
 
 class EndomorphismTestCase(unittest.TestCase):
@@ -221,3 +227,31 @@ class TestEndomorphismArrowApply(EndomorphismTestCase):
             with self.subTest(f=f):
                 lhs, rhs = arrowapply_arr_app_expr(Endomorphism, f)
                 self.assert_endomorphism_expr_equal(lhs, rhs)
+
+
+class TestEndomorphismArrowLoop(EndomorphismTestCase):
+    def test_arrowloop_extension(self):
+        for g in fx_endomorphism.arrow_functions():
+            with self.subTest(g=g):
+                lhs, rhs = arrowloop_extension_expr(Endomorphism, g)
+                self.assert_endomorphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_left_tightening(self):
+        for h in fx_endomorphism.values():
+            for f in fx_endomorphism.loop_bodies():
+                with self.subTest(h=h, f=f):
+                    lhs, rhs = arrowloop_left_tightening_expr(Endomorphism, h, f)
+                    self.assert_endomorphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_right_tightening(self):
+        for f in fx_endomorphism.loop_bodies():
+            for h in fx_endomorphism.values():
+                with self.subTest(f=f, h=h):
+                    lhs, rhs = arrowloop_right_tightening_expr(Endomorphism, f, h)
+                    self.assert_endomorphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_superposing(self):
+        for f in fx_endomorphism.loop_bodies():
+            with self.subTest(f=f):
+                lhs, rhs = arrowloop_superposing_expr(Endomorphism, f)
+                self.assert_endomorphism_expr_equal(lhs, rhs, inputs=fx_endomorphism.pair_inputs())
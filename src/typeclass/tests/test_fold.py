@@ -0,0 +1,87 @@
+# typeclass/tests/test_fold.py
+
+import sys
+import unittest
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.compile import compile, param
+from typeclass.interpret.optimize import Report
+from typeclass.interpret.fold import fold
+from typeclass.interpret.syntax import is_syntax
+from typeclass.typeclasses.category import identity
+from typeclass.typeclasses.monoid import mempty
+from typeclass.typeclasses.symbols import fmap, bind, pure, combine, compose, arrow, fanout, otherwise
+
+
+CALLS = []
+
+
+def inc(v):
+    CALLS.append(v)
+    return v + 1
+
+
+class TestFold(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_closed_expressions_fold_to_values(self):
+        cases = [
+            (Sequence((1,)) |combine| Sequence((2,)), Sequence((1, 2))),
+            (mempty(Sequence) |combine| (Sequence |pure| 3), Sequence((3,))),
+            (Nothing() |otherwise| (Just |pure| 1), Just(1)),
+        ]
+        for expr, expected in cases:
+            with self.subTest(expr=expr):
+                report = Report()
+                folded = fold(expr, report)
+
+                self.assertFalse(is_syntax(folded))
+                self.assertEqual(folded, expected)
+                self.assertEqual(report.after, 0)
+
+    def test_open_parts_stay_syntax(self):
+        expr = ((Sequence |pure| 1) |combine| Sequence((2,))) |fmap| inc
+        report = Report()
+        folded = fold(expr, report)
+
+        self.assertTrue(is_syntax(folded))
+        self.assertEqual(folded.value.force(), Sequence((1, 2)))
+        self.assertEqual(report.rewrites["constant fold"], 2)
+        self.assertEqual(CALLS, [])
+        self.assertEqual(evaluate(folded), evaluate(expr))
+
+    def test_user_code_is_not_run(self):
+        expr = (Just(1) |fmap| inc) |bind| (lambda v: Just |pure| v)
+        self.assertIs(fold(expr), expr)
+        self.assertEqual(CALLS, [])
+
+    def test_arrows_fold_to_morphisms(self):
+        f = Morphism |arrow| inc
+        circuit = (f |fanout| (Morphism, f)) |compose| identity(Morphism)
+        folded = fold(circuit)
+
+        self.assertIsInstance(folded, Morphism)
+        self.assertEqual(CALLS, [])
+        self.assertEqual(folded(1), (2, 2))
+
+    def test_templates_keep_their_parameters(self):
+        plan = compile(fold((Sequence |pure| 1) |combine| param("xs")))
+        self.assertEqual(plan(xs=Sequence((2,))), Sequence((1, 2)))
+
+    def test_errors_are_left_for_evaluation(self):
+        expr = Just(1) |combine| Just(2)
+        self.assertIs(fold(expr), expr)
+
+    def test_deep_expression(self):
+        expr = Sequence(())
+        for i in range(10 * sys.getrecursionlimit()):
+            expr = expr |combine| (Sequence |pure| i)
+        self.assertEqual(len(fold(expr)._values), 10 * sys.getrecursionlimit())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# typeclass/tests/test_graph.py
+
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from typeclass.data.maybe import Just
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.graph import (
+    APPLY, Circuit, Graph, NoFixpoint, NotACircuit, circuit, lower, schedule,
+)
+from typeclass.typeclasses.category import identity
+from typeclass.typeclasses.symbols import fmap, compose, arrow, first, second, split, fanout, left, loop
+
+
+inc = lambda v: v + 1
+double = lambda v: v * 2
+
+
+class TestLower(unittest.TestCase):
+    def test_matches_the_interpreter(self):
+        f, g = Morphism |arrow| inc, Morphism |arrow| double
+        cases = [
+            (f |compose| g, 3),
+            (identity(Morphism) |compose| f, 3),
+            (Morphism |first| f, (1, "x")),
+            (Morphism |second| g, ("x", 2)),
+            (f |split| (Morphism, g), (1, 2)),
+            (f |fanout| (Morphism, g), 5),
+            ((Morphism |second| f) |compose| (g |fanout| (Morphism, f)), 4),
+        ]
+        for expr, value in cases:
+            with self.subTest(expr=expr):
+                self.assertEqual(circuit(expr)(value), evaluate(expr)(value))
+
+    def test_opaque_arrows_are_applied_whole(self):
+        from typeclass.data.either import Left
+
+        expr = (Morphism |left| (Morphism |arrow| inc)) |compose| Morphism(lambda v: Left(v))
+        graph = lower(expr)
+
+        self.assertEqual(sum(node.op == APPLY for node in graph.nodes), 2)
+        self.assertEqual(Circuit(graph)(1), Left(2))
+
+    def test_shared_branches_are_lowered_once(self):
+        f = Morphism |arrow| inc
+        graph = lower(f |fanout| (Morphism, f))
+
+        self.assertEqual(sum(node.op == APPLY for node in graph.nodes), 1)
+        self.assertEqual(Circuit(graph)(1), (2, 2))
+
+    def test_rejects_other_arrows(self):
+        with self.assertRaises(NotACircuit):
+            lower(Just(1) |fmap| inc)
+
+    def test_deep_circuit(self):
+        expr = Morphism |arrow| inc
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |compose| (Morphism |arrow| inc)
+
+        self.assertEqual(circuit(expr)(0), 10 * sys.getrecursionlimit() + 1)
+
+
+class TestSchedule(unittest.TestCase):
+    def test_independent_branches_share_a_level(self):
+        f, g = Morphism |arrow| inc, Morphism |arrow| double
+        graph = lower(f |split| (Morphism, g))
+        plan = schedule(graph)
+
+        applies = [i for i, node in enumerate(graph.nodes) if node.op == APPLY]
+        levels = [n for n, level in enumerate(plan.levels) for c in level if c[0] in applies]
+        self.assertEqual(len(set(levels)), 1)
+
+    def test_levels_respect_dependencies(self):
+        graph = lower((Morphism |arrow| inc) |compose| (Morphism |arrow| double))
+        position = {c: n for n, level in enumerate(schedule(graph).levels) for c in level}
+
+        for index, node in enumerate(graph.nodes):
+            for arg in node.args:
+                self.assertLess(position[(arg,)], position[(index,)])
+
+
+class TestParallel(unittest.TestCase):
+    def test_branches_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait(v):
+            barrier.wait()
+            return v
+
+        expr = (Morphism |arrow| wait) |fanout| (Morphism, Morphism |arrow| wait)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            run = Circuit(lower(expr), executor)
+            self.assertEqual(run(1), (1, 1))
+
+        self.assertEqual(run.forked, 1)
+
+
+class TestFeedback(unittest.TestCase):
+    def loop(self, step, seed=None, limit=100):
+        graph = Graph()
+        c = graph.feedback(seed)
+        out = graph.apply(step, graph.pair(0, c))
+        graph.tie(c, graph.project(out, 1))
+        graph.output = graph.project(out, 0)
+        return Circuit(graph, limit=limit)
+
+    def test_fixpoint(self):
+        # (b, c) = (c * 10, max(a, c)) settles on c = a.
+        run = self.loop(lambda p: (p[1].force() * 10, max(p[0], p[1].force())), seed=0)
+        self.assertEqual(run(7), 70)
+        loops = [c for c in run.schedule.components if len(c) > 1]
+        self.assertEqual([len(c) for c in loops], [4])
+
+    def test_loop_nodes_lower_to_feedback(self):
+        body = Morphism |arrow| (lambda p: (p[0] + p[1].get(0), p[0] * 2))
+        expr = (Morphism |arrow| inc) |compose| (Morphism |loop| body)
+        run = circuit(expr)
+
+        self.assertEqual([run(v) for v in range(5)], [evaluate(expr)(v) for v in range(5)])
+
+    def test_divergent_feedback(self):
+        run = self.loop(lambda p: (p[0], p[1].force() + 1), seed=0)
+        with self.assertRaises(NoFixpoint):
+            run(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
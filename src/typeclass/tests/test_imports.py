@@ -0,0 +1,66 @@
+# typeclass/tests/test_imports.py
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import typeclass
+import typeclass.data
+import typeclass.interpret
+import typeclass.typeclasses
+from typeclass.data.maybe import Just
+from typeclass.interpret.run import evaluate
+from typeclass.typeclasses.functor import Functor
+from typeclass.typeclasses import symbols
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(typeclass.__file__)))
+
+
+def loaded(statement):
+    """
+    Modules loaded by running `statement` in a fresh interpreter.
+    """
+    code = f"import sys, json\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH")))))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_root_skips_metadata(self):
+        self.assertNotIn("importlib.metadata", loaded("import typeclass"))
+
+    def test_symbols_import_their_package_on_use(self):
+        modules = loaded("from typeclass.typeclasses.symbols import fmap")
+
+        self.assertIn("typeclass.typeclasses.functor", modules)
+        self.assertNotIn("typeclass.typeclasses.arrow", modules)
+        self.assertNotIn("typeclass.interpret.run", modules)
+
+    def test_data_types_do_not_load_the_interpreter(self):
+        for module in ("typeclass.data.maybe", "typeclass.data.stream", "typeclass.data.morphism"):
+            with self.subTest(module=module):
+                self.assertNotIn("typeclass.interpret.run", loaded(f"import {module}"))
+
+
+class TestLazyAttributes(unittest.TestCase):
+    def test_package_attributes(self):
+        self.assertIs(typeclass.data.Just, Just)
+        self.assertIs(typeclass.interpret.evaluate, evaluate)
+        self.assertIs(typeclass.typeclasses.Functor, Functor)
+
+    def test_symbols_are_built_once(self):
+        self.assertIs(symbols.fmap, symbols.fmap)
+        self.assertIn("fmap", dir(symbols))
+
+    def test_unknown_names(self):
+        for module in (typeclass, typeclass.data, typeclass.interpret, typeclass.typeclasses, symbols):
+            with self.subTest(module=module.__name__):
+                with self.assertRaises(AttributeError):
+                    module.missing
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,15 @@
 # typeclass/tests/test_morphism.py
 
 import unittest
+from operator import add
 
+from typeclass.data.thunk import LoopDetected, NoFixpoint, delay
 from typeclass.data.morphism import Morphism
-from typeclass.interpret.run import run
+from typeclass.data.sequence import Sequence
+from typeclass.data.stream import Stream, iterate, take
+from typeclass.data.stream.lib import _zipwith
+from typeclass.interpret.run import run, evaluate
+from typeclass.typeclasses.symbols import arrow, loop
 from typeclass.tests.fixtures import morphism as fx_morphism
 
 from typeclass.tests.laws.semigroupoid import (
@@ -39,6 +45,12 @@ from typeclass.tests.laws.arrowchoice import (
 from typeclass.tests.laws.arrowapply import (
     arrowapply_arr_app_expr,
 )
+from typeclass.tests.laws.arrowloop import (
+    arrowloop_extension_expr,
+    arrowloop_left_tightening_expr,
+    arrowloop_right_tightening_expr,
+    arrowloop_superposing_expr,
+)
 
 
 class MorphismTestCase(unittest.TestCase):
@@ -192,3 +204,67 @@ class TestMorphismArrowApply(MorphismTestCase):
             with self.subTest(f=f):
                 lhs, rhs = arrowapply_arr_app_expr(Morphism, f)
                 self.assert_morphism_expr_equal(lhs, rhs)
+
+
+class TestMorphismArrowLoop(MorphismTestCase):
+    def test_arrowloop_extension(self):
+        for g in fx_morphism.arrow_functions():
+            with self.subTest(g=g):
+                lhs, rhs = arrowloop_extension_expr(Morphism, g)
+                self.assert_morphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_left_tightening(self):
+        for h in fx_morphism.values():
+            for f in fx_morphism.loop_bodies():
+                with self.subTest(h=h, f=f):
+                    lhs, rhs = arrowloop_left_tightening_expr(Morphism, h, f)
+                    self.assert_morphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_right_tightening(self):
+        for f in fx_morphism.loop_bodies():
+            for h in fx_morphism.values():
+                with self.subTest(f=f, h=h):
+                    lhs, rhs = arrowloop_right_tightening_expr(Morphism, f, h)
+                    self.assert_morphism_expr_equal(lhs, rhs)
+
+    def test_arrowloop_superposing(self):
+        for f in fx_morphism.loop_bodies():
+            with self.subTest(f=f):
+                lhs, rhs = arrowloop_superposing_expr(Morphism, f)
+                self.assert_morphism_expr_equal(lhs, rhs, inputs=fx_morphism.pair_inputs())
+
+
+class TestMorphismLoop(unittest.TestCase):
+    def test_lazy_feedback_ties_the_knot(self):
+        calls = []
+
+        def running_sum(pair):
+            xs, sums = pair
+            calls.append(xs)
+            out = _zipwith(add, delay(xs), delay(Stream(0, sums)))
+            return out, out
+
+        sums = evaluate(Morphism |loop| (Morphism |arrow| running_sum))
+        self.assertEqual(take(6, sums(iterate(lambda n: n + 1, 0))), Sequence((0, 1, 3, 6, 10, 15)))
+        self.assertEqual(len(calls), 1)
+
+    def test_strict_feedback_runs_to_a_fixpoint(self):
+        calls = []
+
+        def body(pair):
+            a, c = pair
+            calls.append(c.get(0))
+            return a + c.get(0), a * 2
+
+        self.assertEqual(evaluate(Morphism |loop| (Morphism |arrow| body))(5), 15)
+        self.assertEqual(calls, [0, 10])
+
+    def test_strict_feedback_without_an_estimate(self):
+        body = Morphism |arrow| (lambda p: (p[0] + p[1].force(), p[0]))
+        with self.assertRaises(LoopDetected):
+            evaluate(Morphism |loop| body)(1)
+
+    def test_divergent_feedback(self):
+        body = Morphism |arrow| (lambda pair: (pair[0], pair[1].get(0) + 1))
+        with self.assertRaises(NoFixpoint):
+            evaluate(Morphism |loop| body)(1)
@@ -0,0 +1,159 @@
+# typeclass/tests/test_optimize.py
+
+import sys
+import unittest
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.optimize import optimize, pure_function, Report, LIMIT
+from typeclass.interpret.syntax import size
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, return_, combine, arrow, compose
+from typeclass.typeclasses.category import identity
+from typeclass.typeclasses.monoid import mempty
+
+
+class TestOptimize(unittest.TestCase):
+    def test_functor_composition(self):
+        expr = ((Just(1) |fmap| (lambda v: v + 1)) |fmap| (lambda v: v * 10)) |fmap| str
+        report = Report()
+        optimized = optimize(expr, report)
+
+        self.assertEqual(evaluate(optimized), evaluate(expr))
+        self.assertEqual(report.rewrites["functor composition"], 2)
+        self.assertEqual((report.before, report.after), (3, 1))
+
+    def test_functor_composition_over_syntax(self):
+        inner = Just(2) |bind| (lambda v: Just(v + 1))
+        expr = (inner |fmap| (lambda v: v * 2)) |fmap| (lambda v: v - 1)
+
+        self.assertEqual(evaluate(optimize(expr)), Just(5))
+
+    def test_monad_left_identity(self):
+        f = pure_function(lambda v: Just(v * 3))
+        for unit in (Just |return_| 4, Just |pure| 4):
+            with self.subTest(unit=unit):
+                report = Report()
+                optimized = optimize(unit |bind| f, report)
+                self.assertEqual(evaluate(optimized), Just(12))
+                self.assertEqual(report.fired, 1)
+
+    def test_applicative_homomorphism(self):
+        expr = (Sequence |pure| pure_function(lambda v: v + 1)) |ap| (Sequence |pure| 1)
+        report = Report()
+
+        self.assertEqual(evaluate(optimize(expr, report)), Sequence((2,)))
+        self.assertEqual(report.rewrites["applicative homomorphism"], 1)
+
+    def test_unmarked_functions_are_not_called(self):
+        calls = []
+
+        def f(v):
+            calls.append(v)
+            return Just(v)
+
+        for expr in (
+            (Just |return_| 1) |bind| f,
+            (Just |pure| f) |ap| (Just |pure| 1),
+        ):
+            with self.subTest(expr=expr):
+                report = Report()
+                self.assertIs(optimize(expr, report), expr)
+                self.assertEqual(report.fired, 0)
+        self.assertEqual(calls, [])
+
+    def test_arrow_composition(self):
+        f = Morphism |arrow| (lambda v: v + 1)
+        g = Morphism |arrow| (lambda v: v * 2)
+        report = Report()
+        optimized = optimize(g |compose| f, report)
+
+        self.assertEqual(evaluate(optimized)(5), evaluate(g |compose| f)(5))
+        self.assertEqual(report.rewrites["arrow composition"], 1)
+        self.assertEqual(report.after, 1)
+
+    def test_arrow_composition_over_syntax(self):
+        f = Morphism |arrow| (lambda v: Just(v) |fmap| (lambda w: w + 1))
+        g = Morphism |arrow| (lambda m: m.value * 2)
+
+        self.assertEqual(evaluate(optimize(g |compose| f))(5), evaluate(g |compose| f)(5))
+
+    def test_category_identity(self):
+        f = Morphism |arrow| (lambda v: v + 1)
+        for expr in (identity(Morphism) |compose| f, f |compose| identity(Morphism)):
+            with self.subTest(expr=expr):
+                report = Report()
+                self.assertIs(optimize(expr, report), f)
+                self.assertEqual(report.rewrites["category identity"], 1)
+
+    def test_monoid_identity(self):
+        xs = Sequence((1, 2))
+        for expr in (mempty(Sequence) |combine| xs, xs |combine| mempty(Sequence)):
+            with self.subTest(expr=expr):
+                self.assertIs(optimize(expr), xs)
+
+    def test_untouched_expression(self):
+        expr = (Just(1) |bind| (lambda v: Nothing())) |combine| Just(2)
+        report = Report()
+
+        self.assertIs(optimize(expr, report), expr)
+        self.assertEqual(report.fired, 0)
+        self.assertEqual(report.before, report.after)
+
+    def test_shared_subterm_is_optimized_once(self):
+        shared = (Just(1) |fmap| (lambda v: v + 1)) |fmap| (lambda v: v + 1)
+        expr = shared |bind| (lambda v: shared)
+        report = Report()
+        optimize(expr, report)
+
+        self.assertEqual(report.rewrites["functor composition"], 1)
+
+    def test_raising_pure_functions_propagate(self):
+        @pure_function
+        def fail(v):
+            raise ValueError(v)
+
+        for expr in (
+            (Just |return_| 1) |bind| fail,
+            (Just |pure| fail) |ap| (Just |pure| 1),
+        ):
+            with self.subTest(expr=expr):
+                with self.assertRaises(ValueError):
+                    optimize(expr)
+
+    def test_recursive_bind_is_cut_off(self):
+        @pure_function
+        def forever(v):
+            return (Just |return_| v + 1) |bind| forever
+
+        report = Report()
+        optimize((Just |return_| 0) |bind| forever, report)
+        self.assertEqual(report.rewrites["monad left identity"], LIMIT)
+
+    def test_recursive_bind_keeps_its_meaning(self):
+        @pure_function
+        def count(v):
+            return Just(v) if v >= 20 else (Just |return_| v + 1) |bind| count
+
+        expr = (Just |return_| 0) |bind| count
+        report = Report()
+        optimized = optimize(expr, report, limit=8)
+
+        self.assertEqual(report.fired, 8)
+        self.assertEqual(evaluate(optimized), Just(20))
+        self.assertEqual(evaluate(optimize(expr, limit=1000)), Just(20))
+
+    def test_deep_chain(self):
+        depth = 10 * sys.getrecursionlimit()
+        expr = Just(0)
+        for _ in range(depth):
+            expr = expr |fmap| (lambda v: v + 1)
+
+        optimized = optimize(expr)
+        self.assertEqual(size(optimized), 1)
+        self.assertEqual(evaluate(optimized), Just(depth))
+
+
+if __name__ == "__main__":
+    unittest.main()
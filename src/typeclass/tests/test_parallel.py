@@ -0,0 +1,122 @@
+# typeclass/tests/test_parallel.py
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import get_context
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.parallel import Parallel
+from typeclass.interpret.serialize import named
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, arrow, fanout
+
+
+def checks(count, check):
+    expr = Just |pure| ()
+    for i in range(count):
+        expr = (expr |fmap| (lambda results: lambda r: results + (r,))) |ap| (Just(i) |bind| check)
+    return expr
+
+
+@named("tests.parallel.double")
+def double(i):
+    return Just(i * 2)
+
+
+class TestParallel(unittest.TestCase):
+    def test_ap_branches_run_concurrently(self):
+        barrier = threading.Barrier(8, timeout=5)
+
+        def check(i):
+            barrier.wait()
+            return Just(i * 2)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            env = Parallel(executor, threshold=0)
+            self.assertEqual(evaluate(checks(8, check), env), Just(tuple(range(0, 16, 2))))
+
+        self.assertEqual(env.forked, 8)
+
+    def test_default_forks_every_branch(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def check(i):
+            barrier.wait()
+            return Just(i)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            env = Parallel(executor)
+            self.assertEqual(evaluate(checks(4, check), env), Just((0, 1, 2, 3)))
+
+        self.assertEqual(env.forked, 4)
+
+    def test_threshold(self):
+        expr = checks(4, lambda i: Just(i))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            env = Parallel(executor, threshold=16)
+            self.assertEqual(evaluate(expr, env), evaluate(expr))
+
+        self.assertEqual(env.forked, 0)
+
+    def test_short_circuit(self):
+        expr = ((Just |pure| (lambda a: lambda b: a + b)) |ap| Nothing()) |ap| (Just(1) |bind| Just)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(evaluate(expr, Parallel(executor, threshold=0)), Nothing())
+
+    def test_fanout(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def step(v):
+            barrier.wait()
+            return v + 1
+
+        f = Morphism |arrow| step
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            env = Parallel(executor, threshold=0)
+            self.assertEqual(evaluate(f |fanout| (Morphism, f), env)(1), (2, 2))
+
+        self.assertEqual(env.forked, 1)
+
+    def test_nested_forks_on_a_single_worker(self):
+        expr = checks(16, lambda i: checks(2, lambda j: Just(i + j)) |fmap| sum)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(evaluate(expr, Parallel(executor, threshold=0)), evaluate(expr))
+
+    def test_unpicklable_branches_stay_local(self):
+        expr = checks(2, lambda i: Just(i))
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            env = Parallel(executor, threshold=0)
+            self.assertEqual(evaluate(expr, env), Just((0, 1)))
+
+        self.assertEqual(env.forked, 0)
+
+    def test_encoded_branches_are_shipped(self):
+        expr = (Just |pure| ()) |fmap| (lambda rs: lambda r: rs + (r,))
+        expr = expr |ap| (Just(3) |bind| double)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            env = Parallel(executor, threshold=0)
+            self.assertEqual(evaluate(expr, env), Just((6,)))
+
+        self.assertEqual(env.forked, 1)
+
+    def test_branches_the_worker_cannot_load_run_locally(self):
+        triple = named("tests.parallel.triple")(lambda i: Just(i * 3))
+        expr = (Just |pure| ()) |fmap| (lambda rs: lambda r: rs + (r,))
+        expr = expr |ap| (Just(3) |bind| triple)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            env = Parallel(executor, threshold=0)
+            self.assertEqual(evaluate(expr, env), Just((9,)))
+
+        self.assertEqual(env.forked, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
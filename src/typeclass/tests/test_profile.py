@@ -0,0 +1,114 @@
+# typeclass/tests/test_profile.py
+
+import os
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+
+from typeclass.data.maybe import Just
+from typeclass.data.thunk import Thunk
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate, register, HANDLERS
+from typeclass.interpret.profile import Profiler
+from typeclass.typeclasses.symbols import fmap, bind, arrow, fanout
+
+
+class TestProfiler(unittest.TestCase):
+    def test_counts_per_node_and_runtime_class(self):
+        expr = (Just(1) |fmap| (lambda v: v + 1)) |bind| (lambda v: Just(v) |fmap| str)
+
+        profiler = Profiler()
+        self.assertEqual(evaluate(expr, profiler), Just("2"))
+
+        self.assertEqual(profiler.stats["Map"].count, 2)
+        self.assertEqual(profiler.stats["Bind"].count, 1)
+        self.assertEqual(profiler.stats["Just.fmap"].count, 2)
+        self.assertEqual(profiler.stats["Just.bind"].count, 1)
+        self.assertGreater(profiler.stats["Map"].thunks, 0)
+        self.assertGreaterEqual(profiler.stats["Bind"].cumulative, profiler.stats["Bind"].own)
+
+    def test_derived_arrow_nodes(self):
+        inc = Morphism |arrow| (lambda v: v + 1)
+
+        profiler = Profiler()
+        self.assertEqual(evaluate(inc |fanout| (Morphism, inc), profiler)(1), (2, 2))
+
+        self.assertIn("Fanout", profiler.stats)
+        self.assertIn("Morphism.compose", profiler.stats)
+        self.assertNotIn("Morphism.fanout", profiler.stats)
+
+    def test_collapsed_stacks(self):
+        expr = (Just(1) |fmap| (lambda v: v + 1)) |fmap| str
+
+        profiler = Profiler()
+        evaluate(expr, profiler)
+
+        stacks = dict(line.rsplit(" ", 1) for line in profiler.collapsed().splitlines())
+        self.assertIn("Map;Map;Just.fmap", stacks)
+        self.assertTrue(all(int(weight) > 0 for weight in stacks.values()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "expr.folded")
+            profiler.dump(path)
+            with open(path) as file:
+                self.assertEqual(file.read(), profiler.collapsed() + "\n")
+
+    def test_leaves_the_interpreter_alone(self):
+        handlers, init = dict(HANDLERS), Thunk.__init__
+        seen = []
+
+        def f(v):
+            seen.append((dict(HANDLERS), Thunk.__init__ is init))
+            return v / 0
+
+        with self.assertRaises(ZeroDivisionError):
+            evaluate(Just(1) |fmap| f, Profiler())
+
+        self.assertEqual(seen, [(handlers, False)])
+        self.assertEqual(HANDLERS, handlers)
+        self.assertIs(Thunk.__init__, init)
+
+    def test_handlers_registered_while_profiling_are_kept(self):
+        @dataclass(frozen=True)
+        class Twice:
+            value: object
+
+        def f(v):
+            register(Twice, lambda free, run, cofree, env: free.value * 2)
+            return Just(v)
+
+        try:
+            evaluate(Just(1) |bind| f, Profiler())
+            self.assertIn(Twice, HANDLERS)
+            self.assertEqual(evaluate(Twice(3)), 6)
+        finally:
+            HANDLERS.pop(Twice, None)
+
+    def test_threads_keep_their_own_paths(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def step(v):
+            barrier.wait()
+            return Just(v + 1)
+
+        def profile(results):
+            profiler = Profiler()
+            results.append((evaluate((Just(1) |fmap| str) |bind| (lambda v: step(len(v))), profiler), profiler))
+
+        results = []
+        threads = [threading.Thread(target=profile, args=(results,)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for value, profiler in results:
+            self.assertEqual(value, Just(2))
+            self.assertEqual(profiler.stats["Map"].count, 1)
+            self.assertEqual(profiler.stats["Bind"].count, 1)
+            self.assertEqual(profiler.stats["Just.bind"].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+# typeclass/tests/test_run.py
+
+import sys
+import unittest
+from dataclasses import dataclass
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.either import Left, Right
+from typeclass.data.thunk import Thunk
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import run, evaluate, register, Env, HANDLERS
+from typeclass.interpret.lowering import LOWERED
+from typeclass.typeclasses.symbols import bind, fmap, combine, ap, compose, arrow, second, fanout, oror
+
+
+DEPTH = 10 * sys.getrecursionlimit()
+
+
+class TestRunStackSafety(unittest.TestCase):
+    def test_left_nested_bind(self):
+        expr = Just(0)
+        for _ in range(DEPTH):
+            expr = expr |bind| (lambda x: Just(x + 1))
+
+        self.assertEqual(evaluate(expr), Just(DEPTH))
+
+    def test_left_nested_bind_short_circuits(self):
+        expr = Nothing()
+        for _ in range(DEPTH):
+            expr = expr |bind| (lambda x: Just(x + 1))
+
+        self.assertEqual(evaluate(expr), Nothing())
+
+    def test_right_nested_bind(self):
+        def count(n):
+            return Just(n) |bind| (lambda x: count(x - 1) if x else Just("done"))
+
+        self.assertEqual(evaluate(count(DEPTH)), Just("done"))
+        self.assertEqual(evaluate(count(DEPTH), Env()), Just("done"))
+
+    def test_right_nested_bind_short_circuits(self):
+        def count(n):
+            return Right(n) |bind| (lambda x: count(x - 1) if x else Left("done"))
+
+        self.assertEqual(evaluate(count(DEPTH)), Left("done"))
+
+    def test_right_nested_bind_over_a_runtime_using_the_result(self):
+        def pairs(n):
+            if not n:
+                return Sequence(((),))
+            return Sequence((0, 1)) |bind| (lambda x: pairs(n - 1) |fmap| (lambda rest: (x, *rest)))
+
+        self.assertEqual(evaluate(pairs(2)), Sequence(((0, 0), (0, 1), (1, 0), (1, 1))))
+
+    def test_left_nested_fmap(self):
+        expr = Just(0)
+        for _ in range(DEPTH):
+            expr = expr |fmap| (lambda x: x + 1)
+
+        self.assertEqual(run(expr, None, None).force(), Just(DEPTH))
+
+    def test_left_nested_ap(self):
+        expr = Just(0)
+        for _ in range(DEPTH):
+            expr = (expr |fmap| (lambda x: lambda y: x + y)) |ap| Just(1)
+
+        self.assertEqual(evaluate(expr), Just(DEPTH))
+
+    def test_left_nested_combine(self):
+        expr = Sequence(())
+        for i in range(DEPTH):
+            expr = expr |combine| Sequence((i,))
+
+        self.assertEqual(evaluate(expr), Sequence(tuple(range(DEPTH))))
+
+
+class TestRunLaziness(unittest.TestCase):
+    def test_run_defers_evaluation(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return Just(x)
+
+        thunk = run(Just(1) |bind| f, None, None)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(thunk.force(), Just(1))
+        self.assertEqual(calls, [1])
+
+
+class TestRunLowering(unittest.TestCase):
+    def test_derived_nodes_are_lowered_once(self):
+        inc = Morphism |arrow| (lambda v: v + 1)
+        fan = inc |fanout| (Morphism, Morphism |arrow| (lambda v: v * 2))
+        circuit = (Morphism |second| inc) |compose| fan
+        evaluate(circuit)(1)
+        lowered = LOWERED.copy()
+
+        for value in range(3):
+            self.assertEqual(evaluate(circuit)(value), (value + 1, value * 2 + 1))
+        self.assertEqual(LOWERED, lowered)
+
+    def test_choice_nodes_are_lowered_once(self):
+        choose = (Morphism |arrow| (lambda v: v + 1)) |oror| (Morphism, Morphism |arrow| len)
+        self.assertEqual(evaluate(choose)(Left(1)), 2)
+        lowered = LOWERED.copy()
+
+        self.assertEqual(evaluate(choose)(Right("abc")), 3)
+        self.assertEqual(LOWERED, lowered)
+
+
+class TestRunEnv(unittest.TestCase):
+    def test_shared_operand_is_normalized_once(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Sequence((v, v * 10))
+
+        shared = Sequence((1, 2)) |bind| g
+        expr = (shared |fmap| (lambda a: lambda b: (a, b))) |ap| shared
+        env = Env()
+
+        self.assertEqual(evaluate(expr, env), evaluate(expr))
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(env.hits, 1)
+
+    def test_without_env_nothing_is_shared(self):
+        calls = []
+        shared = Just(1) |bind| (lambda v: calls.append(v) or Just(v))
+        expr = shared |bind| (lambda v: shared)
+
+        evaluate(expr)
+        self.assertEqual(calls, [1, 1])
+
+        calls.clear()
+        env = Env()
+        evaluate(expr, env)
+        self.assertEqual(calls, [1])
+        self.assertEqual((env.hits, env.misses), (1, 2))
+
+    def test_lowering_is_memoized_with_its_node(self):
+        inc = Morphism |arrow| (lambda v: v + 1)
+        fan = inc |fanout| (Morphism, inc)
+        env = Env()
+
+        self.assertEqual(evaluate(fan, env)(1), (2, 2))
+        self.assertGreater(env.hits, 0)
+
+    def test_deep_chain(self):
+        expr = Just(0)
+        for _ in range(DEPTH):
+            expr = expr |bind| (lambda x: Just(x + 1))
+
+        env = Env()
+        self.assertEqual(evaluate(expr, env), Just(DEPTH))
+        self.assertEqual(env.misses, DEPTH)
+
+
+@dataclass
+class Twice:
+    value: Thunk
+
+
+def handle_twice(free, run, cofree, env):
+    value = yield free.value.force()
+    return value |combine| value
+
+
+class TestRunDispatch(unittest.TestCase):
+    def setUp(self):
+        register(Twice, handle_twice)
+
+    def tearDown(self):
+        del HANDLERS[Twice]
+
+    def test_registered_handler(self):
+        expr = Twice(Thunk(lambda: Sequence((1,)) |combine| Sequence((2,))))
+        self.assertEqual(evaluate(expr), Sequence((1, 2, 1, 2)))
+
+    def test_registered_handler_nested(self):
+        expr = Twice(Thunk(lambda: Twice(Thunk(lambda: Sequence((1,))))))
+        self.assertEqual(evaluate(expr |fmap| (lambda x: x + 1)), Sequence((2, 2, 2, 2)))
+
+    def test_unregistered_values_are_returned(self):
+        value = Sequence((1,))
+        self.assertIs(evaluate(value), value)
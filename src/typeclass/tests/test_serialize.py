@@ -0,0 +1,116 @@
+# typeclass/tests/test_serialize.py
+
+import pickle
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from typeclass.data.maybe import Just, Nothing
+from typeclass.data.sequence import Sequence
+from typeclass.data.morphism import Morphism
+from typeclass.interpret.run import evaluate
+from typeclass.interpret.compile import compile, param
+from typeclass.interpret.serialize import (
+    FUNCTIONS, NotSerializable, dumps, evaluate_encoded, loads, named, register_function,
+)
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine, arrow, fanout
+
+
+@named("tests.serialize.inc")
+def inc(v):
+    return v + 1
+
+
+@named("tests.serialize.halve")
+def halve(v):
+    return Just(v // 2) if v % 2 == 0 else Nothing()
+
+
+@named("tests.serialize.add")
+def add(a):
+    return lambda b: a + b
+
+
+class TestSerialize(unittest.TestCase):
+    def roundtrip(self, expr):
+        data = dumps(expr)
+        self.assertIsInstance(data, bytes)
+        return loads(data)
+
+    def test_roundtrip(self):
+        exprs = [
+            (Just(4) |fmap| inc) |bind| halve,
+            (Sequence |pure| add) |ap| Sequence((1, 2)) |ap| Sequence((10,)),
+            Sequence((1,)) |combine| Sequence((2,)),
+            Just(3),
+        ]
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(evaluate(self.roundtrip(expr)), evaluate(expr))
+
+    def test_arrows(self):
+        f = Morphism |arrow| inc
+        self.assertEqual(evaluate(self.roundtrip(f |fanout| (Morphism, f)))(1), (2, 2))
+
+    def test_sharing_is_preserved(self):
+        loaded = self.roundtrip((Just(1) |fmap| inc) |bind| halve)
+        self.assertIs(loaded.f.force(), halve)
+
+        both = self.roundtrip((Sequence((1,)) |fmap| inc) |combine| (Sequence((1,)) |fmap| inc))
+        self.assertIsNot(both.a.force(), both.b.force())
+
+        node = Sequence((1,)) |fmap| inc
+        twice = self.roundtrip(node |combine| node)
+        self.assertIs(twice.a.force(), twice.b.force())
+
+    def test_params_compile_after_loading(self):
+        plan = compile(self.roundtrip(param("x") |fmap| inc))
+        self.assertEqual(plan(x=Just(1)), Just(2))
+
+    def test_unregistered_lambda(self):
+        with self.assertRaises(NotSerializable):
+            dumps(Just(1) |fmap| (lambda v: v))
+
+    def test_missing_registration(self):
+        temporary = lambda v: v
+        register_function("tests.serialize.temporary", temporary)
+        data = dumps(Just(-1) |fmap| temporary)
+        del FUNCTIONS["tests.serialize.temporary"]
+
+        with self.assertRaises(LookupError):
+            loads(data)
+
+    def test_missing_registration_resolves_through_the_module(self):
+        data = dumps(Just(1) |fmap| inc)
+        del FUNCTIONS["tests.serialize.inc"]
+        try:
+            self.assertEqual(evaluate(loads(data)), Just(2))
+            self.assertIs(FUNCTIONS["tests.serialize.inc"], inc)
+        finally:
+            FUNCTIONS["tests.serialize.inc"] = inc
+
+    def test_loads_in_a_spawned_process(self):
+        expr = (Just(4) |bind| halve) |fmap| inc
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            self.assertEqual(executor.submit(evaluate_encoded, dumps(expr)).result(), Just(3))
+
+    def test_name_collision(self):
+        with self.assertRaises(ValueError):
+            register_function("tests.serialize.inc", lambda v: v)
+
+    def test_rejects_foreign_data(self):
+        with self.assertRaises(ValueError):
+            loads(pickle.dumps(1))
+
+    def test_deep_expression(self):
+        expr = Just(0)
+        for _ in range(10 * sys.getrecursionlimit()):
+            expr = expr |fmap| inc
+
+        self.assertEqual(evaluate(self.roundtrip(expr)), Just(10 * sys.getrecursionlimit()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-from typeclass.data.stream import Stream
+from typeclass.data.stream import Stream, iterate, prefetch
+from typeclass.data.stream.lib import _prefetch
 from typeclass.interpret.run import run
 from typeclass.tests.fixtures import stream as fx_stream
 
@@ -176,5 +180,50 @@ class TestStreamComonad(StreamTestCase):
                 self.assert_expr_equal(lhs, rhs, prefix=6)
 
 
+class TestStreamPrefetch(unittest.TestCase):
+    def test_same_elements(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stream = prefetch(3, executor, iterate(lambda n: n + 1, 0))
+            self.assertEqual(list(islice(stream, 100)), list(range(100)))
+
+    def test_reads_ahead_by_count(self):
+        computed = []
+
+        def step(n):
+            computed.append(n + 1)
+            return n + 1
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stream = _prefetch(4, executor, iterate(step, 0))
+        # Leaving the block waits for every task submitted so far.
+
+        self.assertEqual(sorted(computed), [1, 2, 3, 4])
+        self.assertEqual(stream.head, 0)
+
+    def test_overlaps_with_the_consumer(self):
+        workers, ready = [], threading.Event()
+
+        def step(n):
+            workers.append(threading.get_ident())
+            if len(workers) == 8:
+                ready.set()
+            return n + 1
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stream = _prefetch(8, executor, iterate(step, 0))
+            self.assertTrue(ready.wait(5))
+
+            self.assertEqual(list(islice(stream, 9)), list(range(9)))
+            self.assertNotIn(threading.get_ident(), workers)
+
+    def test_zero_is_the_stream(self):
+        stream = iterate(lambda n: n + 1, 0)
+        self.assertIs(_prefetch(0, None, stream), stream)
+
+    def test_negative_count(self):
+        with self.assertRaises(ValueError):
+            _prefetch(-1, None, iterate(lambda n: n + 1, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
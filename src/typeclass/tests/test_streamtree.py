@@ -1,6 +1,13 @@
+import gc
 import unittest
+import weakref
+from itertools import islice
 
+from typeclass.data.thunk import Evictable, RETAINED
 from typeclass.data.streamtree import StreamTree
+from typeclass.data.streamtree.lib import paths, depths, widths, coordinates
+from typeclass.interpret.run import evaluate
+from typeclass.typeclasses.symbols import pure, ap
 from typeclass.interpret.run import run
 from typeclass.tests.fixtures import streamtree as fx_streamtree
 
@@ -175,3 +182,51 @@ class TestStreamTreeComonad(StreamTreeTestCase):
                 lhs, rhs = comonad_duplicate_associativity_expr(value)
                 self.assert_expr_equal(lhs, rhs, prefix=6)
 
+
+
+def explore(tree, depth, width):
+    """
+    The nodes of `tree` down to `depth`, following the first `width`
+    children of each node, in depth-first order.
+    """
+    yield tree
+    if depth:
+        for child in islice(tree.children.force(), width):
+            yield from explore(child, depth - 1, width)
+
+
+class TestStreamTreeEvictable(unittest.TestCase):
+    def setUp(self):
+        self.maxsize = RETAINED.resize(16)
+        RETAINED.clear()
+
+    def tearDown(self):
+        RETAINED.resize(self.maxsize)
+        RETAINED.clear()
+
+    def test_paths_in_bounded_memory(self):
+        tree = paths(thunk=Evictable)
+        expected = [node.value for node in explore(paths(), 3, 4)]
+
+        nodes = [weakref.ref(node) for node in explore(tree, 3, 4)]
+        gc.collect()
+        self.assertEqual(len(nodes), len(expected))
+        self.assertLessEqual(sum(node() is not None for node in nodes), 32)
+
+        misses = RETAINED.misses
+        self.assertEqual([node.value for node in explore(tree, 3, 4)], expected)
+        self.assertGreater(RETAINED.misses, misses)
+
+    def test_coordinates_in_bounded_memory(self):
+        product = StreamTree |pure| (lambda x: lambda y: (x, y)) |ap| depths() |ap| widths()
+        expected = [node.value for node in explore(evaluate(product), 3, 4)]
+        self.assertEqual([node.value for node in explore(coordinates(), 3, 4)], expected)
+
+        tree = coordinates(Evictable)
+        nodes = [weakref.ref(node) for node in explore(tree, 3, 4)]
+        gc.collect()
+        self.assertLessEqual(sum(node() is not None for node in nodes), 32)
+
+        misses = RETAINED.misses
+        self.assertEqual([node.value for node in explore(tree, 3, 4)], expected)
+        self.assertGreater(RETAINED.misses, misses)
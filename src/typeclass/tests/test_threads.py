@@ -0,0 +1,233 @@
+# typeclass/tests/test_threads.py
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from typeclass.data import thunk
+from typeclass.data.thunk import Thunk, delay, threadsafe
+from typeclass.data.sequence import Sequence
+from typeclass.data.stream.lib import _iterate
+from typeclass.interpret.run import run, evaluate
+from typeclass.interpret.cse import cse
+from typeclass.interpret.parallel import Parallel
+from typeclass.interpret.batch import PARAMETERS, parameters
+from typeclass.typeclasses.symbols import fmap, bind, ap, pure, combine
+
+THREADS = 8
+
+
+def together(count, work):
+    """
+    Run `work(i)` on `count` threads released at once; return the results
+    in thread order and re-raise the first failure.
+    """
+    barrier = threading.Barrier(count, timeout=10)
+    results, errors = [None] * count, []
+
+    def body(i):
+        try:
+            barrier.wait()
+            results[i] = work(i)
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=body, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+class Threaded(unittest.TestCase):
+    """
+    Runs each test with once-only forcing on and, on a GIL build, a tiny
+    switch interval so threads interleave inside computations.
+    """
+
+    def setUp(self):
+        self.previous = threadsafe(True)
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        threadsafe(self.previous)
+        sys.setswitchinterval(self.interval)
+
+
+class TestThreadsafe(unittest.TestCase):
+    def test_default_follows_the_build(self):
+        code = "import sys; from typeclass.data.thunk import THREADSAFE; print(THREADSAFE, getattr(sys, '_is_gil_enabled', lambda: True)())"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+        default, gil = result.stdout.split()
+        self.assertEqual(default == "True", gil == "False")
+
+    def test_toggle_returns_previous(self):
+        previous = threadsafe(False)
+        try:
+            self.assertFalse(threadsafe(True))
+            self.assertTrue(thunk.THREADSAFE)
+        finally:
+            threadsafe(previous)
+
+
+class TestThunk(Threaded):
+    def test_computation_runs_once(self):
+        calls = []
+
+        def slow():
+            calls.append(threading.get_ident())
+            time.sleep(0.01)
+            return object()
+
+        shared = Thunk(slow)
+        results = together(THREADS * 2, lambda _: shared.force())
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_many_thunks(self):
+        calls = []
+        thunks = [Thunk(lambda i=i: calls.append(i) or i) for i in range(2000)]
+
+        results = together(THREADS, lambda _: [t.force() for t in thunks])
+
+        self.assertEqual(sorted(calls), list(range(2000)))
+        self.assertTrue(all(result == list(range(2000)) for result in results))
+
+    def test_failure_is_retried(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(None)
+            if len(attempts) == 1:
+                raise ValueError("first attempt")
+            return "ok"
+
+        shared = Thunk(flaky)
+        with self.assertRaises(ValueError):
+            shared.force()
+
+        self.assertEqual(together(THREADS, lambda _: shared.force()), ["ok"] * THREADS)
+        self.assertEqual(len(attempts), 2)
+
+    def test_lock_is_dropped_once_evaluated(self):
+        shared = Thunk(lambda: 1)
+        together(THREADS, lambda _: shared.force())
+        self.assertIsNone(shared._lock)
+
+    def test_off_does_not_lock(self):
+        threadsafe(False)
+        shared = Thunk(lambda: 1)
+        self.assertEqual(shared.force(), 1)
+        self.assertIsNone(shared._lock)
+
+
+class TestStream(Threaded):
+    def test_shared_stream_computes_each_element_once(self):
+        calls = []
+
+        def step(n):
+            calls.append(n)
+            return n + 1
+
+        stream = _iterate(step, 0)
+        doubled = stream.fmap(delay(lambda n: n * 2))
+        results = together(THREADS, lambda _: list(islice(doubled, 3000)))
+
+        self.assertEqual(sorted(calls), list(range(2999)))
+        self.assertTrue(all(result == list(range(0, 6000, 2)) for result in results))
+
+    def test_readers_at_different_offsets(self):
+        calls = []
+        stream = _iterate(lambda n: calls.append(n) or n + 1, 0)
+
+        results = together(THREADS, lambda i: list(islice(stream, i * 100, i * 100 + 500)))
+
+        for i, result in enumerate(results):
+            self.assertEqual(result, list(range(i * 100, i * 100 + 500)))
+        self.assertEqual(len(calls), len(set(calls)))
+
+
+class TestInterpreter(Threaded):
+    def test_shared_run_thunk(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            time.sleep(0.001)
+            return Sequence((v, v))
+
+        result = run(Sequence((1, 2, 3)) |bind| g, None, None)
+        values = together(THREADS, lambda _: result.force())
+
+        self.assertEqual(sorted(calls), [1, 2, 3])
+        self.assertTrue(all(value is values[0] for value in values))
+
+    def test_shared_node_runs_once_across_threads(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            time.sleep(0.001)
+            return Sequence((v,))
+
+        xs = Sequence((1, 2))
+        build = lambda: (xs |bind| g) |fmap| (lambda v: v * 10)
+        add = Sequence |pure| (lambda a: lambda b: a + b)
+        expr = cse((add |ap| build()) |ap| build())
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            for enabled in (True, False):
+                threadsafe(enabled)
+                for _ in range(20):
+                    calls.clear()
+                    result = evaluate(expr, Parallel(executor))
+                    self.assertEqual(sorted(calls), [1, 2])
+                    self.assertEqual(result, Sequence((20, 30, 30, 40)))
+
+    def test_independent_evaluations_share_nothing(self):
+        calls = []
+
+        def g(v):
+            calls.append(v)
+            return Sequence((v,))
+
+        xs = Sequence((1, 2))
+        build = lambda: (xs |bind| g) |fmap| (lambda v: v * 10)
+        expr = cse(build() |combine| build())
+
+        results = together(THREADS, lambda _: evaluate(expr))
+
+        self.assertEqual(sorted(calls), sorted([1, 2] * THREADS))
+        self.assertTrue(all(result == Sequence((10, 20, 10, 20)) for result in results))
+
+    def test_independent_evaluations(self):
+        def program(i):
+            expr = Sequence((i,))
+            for _ in range(200):
+                expr = expr |fmap| (lambda v: v + 1)
+            return evaluate(expr)
+
+        results = together(THREADS, program)
+        self.assertEqual(results, [Sequence((i + 200,)) for i in range(THREADS)])
+
+    def test_parameter_names(self):
+        grown = len(PARAMETERS)
+        together(THREADS, lambda i: parameters(grown + 50 * (i + 1)))
+        self.assertEqual(PARAMETERS, [f"x{i}" for i in range(len(PARAMETERS))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,485 @@
+# typeclass/tests/test_thunk.py
+
+import gc
+import threading
+import time
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import islice
+
+from typeclass.data.thunk import (
+    Thunk, Strict, Feedback, Forward, FutureThunk, Evictable, LoopDetected,
+    RETAINED, WAITING, delay, resume, recompute, threadsafe,
+)
+from typeclass.data.maybe import Just
+from typeclass.data.stream import Stream
+from typeclass.data.stream.lib import _iterate
+from typeclass.data.parser import Parser
+from typeclass.data.parser.lib import fix
+from typeclass.interpret.run import run
+from typeclass.typeclasses.symbols import fmap
+
+
+class Captured:
+    pass
+
+
+def holding(value):
+    return Thunk(lambda: value and 1)
+
+
+class TestSlots(unittest.TestCase):
+    def test_instances_have_no_dict(self):
+        for thunk in (Thunk(int), Strict(1), Feedback(1)):
+            with self.subTest(type(thunk).__name__):
+                self.assertFalse(hasattr(thunk, "__dict__"))
+
+    def test_subclasses_keep_their_behaviour(self):
+        feedback = Feedback(1)
+        self.assertEqual(feedback.force(), 1)
+        self.assertTrue(feedback.demanded)
+        feedback.tie(2)
+        self.assertEqual(feedback.force(), 2)
+        self.assertEqual(repr(feedback), "Feedback(2)")
+        self.assertEqual(repr(delay(3)), "Strict(3)")
+
+
+class TestRelease(unittest.TestCase):
+    def test_closure_is_dropped_after_forcing(self):
+        captured = Captured()
+        alive = weakref.ref(captured)
+        thunk = holding(captured)
+        del captured
+
+        self.assertEqual(repr(thunk), "Thunk(<unevaluated>)")
+        self.assertEqual(thunk.force(), 1)
+        gc.collect()
+
+        self.assertIsNone(alive())
+        self.assertEqual(thunk.force(), 1)
+        self.assertEqual(repr(thunk), "Thunk(1)")
+
+    def test_failure_keeps_the_closure(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(None)
+            if len(attempts) == 1:
+                raise ValueError
+            return "ok"
+
+        thunk = Thunk(flaky)
+        with self.assertRaises(ValueError):
+            thunk.force()
+        self.assertEqual(thunk.force(), "ok")
+
+    def test_mapped_stream_releases_its_source(self):
+        source = _iterate(lambda n: n + 1, 0)
+        alive = weakref.ref(source)
+        mapped = source.fmap(delay(lambda n: n * 2))
+        del source
+
+        self.assertEqual(list(islice(mapped, 5)), [0, 2, 4, 6, 8])
+        gc.collect()
+        self.assertIsNone(alive())
+
+    def test_forced_run_releases_its_tree(self):
+        expr = Just(0)
+        for _ in range(100):
+            expr = expr |fmap| (lambda v: v + 1)
+        alive = weakref.ref(expr)
+
+        result = run(expr, None, None)
+        del expr
+        self.assertEqual(result.force(), Just(100))
+        gc.collect()
+        self.assertIsNone(alive())
+
+
+def countdown(n):
+    return delay("done") if n == 0 else resume(countdown, n - 1)
+
+
+class TestForward(unittest.TestCase):
+    DEPTH = 100_000
+
+    def test_deep_chain_built_while_forcing(self):
+        self.assertEqual(countdown(self.DEPTH).force(), "done")
+
+    def test_deep_chain_built_ahead(self):
+        links = [resume(lambda: delay(7))]
+        for _ in range(self.DEPTH):
+            links.append(resume(lambda previous: previous, links[-1]))
+
+        self.assertEqual(links[-1].force(), 7)
+        self.assertTrue(all(link._thunk is None and link._target is None for link in links))
+        self.assertEqual(links[len(links) // 2].force(), 7)
+
+    def test_each_link_runs_once(self):
+        calls = []
+
+        def step(n):
+            calls.append(n)
+            return Thunk(lambda: n) if n == 0 else resume(step, n - 1)
+
+        head = resume(step, 3)
+        middle = head._follow()._follow()
+
+        self.assertEqual(middle.force(), 0)
+        self.assertEqual(head.force(), 0)
+        self.assertEqual(calls, [3, 2, 1, 0])
+
+    def test_failure_is_retried(self):
+        attempts = []
+
+        def last():
+            attempts.append(None)
+            if len(attempts) == 1:
+                raise ValueError
+            return "ok"
+
+        chain = resume(lambda: resume(lambda: Thunk(last)))
+        with self.assertRaises(ValueError):
+            chain.force()
+        self.assertEqual(chain.force(), "ok")
+
+    def test_forward_to_a_plain_thunk_releases_the_chain(self):
+        captured = Captured()
+        alive = weakref.ref(captured)
+        chain = resume(lambda held: holding(held), captured)
+        del captured
+
+        self.assertIsInstance(chain, Forward)
+        self.assertEqual(chain.force(), 1)
+        gc.collect()
+        self.assertIsNone(alive())
+
+    def test_threads_share_one_walk(self):
+        previous = threadsafe(True)
+        try:
+            calls = []
+
+            def step(n):
+                calls.append(n)
+                return delay(n) if n == 0 else resume(step, n - 1)
+
+            head = resume(step, 5000)
+            barrier = threading.Barrier(8, timeout=10)
+            results = []
+
+            def reader():
+                barrier.wait()
+                results.append(head.force())
+
+            threads = [threading.Thread(target=reader) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            threadsafe(previous)
+
+        self.assertEqual(results, [0] * 8)
+        self.assertEqual(sorted(calls), list(range(5001)))
+
+
+class Blackholing:
+    """
+    Re-entry cases, run with once-only forcing off and on by the two
+    subclasses below.
+    """
+    THREADSAFE = False
+
+    def setUp(self):
+        self.previous = threadsafe(self.THREADSAFE)
+
+    def tearDown(self):
+        threadsafe(self.previous)
+
+    def test_self_reference(self):
+        knot = Thunk(lambda: knot.force() + 1)
+
+        with self.assertRaises(LoopDetected):
+            knot.force()
+        self.assertEqual(repr(knot), "Thunk(<unevaluated>)")
+
+    def test_mutual_reference(self):
+        a = Thunk(lambda: b.force())
+        b = Thunk(lambda: a.force())
+
+        with self.assertRaises(LoopDetected):
+            a.force()
+        with self.assertRaises(LoopDetected):
+            b.force()
+
+    def test_evictable_self_reference(self):
+        knot = Evictable(lambda: knot.force() + 1)
+
+        with self.assertRaises(LoopDetected):
+            knot.force()
+        with self.assertRaises(LoopDetected):
+            knot.force()
+        self.assertEqual(repr(knot), "Evictable(<evicted>)")
+
+    def test_tied_stream(self):
+        ones = Thunk(lambda: Stream(1, ones))
+        self.assertEqual(list(islice(ones.force(), 5)), [1] * 5)
+
+    def test_stream_forcing_itself(self):
+        xs = Thunk(lambda: Stream(1, delay(xs.force().fmap(delay(lambda n: n + 1)))))
+
+        with self.assertRaises(LoopDetected):
+            xs.force()
+
+    def test_forward_cycles(self):
+        itself = resume(lambda: itself)
+        a = resume(lambda: b)
+        b = resume(lambda: resume(lambda: a))
+
+        with self.assertRaises(LoopDetected):
+            itself.force()
+        with self.assertRaises(LoopDetected):
+            a.force()
+
+    def test_forward_forcing_itself(self):
+        link = resume(lambda: delay(link.force()))
+
+        with self.assertRaises(LoopDetected):
+            link.force()
+
+    def test_fix(self):
+        length = fix(lambda p: Parser(
+            lambda s: [(0, s)] if not s else [(n + 1, rest) for n, rest in p.run(s[1:])]
+        ))
+        self.assertEqual(length.run("abc"), [(3, "")])
+
+        with self.assertRaises(LoopDetected):
+            fix(lambda p: p.run("abc") and p)
+
+
+class TestBlackholing(Blackholing, unittest.TestCase):
+    def test_other_threads_wait(self):
+        started, calls = threading.Event(), []
+
+        def slow():
+            calls.append(None)
+            started.set()
+            time.sleep(0.05)
+            return object()
+
+        shared = Thunk(slow)
+        results = []
+        owner = threading.Thread(target=lambda: results.append(shared.force()))
+        owner.start()
+        started.wait(5)
+
+        self.assertEqual(repr(shared), "Thunk(<evaluating>)")
+        value = shared.force()
+        owner.join()
+
+        self.assertIs(value, results[0])
+        self.assertEqual(len(calls), 1)
+
+    def waiting(self, make):
+        """
+        A Thunk of `make` held blackholed by one thread until `finish` is set,
+        and forced by a second, `waiter`, which appends its value to `results`.
+        """
+        started, finish, results = threading.Event(), threading.Event(), []
+        shared = Thunk(lambda: started.set() or finish.wait(5) and make())
+
+        def owner():
+            try:
+                shared.force()
+            except ValueError:
+                pass
+
+        threading.Thread(target=owner).start()
+        started.wait(5)
+
+        waiter = threading.Thread(target=lambda: results.append(shared.force()))
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while shared not in WAITING and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertIn(shared, WAITING)
+        return shared, finish, waiter, results
+
+    def test_waiting_threads_block_on_an_event(self):
+        shared, finish, waiter, results = self.waiting(lambda: "done")
+
+        finish.set()
+        waiter.join(5)
+        self.assertEqual(results, ["done"])
+        self.assertNotIn(shared, WAITING)
+
+    def test_waiting_threads_retry_after_a_failure(self):
+        made = []
+
+        def make():
+            made.append(None)
+            if len(made) == 1:
+                raise ValueError("first attempt")
+            return "done"
+
+        shared, finish, waiter, results = self.waiting(make)
+
+        finish.set()
+        waiter.join(5)
+        self.assertEqual(results, ["done"])
+        self.assertEqual(len(made), 2)
+        self.assertNotIn(shared, WAITING)
+
+
+class TestBlackholingThreadsafe(Blackholing, unittest.TestCase):
+    THREADSAFE = True
+
+
+def square(n):
+    return n * n
+
+
+class TestFutureThunk(unittest.TestCase):
+    def test_runs_ahead_of_demand(self):
+        started = threading.Event()
+
+        def work():
+            started.set()
+            return 42
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = FutureThunk(executor, work)
+            self.assertTrue(started.wait(5))
+            self.assertEqual(future.force(), 42)
+            self.assertEqual(future.force(), 42)
+
+    def test_force_runs_queued_work_in_place(self):
+        gate, threads = threading.Event(), []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(gate.wait, 5)
+            queued = FutureThunk(executor, lambda: threads.append(threading.get_ident()) or 1)
+
+            self.assertEqual(queued.force(), 1)
+            gate.set()
+
+        self.assertEqual(threads, [threading.get_ident()])
+
+    def test_background_error(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            failing = FutureThunk(executor, lambda: 1 // 0)
+            with self.assertRaises(ZeroDivisionError):
+                failing.force()
+
+    def test_releases_its_arguments(self):
+        captured = Captured()
+        alive = weakref.ref(captured)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = FutureThunk(executor, lambda held: 1, captured)
+            del captured
+            self.assertEqual(future.force(), 1)
+        gc.collect()
+
+        self.assertIsNone(alive())
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(FutureThunk(executor, square, 12).force(), 144)
+
+
+class Box:
+    def __init__(self, value):
+        self.value = value
+
+
+class TestEvictable(unittest.TestCase):
+    def setUp(self):
+        self.maxsize = RETAINED.resize(2)
+        RETAINED.clear()
+
+    def tearDown(self):
+        RETAINED.resize(self.maxsize)
+        RETAINED.clear()
+
+    def test_held_values_are_not_recomputed(self):
+        calls = []
+        thunk = recompute(lambda: calls.append(None) or 5)
+
+        self.assertEqual([thunk.force(), thunk.force()], [5, 5])
+        self.assertEqual(len(calls), 1)
+
+    def test_evicted_values_are_recomputed(self):
+        calls, evictions = [], RETAINED.evictions
+        thunks = [Evictable(lambda i=i: calls.append(i) or i * 10) for i in range(3)]
+
+        self.assertEqual([t.force() for t in thunks], [0, 10, 20])
+        self.assertEqual(len(RETAINED), 2)
+        self.assertEqual(repr(thunks[0]), "Evictable(<evicted>)")
+
+        self.assertEqual(thunks[0].force(), 0)
+        self.assertEqual(calls, [0, 1, 2, 0])
+        self.assertEqual(RETAINED.evictions - evictions, 2)
+
+    def test_live_values_are_revived(self):
+        calls, revived = [], RETAINED.revived
+        thunks = [Evictable(lambda i=i: calls.append(i) or Box(i)) for i in range(3)]
+        kept = thunks[0].force()
+        thunks[1].force(), thunks[2].force()
+
+        self.assertIs(thunks[0].force(), kept)
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(RETAINED.revived - revived, 1)
+
+    def test_threads_recompute_once(self):
+        previous = threadsafe(True)
+        try:
+            calls = []
+
+            def slow():
+                calls.append(None)
+                time.sleep(0.01)
+                return Box(len(calls))
+
+            shared = Evictable(slow)
+            barrier = threading.Barrier(8, timeout=10)
+            results = []
+
+            def body():
+                barrier.wait()
+                results.append(shared.force())
+
+            threads = [threading.Thread(target=body) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            threadsafe(previous)
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIsNone(shared._lock)
+
+    def test_bounded_stream(self):
+        RETAINED.resize(50)
+        cells = []
+        head = _iterate(lambda n: n + 1, 0, Evictable)
+
+        for cell in islice(_cells(head), 5000):
+            cells.append(weakref.ref(cell))
+        gc.collect()
+
+        self.assertLessEqual(sum(cell() is not None for cell in cells), 52)
+        self.assertEqual(list(islice(head, 5000)), list(range(5000)))
+
+
+def _cells(stream):
+    while True:
+        yield stream
+        stream = stream.tail.force()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+from importlib import import_module
+
+# Typeclass protocols, imported from their packages on first use (PEP 562).
+# Operators live in `typeclass.typeclasses.symbols`.
+PROTOCOLS = {
+    "Functor": "functor",
+    "Applicative": "applicative",
+    "Alternative": "alternative",
+    "Monad": "monad",
+    "Comonad": "comonad",
+    "Semigroupoid": "semigroupoid",
+    "Category": "category",
+    "Groupoid": "groupoid",
+    "Semigroup": "semigroup",
+    "Monoid": "monoid",
+    "Group": "group",
+    "Arrow": "arrow",
+    "ArrowChoice": "arrowchoice",
+    "ArrowApply": "arrowapply",
+    "ArrowLoop": "arrowloop",
+    "Show": "show",
+    "Eq": "eq",
+    "Force": "force",
+}
+
+__all__ = list(PROTOCOLS)
+
+def __getattr__(name):
+    try:
+        package = PROTOCOLS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    globals()[name] = protocol = getattr(import_module(f"{__name__}.{package}"), name)
+    return protocol
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
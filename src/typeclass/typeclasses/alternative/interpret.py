@@ -0,0 +1,28 @@
+from typeclass.typeclasses.alternative.lib import Empty, Otherwise, Some, Many
+
+# ----- Alternative -----------------------------------------------------
+# Implements empty, otherwise, and the derived combinators some/many.
+# some/many are handed to the runtime, which decides how to repeat.
+
+def handle_empty(free, run, cofree, env):
+    return free.cls.empty()
+
+def handle_otherwise(free, run, cofree, env):
+    alter  = yield free.fa.force()
+    native = run(free.fb.force(), cofree, env)
+    return alter.otherwise(native)
+
+def handle_many(free, run, cofree, env):
+    value = run(free.v.force(), cofree, env)
+    return free.internal.many(value)
+
+def handle_some(free, run, cofree, env):
+    value = run(free.v.force(), cofree, env)
+    return free.internal.some(value)
+
+HANDLERS = {
+    Empty: handle_empty,
+    Otherwise: handle_otherwise,
+    Many: handle_many,
+    Some: handle_some,
+}
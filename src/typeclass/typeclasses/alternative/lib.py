@@ -3,7 +3,7 @@ from typing import Protocol, TypeVar, runtime_checkable, Self
 from typeclass.typeclasses.alternative import Alternative
 from typeclass.typeclasses.functor import fmap
 from typeclass.typeclasses.applicative import pure, ap
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -55,7 +55,7 @@ def otherwise(fa: Alternative, fb: Alternative) -> Alternative:
     Returns:
         Alternative: The first successful alternative.
     """
-    return Otherwise(Thunk(lambda: fa), Thunk(lambda: fb))
+    return Otherwise(Strict(fa), Strict(fb))
 
 
 def some(internal: type, v: Thunk) -> Thunk:
@@ -77,7 +77,7 @@ def some(internal: type, v: Thunk) -> Thunk:
     Returns:
         Alternative: One or more occurrences of `v`.
     """
-    return Some(internal, Thunk(lambda: v))
+    return Some(internal, Strict(v))
 
 def many(internal: type, v: Thunk) -> Thunk:
     """
@@ -98,6 +98,6 @@ def many(internal: type, v: Thunk) -> Thunk:
     Returns:
         Alternative: Zero or more occurrences of `v`.
     """
-    return Many(internal, Thunk(lambda: v))
+    return Many(internal, Strict(v))
 
 
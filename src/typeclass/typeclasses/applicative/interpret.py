@@ -0,0 +1,19 @@
+from typeclass.typeclasses.applicative.lib import Ap, Pure
+
+# ----- Applicative -----------------------------------------------------
+# Pure realizes its value before embedding it; Ap realizes the wrapped
+# function and hands the argument to the runtime lazily.
+
+def handle_pure(free, run, cofree, env):
+    value = yield free.value.force()
+    return free.cls.pure(value)
+
+def handle_ap(free, run, cofree, env):
+    function = yield free.ff.force()
+    value    = run(free.fa.force(), cofree, env)
+    return function.ap(value)
+
+HANDLERS = {
+    Pure: handle_pure,
+    Ap: handle_ap,
+}
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typeclass.typeclasses.applicative import Applicative
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Strict
 from typeclass.typeclasses.functor import fmap
 from typing import TypeVar, Protocol, Generic, Callable, Self
 
@@ -31,10 +31,10 @@ def ap(ff: Applicative[Callable[[A], B]], fa: Applicative[A]) -> Applicative[B]:
     Returns:
         An Applicative containing the result of applying the function to the value.
     """
-    return Ap(Thunk(lambda: ff), Thunk(lambda: fa))
+    return Ap(Strict(ff), Strict(fa))
 
 def pure(cls: type, value: A):
-    return Pure(cls, Thunk(lambda: value))
+    return Pure(cls, Strict(value))
 
 def liftA2(f: Callable[[A, B], C], fa: Applicative[A], fb: Applicative[B]) -> Applicative[C]:
     """
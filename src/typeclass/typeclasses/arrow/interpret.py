@@ -0,0 +1,62 @@
+from typeclass.data.thunk import delay
+from typeclass.typeclasses.semigroupoid.lib import Compose
+from typeclass.typeclasses.arrow.lib import Arr, First, Second, Split, Fanout
+from typeclass.interpret.lowering import memoized
+
+# ----- Arrow ------------------------------------------------------------
+# Core Arrow operations and derived combinators expressed in terms of
+# arr and first. Derived operations are lowered into simpler Arrow
+# expressions and reruned. Each derived node is lowered once and the
+# lowered expression is reused on later visits.
+
+def swap(pair):
+    x, y = pair
+    return (y, x)
+
+def duplicate(a):
+    return (a, a)
+
+def handle_arr(free, run, cofree, env):
+    fab = free.fab
+
+    def k(a):
+        return run(fab.force(), cofree, env).force()(a)
+    return free.cls.arrow(delay(k))
+
+def handle_first(free, run, cofree, env):
+    aab = free.aab
+
+    def k(a):
+        return run(aab.force(), cofree, env).force()(a)
+    return free.cls.first(delay(k))
+
+@memoized
+def handle_second(free, run, cofree, env):
+    cls = free.cls
+
+    arrswap = delay(Arr(cls, delay(swap)))
+    first   = delay(First(cls, free.aab))
+
+    one  = delay(Compose(first, arrswap))
+    return Compose(arrswap, one)
+
+@memoized
+def handle_split(free, run, cofree, env):
+    first_  = delay(First(free.cls, free.aab))
+    second_ = delay(Second(free.cls, free.acd))
+
+    return Compose(second_, first_)
+
+@memoized
+def handle_fanout(free, run, cofree, env):
+    arrduplicate = delay(Arr(free.cls, delay(duplicate)))
+    split = delay(Split(free.cls, free.aab, free.acd))
+    return Compose(split, arrduplicate)
+
+HANDLERS = {
+    Arr: handle_arr,
+    First: handle_first,
+    Second: handle_second,
+    Split: handle_split,
+    Fanout: handle_fanout,
+}
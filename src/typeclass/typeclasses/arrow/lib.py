@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TypeVar
 
 from typeclass.typeclasses.arrow import Arrow
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 @dataclass
 class Arr:
@@ -61,7 +61,7 @@ def arrow(cls, fab):
     Returns:
         Arrow: An arrow representing the lifted function `A -> B`.
     """
-    return Arr(cls, Thunk(lambda: fab))
+    return Arr(cls, Strict(fab))
 
 def first(cls, aab):
     """
@@ -91,7 +91,7 @@ def first(cls, aab):
     Returns:
         Arrow: An intent node representing `first aab`.
     """
-    return First(cls, Thunk(lambda: aab))
+    return First(cls, Strict(aab))
 
 def second(cls, aab):
     """
@@ -121,7 +121,7 @@ def second(cls, aab):
     Returns:
         Arrow: An intent node representing `second aab`.
     """
-    return Second(cls, Thunk(lambda: aab))
+    return Second(cls, Strict(aab))
 
 def split(aab, clsacd):
     """
@@ -153,7 +153,7 @@ def split(aab, clsacd):
         each arrow to its corresponding component.
     """
     cls, acd = clsacd
-    return Split(cls, Thunk(lambda: aab), Thunk(lambda: acd))
+    return Split(cls, Strict(aab), Strict(acd))
 
 def fanout(aab, clsaac):
     """
@@ -184,4 +184,4 @@ def fanout(aab, clsaac):
         Arrow: An arrow mapping `A` to `(B, C)` containing both results.
     """
     cls, aac = clsaac
-    return Fanout(cls, Thunk(lambda: aab), Thunk(lambda: aac))
+    return Fanout(cls, Strict(aab), Strict(aac))
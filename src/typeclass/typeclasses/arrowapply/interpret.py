@@ -0,0 +1,12 @@
+from typeclass.typeclasses.arrowapply.lib import Apply
+
+# ----- ArrowApply  -----------------------------------------------------
+# Dynamic arrow application. Allows an arrow produced at runtime to be
+# immediately applied.
+
+def handle_apply(free, run, cofree, env):
+    return free.cls.app()
+
+HANDLERS = {
+    Apply: handle_apply,
+}
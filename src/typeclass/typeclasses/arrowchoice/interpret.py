@@ -0,0 +1,63 @@
+from typeclass.data.thunk import delay
+from typeclass.data.either import Left as ELeft, Right as ERight
+from typeclass.typeclasses.semigroupoid.lib import Compose
+from typeclass.typeclasses.arrow.lib import Arr
+from typeclass.typeclasses.arrowchoice.lib import Left, Right, PlusPlus, OrOr
+from typeclass.interpret.lowering import memoized
+
+# ----- ArrowChoice  -----------------------------------------------------
+# Core ArrowChoice operation `left` and derived combinators expressed in
+# terms of left and arr. Derived operations are lowered into simpler
+# Arrow expressions and reruned. Each derived node is lowered once and the
+# lowered expression is reused on later visits.
+
+def swap(e):
+    match e:
+        case ELeft(x):
+            return ERight(x)
+        case ERight(x):
+            return ELeft(x)
+
+def merge(e):
+    match e:
+        case ELeft(b):
+            return b
+        case ERight(b):
+            return b
+
+def handle_left(free, run, cofree, env):
+    aab = free.aab
+
+    def k(a):
+        return run(aab.force(), cofree, env).force()(a)
+    return free.cls.left(delay(k))
+
+@memoized
+def handle_right(free, run, cofree, env):
+    cls = free.cls
+
+    arrswap = delay(Arr(cls, delay(swap)))
+    left_   = delay(Left(cls, free.aab))
+
+    one  = delay(Compose(left_, arrswap))
+    return Compose(arrswap, one)
+
+@memoized
+def handle_plusplus(free, run, cofree, env):
+    left_  = delay(Left(free.cls, free.aab))
+    right_ = delay(Right(free.cls, free.acd))
+    return Compose(right_, left_)
+
+@memoized
+def handle_oror(free, run, cofree, env):
+    ppg = delay(PlusPlus(free.cls, free.aab, free.acb))
+    arrmerge = delay(Arr(free.cls, delay(merge)))
+
+    return Compose(arrmerge, ppg)
+
+HANDLERS = {
+    Left: handle_left,
+    Right: handle_right,
+    PlusPlus: handle_plusplus,
+    OrOr: handle_oror,
+}
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import TypeVar
 
 from typeclass.typeclasses.arrowchoice import ArrowChoice
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -62,7 +62,7 @@ def left(cls, aab):
     Returns:
         ArrowChoice: An intent node representing `left aab`.
     """
-    return Left(cls, Thunk(lambda: aab))
+    return Left(cls, Strict(aab))
 
 def right(cls, aab):
     """
@@ -94,7 +94,7 @@ def right(cls, aab):
     Returns:
         ArrowChoice: An intent node representing `right aab`.
     """
-    return Right(cls, Thunk(lambda: aab))
+    return Right(cls, Strict(aab))
 
 
 def plusplus(aab, clsacd):
@@ -124,7 +124,7 @@ def plusplus(aab, clsacd):
         ArrowChoice: An intent node representing `aab +++ acd`.
     """
     cls, acd = clsacd
-    return PlusPlus(cls, Thunk(lambda: aab), Thunk(lambda: acd))
+    return PlusPlus(cls, Strict(aab), Strict(acd))
 
 
 def oror(aab, clsacb):
@@ -154,4 +154,4 @@ def oror(aab, clsacb):
         ArrowChoice: An intent node representing `aab ||| acb`.
     """
     cls, acb = clsacb
-    return OrOr(cls, Thunk(lambda: aab), Thunk(lambda: acb))
+    return OrOr(cls, Strict(aab), Strict(acb))
@@ -1 +1,3 @@
 from .core import ArrowLoop
+from .lib import loop
+from .lib import Loop
@@ -0,0 +1,17 @@
+from typeclass.data.thunk import delay
+from typeclass.typeclasses.arrowloop.lib import Loop
+
+# ----- ArrowLoop  -------------------------------------------------------
+# Feedback. The loop body is run lazily and the knot is tied by the
+# runtime ArrowLoop implementation.
+
+def handle_loop(free, run, cofree, env):
+    aab = free.aab
+
+    def k(a):
+        return run(aab.force(), cofree, env).force()(a)
+    return free.cls.loop(delay(k))
+
+HANDLERS = {
+    Loop: handle_loop,
+}
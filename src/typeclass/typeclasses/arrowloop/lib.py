@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import TypeVar
+
+from typeclass.typeclasses.arrowloop import ArrowLoop
+from typeclass.data.thunk import Thunk, Strict
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+
+@dataclass
+class Loop:
+    cls: type
+    aab: Thunk[ArrowLoop[tuple[A, C], tuple[B, C]]]
+
+def loop(cls, aab):
+    """
+    Tie a feedback loop on the second component of an Arrow.
+
+    Equivalent to `ArrowLoop.loop(cls, aab)`.
+
+    Given an arrow
+
+        aab : (A, C) -> (B, C)
+
+    `loop(aab)` produces an arrow
+
+        A -> B
+
+    whose `C` output is fed back as its own `C` input:
+
+        loop(aab)(a) = b
+        where (b, c) = aab(a, c)
+
+    The fed back `C` arrives as a Thunk. A body which only forces it lazily,
+    e.g. in the tail of a `Stream`, ties the knot directly; a body which
+    forces it before producing it is iterated to a fixpoint instead.
+
+    Args:
+        cls (type): ArrowLoop implementation class.
+        aab (ArrowLoop[(A, C), (B, C)]): The loop body.
+
+    Returns:
+        ArrowLoop: An intent node representing `loop aab`.
+    """
+    return Loop(cls, Strict(aab))
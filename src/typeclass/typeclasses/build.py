@@ -0,0 +1,30 @@
+"""
+Direct syntax builders.
+
+The same builders as `typeclass.typeclasses.symbols`, called as plain
+functions with the left operand first:
+
+    build.bind(build.fmap(Just(1), inc), check)  ==  (Just(1) |fmap| inc) |bind| check
+
+Building through `|op|` allocates a `Section` per operator; calling the
+builders directly does not, which matters when expressions are built in
+a hot loop. Like the symbols, builders are imported on first use.
+"""
+
+from importlib import import_module
+
+from typeclass.typeclasses.symbols import SYMBOLS
+
+__all__ = list(SYMBOLS)
+
+def __getattr__(name):
+    try:
+        package, _ = SYMBOLS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    globals()[name] = function = getattr(import_module(f"typeclass.typeclasses.{package}"), name)
+    return function
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,11 @@
+from typeclass.typeclasses.category.lib import ID
+
+# ----- Category ---------------------------------------------------------
+# Identity morphism.
+
+def handle_id(free, run, cofree, env):
+    return free.cls.id()
+
+HANDLERS = {
+    ID: handle_id,
+}
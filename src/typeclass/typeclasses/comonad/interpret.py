@@ -0,0 +1,18 @@
+from typeclass.typeclasses.comonad.lib import Extract, Duplicate
+
+# ----- Comonad ---------------------------------------------------------
+# Core Comonad operations. `extend` is derived and lowered through
+# `duplicate` and `fmap`, so only extract and duplicate are primitive.
+
+def handle_extract(free, run, cofree, env):
+    wa = yield free.wa.force()
+    return wa.extract()
+
+def handle_duplicate(free, run, cofree, env):
+    wa = yield free.wa.force()
+    return wa.duplicate()
+
+HANDLERS = {
+    Extract: handle_extract,
+    Duplicate: handle_duplicate,
+}
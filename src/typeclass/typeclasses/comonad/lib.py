@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import TypeVar
 
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 from typeclass.typeclasses.comonad import Comonad
 from typeclass.typeclasses.functor import fmap
 
@@ -30,7 +30,7 @@ def extract(wa: Comonad[A]):
     Returns:
         A syntax node representing extraction of the focused value.
     """
-    return Extract(Thunk(lambda: wa))
+    return Extract(Strict(wa))
 
 
 def duplicate(wa: Comonad[A]) -> Comonad[Comonad[A]]:
@@ -46,7 +46,7 @@ def duplicate(wa: Comonad[A]) -> Comonad[Comonad[A]]:
     Returns:
         A syntax node representing duplication of the comonadic context.
     """
-    return Duplicate(Thunk(lambda: wa))
+    return Duplicate(Strict(wa))
 
 def extend(wa: Comonad[A], f: Callable[[Comonad[A]], B]):
     """
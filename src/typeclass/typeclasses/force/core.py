@@ -22,4 +22,6 @@ class Force(Protocol[T]):
         force(self) -> T
     """
 
+    __slots__ = ()
+
     def force(self) -> T: ...
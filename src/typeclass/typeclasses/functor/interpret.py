@@ -0,0 +1,19 @@
+from typeclass.data.thunk import delay
+from typeclass.typeclasses.functor.lib import Map
+
+# ----- Functor ---------------------------------------------------------
+# Implements fmap by runing both the function and value, then
+# delegating to the runtime Functor implementation.
+
+def handle_map(free, run, cofree, env):
+    value = yield free.value.force()
+    function = run(free.func.force(), cofree, env)
+
+    def k(a):
+        return run(function.force()(a), cofree, env).force()
+
+    return value.fmap(delay(k))
+
+HANDLERS = {
+    Map: handle_map,
+}
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typeclass.typeclasses.functor import Functor
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Strict
 from typing import TypeVar, Protocol, Callable, Generic, Self
 
 A = TypeVar("A")
@@ -24,7 +24,7 @@ def fmap(functor: Functor[A], f: Callable[[A], B]) -> Functor[B]:
     Returns:
         A new functor with the function applied.
     """
-    return Map(Thunk(lambda: f), Thunk(lambda:functor))
+    return Map(Strict(f), Strict(functor))
 
 def replace(value: A, functor: Functor[B]) -> Functor[A]:
     """
@@ -0,0 +1,13 @@
+from typeclass.typeclasses.group.lib import Inverse
+
+# ----- Group ------------------------------------------------------------
+# Inversion operation for Group structures.
+
+def handle_inverse(free, run, cofree, env):
+    fab = yield free.self.force()
+
+    return fab.inverse()
+
+HANDLERS = {
+    Inverse: handle_inverse,
+}
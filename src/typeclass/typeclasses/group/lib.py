@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from typeclass.typeclasses.group import Group
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 @dataclass
 class Inverse:
@@ -37,4 +37,4 @@ def inverse(self: Group):
     Returns:
         Group: The inverse of `a` under `combine`.
     """
-    return Inverse(Thunk(lambda: self))
+    return Inverse(Strict(self))
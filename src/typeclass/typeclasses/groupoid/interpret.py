@@ -0,0 +1,12 @@
+from typeclass.typeclasses.groupoid.lib import Invert
+
+# ----- Groupoid ---------------------------------------------------------
+# Inversion of a morphism.
+
+def handle_invert(free, run, cofree, env):
+    fab = yield free.self.force()
+    return fab.invert()
+
+HANDLERS = {
+    Invert: handle_invert,
+}
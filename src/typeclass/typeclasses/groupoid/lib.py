@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import TypeVar
 
 from typeclass.typeclasses.groupoid import Groupoid
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 @dataclass
 class Invert:
@@ -42,4 +42,4 @@ def invert(self: Groupid):
     Returns:
         Groupoid: The inverse morphism from B to A.
     """
-    return Invert(Thunk(lambda: self))
+    return Invert(Strict(self))
@@ -2,12 +2,29 @@ class Infix:
     """
     Enables infix-style function application using `|op|` syntax.
     """
+    __slots__ = ("func",)
+
     def __init__(self, func):
         self.func = func
 
     def __ror__(self, left):
-        return Infix(lambda right: self.func(left, right))
+        return Section(self.func, left)
 
     def __or__(self, right):
         return self.func(right)
 
+class Section:
+    """
+    `left |op`, waiting for its right operand.
+
+    Holds the function and left operand directly instead of closing over
+    them, so each `|op|` costs one small object and no closure.
+    """
+    __slots__ = ("func", "left")
+
+    def __init__(self, func, left):
+        self.func = func
+        self.left = left
+
+    def __or__(self, right):
+        return self.func(self.left, right)
@@ -0,0 +1,95 @@
+from typeclass.data.thunk import delay
+from typeclass.typeclasses.monad.lib import Return, Bind
+
+# ----- Monad -----------------------------------------------------------
+# Return embeds a realized value; Bind realizes the monadic value and
+# passes the runtime a continuation which interprets whatever `f` builds.
+
+def handle_return(free, run, cofree, env):
+    value = yield free.value.force()
+    return free.cls.pure(value)
+
+def handle_bind(free, run, cofree, env):
+    ma = yield free.ma.force()
+    f = run(free.f.force(), cofree, env)
+
+    def k(a):
+        return run(f.force()(a), cofree, env).force()
+
+    # A runtime such as `Maybe` or `Either` returns the continuation's
+    # result as its own. Binding first with a `Probe` detects this, and the
+    # syntax `f` builds is then returned to the trampoline, which normalizes
+    # it as a tail call: a right-nested chain `m >>= \x -> (m' >>= ...)`
+    # runs in constant stack. A runtime which does anything else with the
+    # result is bound again with `k`.
+    probe = Probe(k)
+    try:
+        value = ma.bind(delay(probe))
+    except (Exception, Escape):
+        if not probe.calls:
+            raise
+        value = None
+    finally:
+        probe.probing = False
+
+    if probe.calls == 0:
+        return value
+    if probe.calls == 1 and value is TAIL:
+        return f.force()(probe.argument)
+    return ma.bind(delay(k))
+
+class Escape(BaseException):
+    """
+    Raised when a runtime looks into `TAIL`, ending the probe.
+    """
+
+class Tail:
+    """
+    The result a `Probe` hands the runtime in place of the continuation's.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        raise Escape
+
+    def __bool__(self):
+        raise Escape
+
+    def __iter__(self):
+        raise Escape
+
+    def __eq__(self, other):
+        raise Escape
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return "TAIL"
+
+TAIL = Tail()
+
+class Probe:
+    """
+    A continuation which, while `probing`, records its argument and returns
+    `TAIL`, and afterwards behaves as `k`, so a runtime holding on to it,
+    as `State` or `Parser` do, still gets the real continuation.
+    """
+    __slots__ = ("k", "probing", "calls", "argument")
+
+    def __init__(self, k):
+        self.k = k
+        self.probing = True
+        self.calls = 0
+        self.argument = None
+
+    def __call__(self, a):
+        if not self.probing:
+            return self.k(a)
+        self.calls += 1
+        self.argument = a
+        return TAIL
+
+HANDLERS = {
+    Return: handle_return,
+    Bind: handle_bind,
+}
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import TypeVar, Callable
 
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 from typeclass.typeclasses.monad import Monad
 
 A = TypeVar("A")
@@ -31,7 +31,7 @@ def return_(cls: type, value: A) -> Monad[A]:
     Returns:
         A Monad containing the provided value.
     """
-    return Return(cls, Thunk(lambda: value))
+    return Return(cls, Strict(value))
 
 def bind(ma: Monad[A], f: Callable[[A],Monad[B]]) -> Monad[B]:
     """
@@ -48,7 +48,7 @@ def bind(ma: Monad[A], f: Callable[[A],Monad[B]]) -> Monad[B]:
         A Monad representing the result of applying the function to the unwrapped value
         and flattening the resulting monadic structure.
     """
-    return Bind(Thunk(lambda: ma), Thunk(lambda: f))
+    return Bind(Strict(ma), Strict(f))
 
 def mthen(ma: Monad[A], mb: Monad[B]) -> Monad[B]:
     """
@@ -0,0 +1,11 @@
+from typeclass.typeclasses.monoid.lib import MEmpty
+
+# ----- Monoid -----------------------------------------------------------
+# Identity element for a Semigroup.
+
+def handle_mempty(free, run, cofree, env):
+    return free.cls.mempty()
+
+HANDLERS = {
+    MEmpty: handle_mempty,
+}
@@ -0,0 +1,14 @@
+from typeclass.typeclasses.semigroup.lib import Combine
+
+# ----- Semigroup --------------------------------------------------------
+# Binary associative combination.
+
+def handle_combine(free, run, cofree, env):
+    a = yield free.a.force()
+    b = run(free.b.force(), cofree, env)
+
+    return a.combine(b)
+
+HANDLERS = {
+    Combine: handle_combine,
+}
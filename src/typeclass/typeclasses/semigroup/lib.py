@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from typeclass.typeclasses.semigroup import Semigroup
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 @dataclass
 class Combine:
@@ -34,4 +34,4 @@ def combine(a: Semigroup, b: Semigroup):
     Returns:
         Semigroup: The combined semigroup value.
     """
-    return Combine(Thunk(lambda: a), Thunk(lambda: b))
+    return Combine(Strict(a), Strict(b))
@@ -0,0 +1,18 @@
+from typeclass.data.thunk import delay
+from typeclass.typeclasses.semigroupoid.lib import Compose
+
+# ----- Semigroupoid -----------------------------------------------------
+# Sequential composition of morphisms.
+
+def handle_compose(free, run, cofree, env):
+    fbc = yield free.fbc.force()
+    fab = run(free.fab.force(), cofree, env)
+
+    def k(a):
+        return run(fab.force()(a), cofree, env).force()
+
+    return fbc.compose(delay(k))
+
+HANDLERS = {
+    Compose: handle_compose,
+}
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Protocol, TypeVar, runtime_checkable, Self
 
 from typeclass.typeclasses.semigroupoid import Semigroupoid
-from typeclass.data.thunk import Thunk
+from typeclass.data.thunk import Thunk, Strict
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -36,7 +36,7 @@ def compose(fbc: Semigroupoid, fab: Semigroupoid):
     Returns:
         Semigroupoid: The composed morphism from A to C.
     """
-    return Compose(Thunk(lambda: fbc), Thunk(lambda: fab))
+    return Compose(Strict(fbc), Strict(fab))
 
 def rcompose(fab: Semigroupoid, fbc: Semigroupoid):
     """
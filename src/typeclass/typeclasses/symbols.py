@@ -1,44 +1,64 @@
+from importlib import import_module
+
 from typeclass.typeclasses.infix import Infix
-from typeclass.typeclasses.functor import fmap, replace, void
-from typeclass.typeclasses.applicative import ap, pure, then, skip, liftA2
-from typeclass.typeclasses.alternative import otherwise, empty, some, many
-from typeclass.typeclasses.monad import bind, return_, mthen, join, rbind, kleisli, rkleisli
-from typeclass.typeclasses.comonad import extract, duplicate, extend
-from typeclass.typeclasses.semigroupoid import compose, rcompose
-from typeclass.typeclasses.category import identity
-from typeclass.typeclasses.groupoid import invert
-from typeclass.typeclasses.semigroup import combine
-from typeclass.typeclasses.monoid import mempty
-from typeclass.typeclasses.group import inverse
-from typeclass.typeclasses.arrow import arrow, first, second, split, fanout
-from typeclass.typeclasses.arrowchoice import left, right, plusplus, oror
-from typeclass.typeclasses.arrowapply import apply
 
-fmap    = Infix(fmap)
-replace = Infix(replace)
-ap   = Infix(ap)
-pure = Infix(pure)
-then = Infix(then)
-skip = Infix(skip)
-otherwise = Infix(otherwise)
-some = Infix(some)
-many = Infix(many)
-bind = Infix(bind)
-return_ = Infix(return_)
-mthen = Infix(mthen)
-rbind = Infix(rbind)
-kleisli = Infix(kleisli)
-rkleisli = Infix(rkleisli)
-compose = Infix(compose)
-rcompose = Infix(rcompose)
-combine = Infix(combine)
-arrow = Infix(arrow)
-first = Infix(first)
-second = Infix(second)
-split = Infix(split)
-fanout = Infix(fanout)
-left = Infix(left)
-right = Infix(right)
-plusplus = Infix(plusplus)
-oror = Infix(oror)
-extend = Infix(extend)
+# Symbols are built on first use (PEP 562), so importing one operator only
+# imports the typeclass package defining it. Each entry maps a symbol to
+# its package and whether it is an infix operator or a plain function.
+SYMBOLS = {
+    "fmap":      ("functor", True),
+    "replace":   ("functor", True),
+    "void":      ("functor", False),
+    "ap":        ("applicative", True),
+    "pure":      ("applicative", True),
+    "then":      ("applicative", True),
+    "skip":      ("applicative", True),
+    "liftA2":    ("applicative", False),
+    "otherwise": ("alternative", True),
+    "empty":     ("alternative", False),
+    "some":      ("alternative", True),
+    "many":      ("alternative", True),
+    "bind":      ("monad", True),
+    "return_":   ("monad", True),
+    "mthen":     ("monad", True),
+    "join":      ("monad", False),
+    "rbind":     ("monad", True),
+    "kleisli":   ("monad", True),
+    "rkleisli":  ("monad", True),
+    "extract":   ("comonad", False),
+    "duplicate": ("comonad", False),
+    "extend":    ("comonad", True),
+    "compose":   ("semigroupoid", True),
+    "rcompose":  ("semigroupoid", True),
+    "identity":  ("category", False),
+    "invert":    ("groupoid", False),
+    "combine":   ("semigroup", True),
+    "mempty":    ("monoid", False),
+    "inverse":   ("group", False),
+    "arrow":     ("arrow", True),
+    "first":     ("arrow", True),
+    "second":    ("arrow", True),
+    "split":     ("arrow", True),
+    "fanout":    ("arrow", True),
+    "left":      ("arrowchoice", True),
+    "right":     ("arrowchoice", True),
+    "plusplus":  ("arrowchoice", True),
+    "oror":      ("arrowchoice", True),
+    "apply":     ("arrowapply", False),
+    "loop":      ("arrowloop", True),
+}
+
+__all__ = ["Infix", *SYMBOLS]
+
+def __getattr__(name):
+    try:
+        package, infix = SYMBOLS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    function = getattr(import_module(f"typeclass.typeclasses.{package}"), name)
+    globals()[name] = symbol = Infix(function) if infix else function
+    return symbol
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))